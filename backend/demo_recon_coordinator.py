@@ -17,6 +17,7 @@ Usage:
     python demo_recon_coordinator.py scanme.nmap.org
 """
 
+import asyncio
 import os
 import sys
 from datetime import datetime
@@ -26,7 +27,6 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from agents.recon_coordinator import create_recon_coordinator
 from agents.backends.nexus_backend import NexusBackend
-from agents.context import set_agent_context
 from config.nexus_config import get_nexus_fs
 
 
@@ -74,15 +74,12 @@ def main():
     backend = NexusBackend(scan_id, team_id, nexus_fs)
     print("✅ Nexus workspace ready\n")
 
-    # Set agent context (for tools to access scan_id/team_id/backend)
-    set_agent_context(scan_id, team_id, backend)
-
     # Create Recon Coordinator
     print("🤖 Creating Recon Coordinator with DeepAgents...")
     coordinator = create_recon_coordinator(scan_id, team_id, backend)
     print("✅ Coordinator ready")
-    print("   - Model: Claude 3.5 Sonnet (via OpenRouter)")
-    print("   - Sub-agents: Subfinder, HTTPx, Nmap")
+    print("   - Models: GPT-4o-mini (routing), Claude Sonnet 4 (report) via OpenRouter")
+    print("   - Sub-agents: Subfinder, HTTPx, Nmap, ffuf, wafw00f, report")
     print("   - Backend: Nexus/GCS\n")
 
     # Execute reconnaissance
@@ -98,12 +95,13 @@ def main():
     print("-" * 80)
 
     try:
-        result = coordinator.invoke({
+        # The recon tools are async-only, so the graph has to run on an event loop
+        result = asyncio.run(coordinator.ainvoke({
             "messages": [{
                 "role": "user",
                 "content": f"Perform complete reconnaissance on {domain}. Use your sub-agents intelligently and generate a comprehensive security report."
             }]
-        })
+        }, config={"configurable": {"thread_id": scan_id}}))  # tools resolve their workspace from thread_id
 
         print("\n" + "-" * 80)
         print("\n✅ Reconnaissance Complete!\n")
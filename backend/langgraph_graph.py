@@ -1,8 +1,10 @@
 """
 LangGraph graph factory for Recon Coordinator.
 
-This module provides a LangGraph Studio compatible entry point
-for the Recon Coordinator agent.
+This module provides LangGraph Studio compatible entry points for the
+Recon Coordinator agent (`agent`) and the deterministic recon pipeline
+(`pipeline`), which runs the same stages in a fixed order with wafw00f,
+ffuf and nmap in parallel.
 
 Following Syntar's pattern: Build graph ONCE at module load time for fast schema access.
 """
@@ -22,8 +24,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from langchain_openai import ChatOpenAI
 
-from agents.backends.nexus_backend import NexusBackend
-from agents.recon_coordinator import create_recon_coordinator  # DeepAgents version!
+from agents.recon_coordinator import (  # DeepAgents version!
+    create_recon_coordinator,
+    create_recon_pipeline,
+)
 from config.nexus_config import get_nexus_fs
 
 # Configure logging
@@ -62,80 +66,24 @@ model = ChatOpenAI(
 )
 logger.info("✅ Model created")
 
-# Create wrapper that creates per-thread backend
+# Recon tools extract thread_id from the RunnableConfig and create their own
+# per-thread backend, so the graph needs no scan-specific wiring here
 logger.info("🔨 Creating Recon Coordinator with DeepAgents (per-thread isolation)...")
 
-# For per-thread isolation, we need to monkey-patch the tool execution
-# to dynamically set up the backend based on thread_id from config
-from agents.context import set_agent_context
-
-# Create a global hook that sets up backend before each tool call
-original_context_get = None
-
-def setup_dynamic_context():
-    """Setup dynamic context extraction from LangGraph runtime"""
-    import contextvars
-    from langchain_core.runnables.config import var_child_runnable_config
-
-    global original_context_get
-
-    def get_dynamic_backend():
-        """Extract thread_id from LangGraph context and create backend"""
-        try:
-            # Try to get config from LangChain context
-            config = var_child_runnable_config.get()
-            if config:
-                thread_id = config.get("configurable", {}).get("thread_id")
-                if thread_id and thread_id != "placeholder":
-                    # Create backend for this thread
-                    backend = NexusBackend(thread_id, DEFAULT_TEAM_ID, nexus_fs)
-                    set_agent_context(thread_id, DEFAULT_TEAM_ID, backend)
-                    logger.info(f"🔧 Dynamic backend: thread={thread_id[:12]}...")
-                    return True
-        except Exception as e:
-            logger.debug(f"Could not extract thread_id from context: {e}")
-
-        return False
-
-    return get_dynamic_backend
-
-# Setup dynamic context
-dynamic_backend_getter = setup_dynamic_context()
-
 try:
-    if nexus_fs:
-        # Create coordinator with placeholder - context will be set dynamically
-        agent = create_recon_coordinator(
-            scan_id="placeholder",
-            team_id=DEFAULT_TEAM_ID,
-            backend=None,
-            model=model
-        )
-
-        # Patch the graph to setup backend before execution
-        original_invoke = agent.invoke
-
-        def invoke_with_dynamic_backend(input_data, config=None):
-            # Extract thread_id and setup backend
-            config = config or {}
-            thread_id = config.get("configurable", {}).get("thread_id", "default-thread")
-
-            # Create backend for this thread
-            backend = NexusBackend(thread_id, DEFAULT_TEAM_ID, nexus_fs)
-            set_agent_context(thread_id, DEFAULT_TEAM_ID, backend)
-
-            logger.info(f"🔧 Thread: {thread_id[:12]}... → gs://bucket/{DEFAULT_TEAM_ID}/{thread_id}/")
-
-            # Call original invoke
-            return original_invoke(input_data, config)
-
-        agent.invoke = invoke_with_dynamic_backend
-
-        logger.info("✅ Graph created with per-thread backend isolation")
-    else:
-        # Fallback: create without backend (will fail at runtime but schema loads fast)
-        logger.warning("⚠️  Creating graph without backend - runtime execution may fail")
-        agent = create_recon_coordinator("placeholder", DEFAULT_TEAM_ID, None, model)
+    if not nexus_fs:
+        logger.warning("⚠️  NexusFS unavailable - runtime execution may fail")
+    agent = create_recon_coordinator(
+        scan_id="placeholder",
+        team_id=DEFAULT_TEAM_ID,
+        backend=None,
+        model=model
+    )
+    logger.info("✅ Graph created with per-thread backend isolation")
+
+    # Same tools and per-thread workspace, no LLM routing between stages
+    pipeline = create_recon_pipeline()
+    logger.info("✅ Recon pipeline created (parallel wafw00f/ffuf/nmap)")
 except Exception as e:
     logger.error(f"❌ Failed to create graph: {e}", exc_info=True)
     raise
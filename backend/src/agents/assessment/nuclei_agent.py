@@ -13,12 +13,13 @@ Reference:
 import json
 import logging
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from enum import Enum
 
 from e2b import Sandbox
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
+from src.agents.assessment.serialization import dump_models
 from src.agents.backends.nexus_backend import NexusBackend
 
 logger = logging.getLogger(__name__)
@@ -35,6 +36,9 @@ class SeverityLevel(str, Enum):
 
 class NucleiFinding(BaseModel):
     """Pydantic model for Nuclei vulnerability finding."""
+
+    model_config = ConfigDict(frozen=True)
+
     template_id: str
     template_name: str
     severity: str
@@ -109,6 +113,7 @@ class NucleiAgent:
         self.scan_id = scan_id
         self.team_id = team_id
         self.backend = nexus_backend
+        self.pending_writes: Dict[str, str] = {}
 
         # Initialize E2B sandbox with security tools template
         # Template ID: dbe6pq4es6hqj31ybd38 (threatweaver-security)
@@ -122,11 +127,12 @@ class NucleiAgent:
     def execute(
         self,
         targets: List[str],
-        severity_filter: Optional[List[str]] = None,
+        severity_filter: Optional[Sequence[str]] = None,
         templates: Optional[List[str]] = None,
         rate_limit: int = 150,
         timeout: int = 1800,
         update_templates: bool = True,
+        defer_write: bool = False,
     ) -> List[NucleiFinding]:
         """
         Scan targets for vulnerabilities using Nuclei templates.
@@ -138,6 +144,8 @@ class NucleiAgent:
             rate_limit: Requests per second (default: 150)
             timeout: Execution timeout in seconds (default: 30 minutes)
             update_templates: Auto-update templates before scan (default: True)
+            defer_write: Keep result files in pending_writes instead of writing
+                them, so the caller can batch them with other tools (default: False)
 
         Returns:
             List of NucleiFinding objects
@@ -193,7 +201,7 @@ class NucleiAgent:
             findings = self._parse_jsonl_output(jsonl_output, severity_filter)
 
             # Store results in Nexus workspace
-            self._store_results(targets, findings, jsonl_output, severity_filter)
+            self._store_results(targets, findings, jsonl_output, severity_filter, defer_write)
 
             logger.info(
                 f"Found {len(findings)} vulnerabilities "
@@ -223,7 +231,7 @@ class NucleiAgent:
 
     def _run_nuclei(
         self,
-        severity_filter: List[str],
+        severity_filter: Sequence[str],
         templates: Optional[List[str]],
         rate_limit: int,
         timeout: int,
@@ -290,7 +298,7 @@ class NucleiAgent:
     def _parse_jsonl_output(
         self,
         jsonl_output: str,
-        severity_filter: List[str]
+        severity_filter: Sequence[str]
     ) -> List[NucleiFinding]:
         """
         Parse Nuclei JSONL output into structured findings.
@@ -302,6 +310,8 @@ class NucleiAgent:
         if not jsonl_output.strip():
             return findings
 
+        allowed_severities = {s.lower() for s in severity_filter}
+
         for line in jsonl_output.strip().split('\n'):
             line = line.strip()
             if not line:
@@ -332,7 +342,7 @@ class NucleiAgent:
                 )
 
                 # Filter by severity
-                if finding.severity.lower() in [s.lower() for s in severity_filter]:
+                if finding.severity.lower() in allowed_severities:
                     findings.append(finding)
 
             except json.JSONDecodeError as e:
@@ -349,13 +359,14 @@ class NucleiAgent:
         targets: List[str],
         findings: List[NucleiFinding],
         raw_output: str,
-        severity_filter: List[str],
+        severity_filter: Sequence[str],
+        defer_write: bool = False,
     ) -> None:
         """Store results in Nexus workspace."""
         timestamp = datetime.now().isoformat()
 
         # Convert findings to dict for JSON serialization
-        findings_dict = [finding.model_dump() for finding in findings]
+        findings_dict = dump_models(findings)
 
         # Group findings by severity
         severity_counts = {}
@@ -381,6 +392,14 @@ class NucleiAgent:
 
         results_json = json.dumps(results_data, indent=2)
 
+        if defer_write:
+            # The caller writes these together with other tools' results
+            self.pending_writes = {
+                "/assessment/nuclei/findings.json": results_json,
+                "/assessment/nuclei/raw_output.jsonl": raw_output,
+            }
+            return
+
         # Write JSON results
         json_path = "/assessment/nuclei/findings.json"
         write_result = self.backend.write(json_path, results_json)
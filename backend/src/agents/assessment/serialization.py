@@ -0,0 +1,63 @@
+"""
+Specialized dict dumpers for flat finding models.
+
+Finding schemas are fixed at import time, so instead of going through
+Pydantic's generic model_dump() for every finding we generate a
+straight-line function per model class that reads each field directly:
+
+    def dump(o):
+        return {"template_id": o.template_id, "severity": o.severity, ...}
+
+Only flat models (no nested BaseModel fields) are specialized; anything else
+falls back to model_dump(). Container fields (lists, dicts) are returned by
+reference rather than copied, which is fine for serializing straight to JSON.
+"""
+
+import typing
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List
+
+from pydantic import BaseModel
+
+
+def _contains_model(annotation: Any) -> bool:
+    """Check whether a field annotation refers to a BaseModel anywhere."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_contains_model(arg) for arg in typing.get_args(annotation))
+
+
+def build_dumper(model_cls: type[BaseModel]) -> Callable[[BaseModel], Dict[str, Any]]:
+    """
+    Generate a dumper equivalent to model_dump() for a flat model class.
+
+    Args:
+        model_cls: Pydantic model class to specialize for
+
+    Returns:
+        Function mapping an instance to a dict of its fields
+    """
+    fields = model_cls.model_fields
+    if any(_contains_model(field.annotation) for field in fields.values()):
+        return model_cls.model_dump
+
+    items = ", ".join(f"{name!r}: o.{name}" for name in fields)
+    source = f"def dump(o):\n    return {{{items}}}\n"
+
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<dumper {model_cls.__qualname__}>", "exec"), namespace)
+    return namespace["dump"]
+
+
+@lru_cache(maxsize=None)
+def get_dumper(model_cls: type[BaseModel]) -> Callable[[BaseModel], Dict[str, Any]]:
+    """Get the (cached) specialized dumper for a model class."""
+    return build_dumper(model_cls)
+
+
+def dump_models(models: Iterable[BaseModel]) -> List[Dict[str, Any]]:
+    """Dump a homogeneous sequence of models to dicts."""
+    models = list(models)
+    if not models:
+        return []
+    return list(map(get_dumper(type(models[0])), models))
@@ -18,8 +18,9 @@ from typing import List, Optional, Dict, Any
 from enum import Enum
 
 from e2b import Sandbox
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
+from src.agents.assessment.serialization import dump_models
 from src.agents.backends.nexus_backend import NexusBackend
 
 logger = logging.getLogger(__name__)
@@ -53,6 +54,9 @@ class InjectionType(str, Enum):
 
 class SQLMapFinding(BaseModel):
     """Pydantic model for SQLMap injection finding."""
+
+    model_config = ConfigDict(frozen=True)
+
     target_url: str
     parameter: str
     injection_type: str
@@ -134,6 +138,7 @@ class SQLMapAgent:
         self.scan_id = scan_id
         self.team_id = team_id
         self.backend = nexus_backend
+        self.pending_writes: Dict[str, str] = {}
 
         # Initialize E2B sandbox with security tools template
         if sandbox is None:
@@ -155,6 +160,7 @@ class SQLMapAgent:
         enumerate_tables: bool = False,
         batch: bool = True,
         tamper: Optional[List[str]] = None,
+        defer_write: bool = False,
     ) -> List[SQLMapFinding]:
         """
         Test target URL for SQL injection vulnerabilities.
@@ -170,6 +176,8 @@ class SQLMapAgent:
             enumerate_tables: Enumerate tables (requires HITL approval in production)
             batch: Run in batch mode (non-interactive)
             tamper: List of tamper scripts for WAF bypass
+            defer_write: Keep result files in pending_writes instead of writing
+                them, so the caller can batch them with other tools (default: False)
 
         Returns:
             List of SQLMapFinding objects
@@ -220,7 +228,7 @@ class SQLMapAgent:
             findings = self._parse_output(target_url, raw_output)
 
             # Store results in Nexus workspace
-            self._store_results(target_url, findings, raw_output, level, risk)
+            self._store_results(target_url, findings, raw_output, level, risk, defer_write)
 
             logger.info(
                 f"Found {len(findings)} SQL injection points in {target_url}"
@@ -423,12 +431,13 @@ class SQLMapAgent:
         raw_output: str,
         level: int,
         risk: int,
+        defer_write: bool = False,
     ) -> None:
         """Store results in Nexus workspace."""
         timestamp = datetime.now().isoformat()
 
         # Convert findings to dict
-        findings_dict = [finding.model_dump() for finding in findings]
+        findings_dict = dump_models(findings)
 
         # Create result summary
         results_data = {
@@ -447,6 +456,14 @@ class SQLMapAgent:
 
         results_json = json.dumps(results_data, indent=2)
 
+        if defer_write:
+            # The caller writes these together with other tools' results
+            self.pending_writes = {
+                "/assessment/sqlmap/findings.json": results_json,
+                "/assessment/sqlmap/raw_output.txt": raw_output,
+            }
+            return
+
         # Write JSON results
         json_path = "/assessment/sqlmap/findings.json"
         write_result = self.backend.write(json_path, results_json)
@@ -18,9 +18,10 @@ from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from e2b import Sandbox
 
+from src.agents.assessment.serialization import dump_models, get_dumper
 from src.agents.backends.nexus_backend import NexusBackend
 
 logger = logging.getLogger(__name__)
@@ -43,6 +44,9 @@ class TestsslError(Exception):
 
 class TLSVulnerability(BaseModel):
     """Represents a TLS/SSL vulnerability finding."""
+
+    model_config = ConfigDict(frozen=True)
+
     id: str                                   # Vulnerability identifier (e.g., "heartbleed")
     name: str                                 # Human-readable name
     severity: str                             # critical, high, medium, low, info, ok
@@ -153,6 +157,7 @@ class TestsslAgent:
         self.scan_id = scan_id
         self.team_id = team_id
         self.backend = nexus_backend
+        self.pending_writes: Dict[str, str] = {}
 
         # Initialize E2B sandbox with security tools template
         if sandbox is None:
@@ -171,6 +176,7 @@ class TestsslAgent:
         check_ciphers: bool = True,
         check_certificate: bool = True,
         timeout: int = 600,
+        defer_write: bool = False,
     ) -> TLSFinding:
         """
         Test TLS/SSL security configuration of a target.
@@ -183,6 +189,8 @@ class TestsslAgent:
             check_ciphers: Analyze cipher suites (default: True)
             check_certificate: Validate certificate (default: True)
             timeout: Execution timeout in seconds (default: 600)
+            defer_write: Keep result files in pending_writes instead of writing
+                them, so the caller can batch them with other tools (default: False)
 
         Returns:
             TLSFinding with complete analysis results
@@ -217,7 +225,7 @@ class TestsslAgent:
             finding = self._parse_output(raw_output, host, port)
 
             # Store results in Nexus workspace
-            self._store_results(host, port, finding, raw_output)
+            self._store_results(host, port, finding, raw_output, defer_write)
 
             vuln_count = len([v for v in finding.vulnerabilities if v.severity in ["critical", "high"]])
             logger.info(f"TLS test completed for {host}:{port} - Rating: {finding.overall_rating}, High+ vulns: {vuln_count}")
@@ -468,7 +476,8 @@ class TestsslAgent:
         host: str,
         port: int,
         finding: TLSFinding,
-        raw_output: str
+        raw_output: str,
+        defer_write: bool = False,
     ) -> None:
         """Store results in Nexus workspace."""
         timestamp = datetime.now(timezone.utc).isoformat()
@@ -483,9 +492,9 @@ class TestsslAgent:
             "target": f"{host}:{port}",
             "overall_rating": finding.overall_rating,
             "protocols": finding.protocols,
-            "certificate": finding.certificate.model_dump() if finding.certificate else None,
+            "certificate": get_dumper(CertificateInfo)(finding.certificate) if finding.certificate else None,
             "vulnerability_summary": vuln_summary,
-            "vulnerabilities": [v.model_dump() for v in finding.vulnerabilities],
+            "vulnerabilities": dump_models(finding.vulnerabilities),
             "timestamp": timestamp,
             "scan_id": self.scan_id,
             "team_id": self.team_id,
@@ -494,6 +503,14 @@ class TestsslAgent:
 
         results_json = json.dumps(results_data, indent=2)
 
+        if defer_write:
+            # The caller writes these together with other tools' results
+            self.pending_writes = {
+                "/assessment/testssl/findings.json": results_json,
+                "/assessment/testssl/raw_output.json": raw_output[:50000],
+            }
+            return
+
         # Write results
         json_path = "/assessment/testssl/findings.json"
         write_result = self.backend.write(json_path, results_json)
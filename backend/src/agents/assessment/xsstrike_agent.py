@@ -15,12 +15,13 @@ import json
 import logging
 import re
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 from enum import Enum
 
 from pydantic import BaseModel
 from e2b import Sandbox
 
+from src.agents.assessment.serialization import dump_models
 from src.agents.backends.nexus_backend import NexusBackend
 
 logger = logging.getLogger(__name__)
@@ -104,6 +105,7 @@ class XSStrikeAgent:
         self.scan_id = scan_id
         self.team_id = team_id
         self.backend = nexus_backend
+        self.pending_writes: Dict[str, str] = {}
 
         # Initialize E2B sandbox with security tools template
         if sandbox is None:
@@ -122,6 +124,7 @@ class XSStrikeAgent:
         blind_xss: bool = False,
         skip_dom: bool = False,
         timeout: int = 600,
+        defer_write: bool = False,
     ) -> List[XSSFinding]:
         """
         Test a URL for XSS vulnerabilities.
@@ -134,6 +137,8 @@ class XSStrikeAgent:
             blind_xss: Test for blind XSS (default: False)
             skip_dom: Skip DOM-based XSS testing (default: False)
             timeout: Execution timeout in seconds (default: 600)
+            defer_write: Keep result files in pending_writes instead of writing
+                them, so the caller can batch them with other tools (default: False)
 
         Returns:
             List of XSSFinding objects for vulnerabilities found
@@ -170,7 +175,7 @@ class XSStrikeAgent:
             findings = self._parse_output(raw_output, target_url)
 
             # Store results in Nexus workspace
-            self._store_results(target_url, findings, raw_output)
+            self._store_results(target_url, findings, raw_output, defer_write)
 
             vuln_count = sum(1 for f in findings if f.vulnerable)
             logger.info(f"XSStrike found {vuln_count} XSS vulnerabilities in {target_url}")
@@ -346,7 +351,8 @@ class XSStrikeAgent:
         self,
         target_url: str,
         findings: List[XSSFinding],
-        raw_output: str
+        raw_output: str,
+        defer_write: bool = False,
     ) -> None:
         """Store results in Nexus workspace."""
         timestamp = datetime.now(timezone.utc).isoformat()
@@ -363,7 +369,7 @@ class XSStrikeAgent:
             "target_url": target_url,
             "vulnerable_count": vuln_count,
             "xss_types": xss_types,
-            "findings": [f.model_dump() for f in findings],
+            "findings": dump_models(findings),
             "timestamp": timestamp,
             "scan_id": self.scan_id,
             "team_id": self.team_id,
@@ -372,6 +378,14 @@ class XSStrikeAgent:
 
         results_json = json.dumps(results_data, indent=2)
 
+        if defer_write:
+            # The caller writes these together with other tools' results
+            self.pending_writes = {
+                "/assessment/xsstrike/findings.json": results_json,
+                "/assessment/xsstrike/raw_output.txt": raw_output,
+            }
+            return
+
         # Write results
         json_path = "/assessment/xsstrike/findings.json"
         write_result = self.backend.write(json_path, results_json)
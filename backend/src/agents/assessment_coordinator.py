@@ -36,7 +36,14 @@ from langchain_openai import ChatOpenAI
 from langchain_core.tools import tool
 
 from src.agents.backends.nexus_backend import NexusBackend
-from src.agents.tools.assessment_tools import run_nuclei, run_sqlmap, run_xsstrike, run_testssl
+from src.agents.tools.assessment_tools import (
+    run_assessment_suite,
+    run_nuclei,
+    run_sqlmap,
+    run_xsstrike,
+    run_testssl,
+)
+from src.config.settings import load_env
 
 logger = logging.getLogger(__name__)
 
@@ -348,6 +355,7 @@ def create_assessment_coordinator(
     """
     if model is None:
         import os
+        load_env()
         model = ChatOpenAI(
             model="anthropic/claude-sonnet-4",
             api_key=os.getenv("OPENROUTER_API_KEY"),
@@ -376,6 +384,8 @@ You can spawn specialized sub-agents using the task() tool:
 
 **Available Tools:**
 - request_approval: Request HITL approval for sensitive operations
+- run_assessment_suite: Run Nuclei, XSStrike and testssl on targets concurrently
+  (fast first pass that replaces steps 1, 2 and 4 for simple target lists)
 - read/write: Access workspace files
 
 **Assessment Workflow:**
@@ -476,13 +486,13 @@ Be thorough, methodical, and security-focused. Your assessment helps protect sys
         create_testssl_subagent(tools)
     ]
 
-    # Coordinator has access to request_approval tool directly
-    # plus the backend read/write capabilities from create_deep_agent
+    # Coordinator has access to request_approval and the concurrent suite
+    # directly, plus the backend read/write capabilities from create_deep_agent
     return create_deep_agent(
         model=model,
         backend=backend,
         system_prompt=system_prompt,
-        tools=[request_approval],
+        tools=[request_approval, run_assessment_suite],
         subagents=sub_agents
     )
 
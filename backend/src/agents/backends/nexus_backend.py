@@ -146,6 +146,35 @@ class NexusBackend(BackendProtocol):
                 files_update=None,
             )
 
+    def write_batch(self, files: dict[str, str]) -> list[WriteResult]:
+        """
+        Write several files in one atomic Nexus batch.
+
+        Unlike write(), existing files are overwritten: this is for tools
+        storing their latest results, not for agents creating new files.
+
+        Args:
+            files: Mapping of file path to content
+
+        Returns:
+            One WriteResult per file, in the mapping's order
+        """
+        nexus_files = [
+            (self._to_nexus_path(file_path), content.encode("utf-8"))
+            for file_path, content in files.items()
+        ]
+
+        try:
+            # Parent directories are created by Nexus as part of the batch
+            self.nx.write_batch(nexus_files)
+        except Exception as e:
+            return [
+                WriteResult(error=f"Failed to write {file_path}: {str(e)}", path=None, files_update=None)
+                for file_path in files
+            ]
+
+        return [WriteResult(error=None, path=file_path, files_update=None) for file_path in files]
+
     def edit(
         self,
         file_path: str,
@@ -0,0 +1,68 @@
+"""
+Per-thread Nexus backends for agent tools.
+
+Recon and assessment tools run inside LangGraph threads and store results in
+the thread's workspace: gs://bucket/{team_id}/{thread_id}/. Backends are
+created once per thread and share the cached get_nexus_fs() instance (and its
+content cache), so repeated tool calls on a scan don't rebuild them.
+
+Both tool modules import this module by its canonical ``src.agents`` path so
+they share one cache, whichever path style they use for their own imports.
+"""
+
+import logging
+from functools import lru_cache
+
+from langchain_core.runnables import RunnableConfig
+
+from src.agents.backends.nexus_backend import NexusBackend
+from src.config.nexus_config import close_nexus_fs, get_nexus_fs
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_TEAM_ID = "default-team"
+
+
+@lru_cache(maxsize=512)
+def get_thread_backend(thread_id: str) -> NexusBackend:
+    """
+    Get the backend for a thread, creating it on first use.
+
+    Tools called on the same thread (e.g. run_nuclei, then run_sqlmap) reuse
+    one backend instead of rebuilding NexusFS and re-creating the workspace.
+    """
+    backend = NexusBackend(thread_id, DEFAULT_TEAM_ID, get_nexus_fs())
+
+    logger.info("🔧 Created backend for thread: %.12s...", thread_id)
+    logger.info("   Storage: gs://bucket/%s/%s/", DEFAULT_TEAM_ID, thread_id)
+
+    return backend
+
+
+def clear_backend_cache() -> None:
+    """Drop cached backends and close the shared NexusFS (e.g. for test teardown)."""
+    get_thread_backend.cache_clear()
+    # Releases the metadata DB connections; the next tool call reopens them
+    close_nexus_fs()
+
+
+def thread_id_from_config(config: RunnableConfig) -> str:
+    """Extract the LangGraph thread_id from a runnable config."""
+    return (config.get("configurable") or {}).get("thread_id", "default-thread")
+
+
+def get_backend_from_config(config: RunnableConfig) -> tuple[str, str, NexusBackend]:
+    """
+    Extract thread_id from config and get its backend.
+
+    Args:
+        config: RunnableConfig from LangGraph runtime
+
+    Returns:
+        Tuple of (scan_id, team_id, backend)
+    """
+    # thread_id doubles as scan_id for isolation
+    thread_id = thread_id_from_config(config)
+
+    return thread_id, DEFAULT_TEAM_ID, get_thread_backend(thread_id)
@@ -11,7 +11,13 @@ import threading
 from typing import Optional
 from dataclasses import dataclass
 
+import structlog
+from langchain_core.runnables.config import var_child_runnable_config
+
 from src.agents.backends.nexus_backend import NexusBackend
+from src.config.nexus_config import get_nexus_fs
+
+logger = structlog.get_logger()
 
 
 @dataclass
@@ -67,9 +73,6 @@ def get_agent_context() -> AgentContext:
 
     # Try to auto-create context from LangGraph runtime
     try:
-        from langchain_core.runnables.config import var_child_runnable_config
-        from src.config.nexus_config import get_nexus_fs
-
         config = var_child_runnable_config.get(None)
         if config:
             thread_id = config.get("configurable", {}).get("thread_id")
@@ -82,8 +85,6 @@ def get_agent_context() -> AgentContext:
                 # Set and return context
                 set_agent_context(thread_id, team_id, backend)
 
-                import structlog
-                logger = structlog.get_logger()
                 logger.info(f"🔧 Auto-created backend: thread_id={thread_id[:12]}..., team={team_id}")
                 logger.info(f"   Storage: gs://bucket/{team_id}/{thread_id}/")
 
@@ -17,7 +17,8 @@ from datetime import datetime
 from typing import List, Optional
 from enum import Enum
 
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, TypeAdapter
 from e2b import Sandbox
 
 from src.agents.backends.nexus_backend import NexusBackend
@@ -52,6 +53,9 @@ class FfufFinding(BaseModel):
     duration_ms: Optional[int] = None   # Request duration
 
 
+_FINDINGS_ADAPTER = TypeAdapter(List[FfufFinding])
+
+
 class FfufAgent:
     """
     Directory brute-force agent using ffuf in E2B sandbox.
@@ -351,18 +355,16 @@ class FfufAgent:
         """Store results in Nexus workspace."""
         timestamp = datetime.utcnow().isoformat()
 
-        # Group findings by status code
+        # Dump each finding once; the status groups share the same dicts
+        finding_dicts = _FINDINGS_ADAPTER.dump_python(findings)
         by_status = {}
-        for f in findings:
-            status = str(f.status_code)
-            if status not in by_status:
-                by_status[status] = []
-            by_status[status].append(f.model_dump())
+        for f in finding_dicts:
+            by_status.setdefault(str(f["status_code"]), []).append(f)
 
         # Store structured JSON results
         results_data = {
             "target_url": target_url,
-            "findings": [f.model_dump() for f in findings],
+            "findings": finding_dicts,
             "count": len(findings),
             "by_status_code": by_status,
             "timestamp": timestamp,
@@ -371,7 +373,7 @@ class FfufAgent:
             "tool": "ffuf",
         }
 
-        results_json = json.dumps(results_data, indent=2)
+        results_json = orjson.dumps(results_data, option=orjson.OPT_INDENT_2).decode()
 
         # Write results
         json_path = "/recon/ffuf/findings.json"
@@ -0,0 +1,201 @@
+"""
+In-process HTTP/HTTPS probing.
+
+A lightweight alternative to the sandboxed HTTPx binary for when technology
+detection isn't needed: targets are probed concurrently from one pooled
+async client per scan, so keep-alive connections and TLS sessions are reused
+instead of paying a handshake per probe.
+
+Results use the same host record shape as HTTPxAgent._parse_output, so
+downstream stages can't tell which path produced them (technologies is
+always empty).
+
+Because probes leave from the API host rather than the sandbox, every
+request (redirects included) goes through a transport that resolves the
+host once, refuses it if any address is private, loopback, link-local or
+otherwise non-global, and connects to the vetted address itself. Scan
+targets therefore can't be used to reach internal services, not even by a
+name that re-resolves to an internal address after the check (DNS
+rebinding).
+"""
+
+import asyncio
+import ipaddress
+import logging
+import re
+import socket
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Per-request timeout; the overall scan timeout is enforced by the caller
+PROBE_TIMEOUT = httpx.Timeout(10.0)
+
+# Only the start of the body is read (enough to find the <title>)
+MAX_BODY_BYTES = 64 * 1024
+
+TITLE_PATTERN = re.compile(rb"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class BlockedAddressError(httpx.RequestError):
+    """Raised when a probe would connect to a non-public address."""
+
+
+async def _resolve_public_address(request: httpx.Request) -> str:
+    """
+    Resolve the request's host, requiring every address to be global.
+
+    Returns:
+        The address to connect to
+
+    Raises:
+        BlockedAddressError: If any address the host resolves to isn't global
+    """
+    host = request.url.host
+    port = request.url.port or DEFAULT_PORTS[request.url.scheme]
+    try:
+        addresses = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+    except socket.gaierror as e:
+        raise httpx.ConnectError(f"Cannot resolve {host}: {e}", request=request) from e
+
+    vetted = []
+    for *_, sockaddr in addresses:
+        # Drop any IPv6 zone ("fe80::1%eth0") and unwrap IPv4-mapped addresses
+        address = ipaddress.ip_address(sockaddr[0].split("%")[0])
+        if address.version == 6 and address.ipv4_mapped:
+            address = address.ipv4_mapped
+        if not address.is_global:
+            logger.warning("Refusing to probe %s: resolves to %s", host, address)
+            raise BlockedAddressError(f"{host} resolves to non-public {address}", request=request)
+        vetted.append(address)
+
+    if not vetted:
+        raise httpx.ConnectError(f"Cannot resolve {host}: no addresses", request=request)
+    return str(vetted[0])
+
+
+class _PublicAddressTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that only connects to vetted public addresses.
+
+    The host is resolved once per request and the connection is made to
+    that address, keeping the original Host header and TLS SNI. Letting
+    httpx resolve the name again would give a short-TTL name the chance to
+    answer with an internal address after passing the check.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._transport = httpx.AsyncHTTPTransport(**kwargs)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        address = await _resolve_public_address(request)
+        extensions = dict(request.extensions)
+        if request.url.scheme == "https":
+            extensions.setdefault("sni_hostname", request.url.host)
+
+        pinned = httpx.Request(
+            request.method,
+            request.url.copy_with(host=address),
+            headers=request.headers,
+            stream=request.stream,
+            extensions=extensions,
+        )
+        return await self._transport.handle_async_request(pinned)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _candidate_urls(target: str) -> List[str]:
+    """URLs to try for a target: as given, or HTTPS then HTTP for bare hosts."""
+    if target.startswith(("http://", "https://")):
+        return [target]
+    return [f"https://{target}", f"http://{target}"]
+
+
+async def _probe(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, target: str
+) -> Optional[Dict[str, Any]]:
+    """Probe one target, returning its host record or None if nothing answered."""
+    async with semaphore:
+        for url in _candidate_urls(target):
+            try:
+                async with client.stream("GET", url) as response:
+                    body = b""
+                    async for chunk in response.aiter_bytes():
+                        body += chunk
+                        if len(body) >= MAX_BODY_BYTES:
+                            break
+            except httpx.HTTPError as e:
+                logger.debug("Probe of %s failed: %s", url, e)
+                continue
+
+            parts = urlsplit(url)
+            title_match = TITLE_PATTERN.search(body)
+            return {
+                "url": url,
+                "host": parts.hostname or "",
+                "status_code": response.status_code,
+                "title": title_match.group(1).decode("utf-8", "replace").strip() if title_match else "",
+                "web_server": response.headers.get("server", ""),
+                "content_length": int(response.headers.get("content-length") or len(body)),
+                "technologies": [],
+                "scheme": parts.scheme,
+                "port": str(parts.port or DEFAULT_PORTS[parts.scheme]),
+                "probed_at": datetime.now(timezone.utc).isoformat(),
+            }
+    return None
+
+
+async def probe_targets(
+    targets: List[str],
+    threads: int = 50,
+    follow_redirects: bool = True,
+    allow_private: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Probe targets for live HTTP/HTTPS services.
+
+    Args:
+        targets: Domains/subdomains or URLs to probe
+        threads: Maximum number of probes in flight (and pooled connections)
+        follow_redirects: Follow HTTP redirects
+        allow_private: Probe non-public addresses too (only for local testing)
+
+    Returns:
+        Host records for the targets that responded, in target order
+    """
+    # Bounding in-flight probes with a semaphore rather than only the pool
+    # limit keeps queued probes from hitting httpx's pool timeout
+    semaphore = asyncio.Semaphore(threads)
+    limits = httpx.Limits(max_connections=threads, max_keepalive_connections=threads)
+
+    # Probing reports hosts with self-signed or expired certificates too
+    transport_class = httpx.AsyncHTTPTransport if allow_private else _PublicAddressTransport
+    transport = transport_class(limits=limits, verify=False)
+
+    async with httpx.AsyncClient(
+        transport=transport,
+        timeout=PROBE_TIMEOUT,
+        follow_redirects=follow_redirects,
+    ) as client:
+        results = await asyncio.gather(
+            *(_probe(client, semaphore, target) for target in targets),
+            return_exceptions=True,
+        )
+
+    live_hosts = []
+    for target, result in zip(targets, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning("Probe of %s failed: %s", target, result)
+        elif result is not None:
+            live_hosts.append(result)
+    return live_hosts
@@ -10,6 +10,7 @@ Reference:
 - HTTPx: https://github.com/projectdiscovery/httpx
 """
 
+import asyncio
 import json
 import logging
 import re
@@ -20,9 +21,14 @@ from urllib.parse import urlparse
 from e2b import Sandbox
 
 from src.agents.backends.nexus_backend import NexusBackend
+from src.agents.recon.http_probe import probe_targets
 
 logger = logging.getLogger(__name__)
 
+# execute_sharded(): targets per HTTPx run, and HTTPx runs in flight per sandbox
+HTTPX_CHUNK_SIZE = 256
+MAX_CONCURRENT_CHUNKS = 8
+
 
 class HTTPxError(Exception):
     """Exceptions raised by HTTPx agent."""
@@ -75,20 +81,27 @@ class HTTPxAgent:
             scan_id: Scan identifier
             team_id: Team identifier (for multi-tenancy)
             nexus_backend: NexusBackend for workspace file operations
-            sandbox: E2B Sandbox instance (auto-created if None)
+            sandbox: E2B Sandbox instance (created on first use if None)
         """
         self.scan_id = scan_id
         self.team_id = team_id
         self.backend = nexus_backend
 
-        # Initialize E2B sandbox with security tools template
-        # Template ID: dbe6pq4es6hqj31ybd38 (threatweaver-security)
-        if sandbox is None:
-            self.sandbox = Sandbox.create(template="dbe6pq4es6hqj31ybd38")
-            self._owns_sandbox = True  # We created it, so we'll clean it up
-        else:
-            self.sandbox = sandbox
-            self._owns_sandbox = False  # Provided externally, don't clean up
+        # The sandbox is created lazily: probe() runs in-process and never needs one
+        self._sandbox = sandbox
+        self._owns_sandbox = sandbox is None  # We create it, so we'll clean it up
+
+    @property
+    def sandbox(self) -> Sandbox:
+        """E2B sandbox running the HTTPx binary (created on first access)."""
+        if self._sandbox is None:
+            # Template ID: dbe6pq4es6hqj31ybd38 (threatweaver-security)
+            self._sandbox = Sandbox.create(template="dbe6pq4es6hqj31ybd38")
+        return self._sandbox
+
+    def _ensure_sandbox(self) -> Sandbox:
+        """Create the sandbox now if it doesn't exist yet (blocks on E2B)."""
+        return self.sandbox
 
     def execute(
         self,
@@ -154,12 +167,152 @@ class HTTPxAgent:
             logger.error(f"HTTPx execution failed: {e}")
             raise HTTPxError(f"HTTP probing failed: {e}") from e
 
+    async def execute_sharded(
+        self,
+        targets: List[str],
+        timeout: int = 300,
+        threads: int = 50,
+        follow_redirects: bool = True,
+        tech_detect: bool = True,
+        chunk_size: int = HTTPX_CHUNK_SIZE,
+        max_concurrent_chunks: int = MAX_CONCURRENT_CHUNKS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Probe targets in the sandbox as concurrent HTTPx runs over target chunks.
+
+        Same results as execute(), but large target lists are split into
+        chunks that run concurrently (bounded so one scan can't flood the
+        sandbox), and each chunk's output is parsed while the others are
+        still probing.
+
+        Args:
+            targets: List of domains/subdomains to probe
+            timeout: Overall timeout in seconds, however many chunks there
+                are (default: 5 minutes)
+            threads: Number of concurrent threads per HTTPx run (default: 50)
+            follow_redirects: Follow HTTP redirects (default: True)
+            tech_detect: Enable technology detection (default: True)
+            chunk_size: Targets per HTTPx run (default: 256)
+            max_concurrent_chunks: HTTPx runs in flight at once (default: 8)
+
+        Returns:
+            List of live host dictionaries with probe results, in chunk order
+
+        Raises:
+            HTTPxError: If any chunk fails or times out
+        """
+        logger.info(f"Starting sharded HTTP probing for {len(targets)} targets")
+
+        if not targets:
+            logger.warning("No targets provided to HTTPx agent")
+            return []
+
+        try:
+            self._validate_targets(targets)
+
+            # Create the sandbox up front so concurrent chunks don't each create one
+            await asyncio.to_thread(self._ensure_sandbox)
+            semaphore = asyncio.Semaphore(max_concurrent_chunks)
+
+            async def probe_chunk(index: int, chunk: List[str]) -> tuple[str, List[Dict[str, Any]]]:
+                targets_path = f"/tmp/httpx_targets_{index}.txt"
+                async with semaphore:
+                    await asyncio.to_thread(self.sandbox.files.write, targets_path, "\n".join(chunk))
+                    result = await asyncio.to_thread(
+                        self._run_httpx,
+                        timeout=timeout,
+                        threads=threads,
+                        follow_redirects=follow_redirects,
+                        tech_detect=tech_detect,
+                        targets_path=targets_path,
+                    )
+                return result.stdout, self._parse_output(result.stdout)
+
+            try:
+                async with asyncio.timeout(timeout), asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(probe_chunk(index, targets[start:start + chunk_size]))
+                        for index, start in enumerate(range(0, len(targets), chunk_size))
+                    ]
+            except TimeoutError as e:
+                raise HTTPxError(f"HTTP probing timed out after {timeout}s") from e
+
+            outputs = [task.result() for task in tasks]
+            live_hosts = [host for _, chunk_hosts in outputs for host in chunk_hosts]
+            # A shard's stdout may lack a trailing newline; keep JSONL lines apart
+            raw_output = "\n".join(stdout.rstrip("\n") for stdout, _ in outputs)
+
+            await asyncio.to_thread(self._store_results, targets, live_hosts, raw_output)
+
+            logger.info(f"Found {len(live_hosts)} live hosts out of {len(targets)} targets")
+            return live_hosts
+
+        except Exception as e:
+            # TaskGroup wraps chunk failures in an ExceptionGroup
+            errors = "; ".join(map(str, e.exceptions if isinstance(e, ExceptionGroup) else [e]))
+            logger.error(f"HTTPx execution failed: {errors}")
+            raise HTTPxError(f"HTTP probing failed: {errors}") from e
+
+    async def probe(
+        self,
+        targets: List[str],
+        timeout: int = 300,
+        threads: int = 50,
+        follow_redirects: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Probe targets in-process on a pooled async HTTP client.
+
+        Faster than execute() for large target lists, but skips technology
+        detection (which needs the HTTPx binary's fingerprints) and sends the
+        probes from this host rather than the sandbox, so targets resolving to
+        non-public addresses are skipped. Results are stored in the same place
+        and shape as execute().
+
+        Args:
+            targets: List of domains/subdomains to probe
+            timeout: Overall timeout in seconds (default: 5 minutes)
+            threads: Maximum number of probes in flight (default: 50)
+            follow_redirects: Follow HTTP redirects (default: True)
+
+        Returns:
+            List of live host dictionaries with probe results
+
+        Raises:
+            HTTPxError: If probing fails or times out
+        """
+        logger.info(f"Starting in-process HTTP probing for {len(targets)} targets")
+
+        if not targets:
+            logger.warning("No targets provided to HTTPx agent")
+            return []
+
+        try:
+            self._validate_targets(targets)
+
+            try:
+                async with asyncio.timeout(timeout):
+                    live_hosts = await probe_targets(targets, threads, follow_redirects)
+            except TimeoutError as e:
+                raise HTTPxError(f"HTTP probing timed out after {timeout}s") from e
+
+            raw_output = "\n".join(json.dumps(host) for host in live_hosts)
+            await asyncio.to_thread(self._store_results, targets, live_hosts, raw_output)
+
+            logger.info(f"Found {len(live_hosts)} live hosts out of {len(targets)} targets")
+            return live_hosts
+
+        except Exception as e:
+            logger.error(f"HTTP probing failed: {e}")
+            raise HTTPxError(f"HTTP probing failed: {e}") from e
+
     def _run_httpx(
         self,
         timeout: int,
         threads: int,
         follow_redirects: bool,
         tech_detect: bool,
+        targets_path: str = "/tmp/httpx_targets.txt",
     ):
         """Execute HTTPx in E2B sandbox."""
         # HTTPx command with JSON output for structured parsing
@@ -173,7 +326,7 @@ class HTTPxAgent:
         # -threads: concurrent threads
         command_parts = [
             "httpx",
-            "-l /tmp/httpx_targets.txt",
+            f"-l {targets_path}",
             "-json",
             "-silent",
             "-status-code",
@@ -341,9 +494,9 @@ class HTTPxAgent:
 
     def cleanup(self) -> None:
         """Cleanup sandbox resources (only if we created it)."""
-        if self.sandbox and self._owns_sandbox:
+        if self._sandbox and self._owns_sandbox:
             try:
-                self.sandbox.kill()
+                self._sandbox.kill()
                 logger.info("Sandbox cleanup completed")
             except Exception as e:
                 logger.warning(f"Sandbox cleanup failed: {e}")
@@ -10,18 +10,25 @@ Reference:
 - Subfinder: https://github.com/projectdiscovery/subfinder
 """
 
-import json
+from __future__ import annotations
+
 import logging
 import re
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
+
+import orjson
 
-from e2b import Sandbox
+if TYPE_CHECKING:
+    from e2b import Sandbox
 
-from src.agents.backends.nexus_backend import NexusBackend
+    from src.agents.backends.nexus_backend import NexusBackend
 
 logger = logging.getLogger(__name__)
 
+# Characters allowed inside a DNS label (RFC 1035 LDH rule)
+_LABEL_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-")
+
 
 class SubfinderError(Exception):
     """Exceptions raised by Subfinder agent."""
@@ -81,6 +88,9 @@ class SubfinderAgent:
         # Initialize E2B sandbox with security tools template
         # Template ID: dbe6pq4es6hqj31ybd38 (threatweaver-security)
         if sandbox is None:
+            # Deferred so importing the agent doesn't pull in the e2b SDK
+            from e2b import Sandbox
+
             self.sandbox = Sandbox.create(template="dbe6pq4es6hqj31ybd38")
             self._owns_sandbox = True  # We created it, so we'll clean it up
         else:
@@ -157,11 +167,17 @@ class SubfinderAgent:
         if len(domain) > 253:
             raise ValueError(f"Domain too long: {domain} (max 253 characters)")
 
-        # Simple domain validation (RFC 1035)
-        pattern = r"^[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
-
-        if not re.match(pattern, domain):
-            raise ValueError(f"Invalid domain format: {domain}")
+        # Simple domain validation (RFC 1035): every label is 1-63 letters,
+        # digits or hyphens and doesn't start or end with a hyphen.
+        # Plain string checks are much cheaper than a regex match per call.
+        for label in domain.split("."):
+            if (
+                not 0 < len(label) <= 63
+                or label[0] == "-"
+                or label[-1] == "-"
+                or not all(c in _LABEL_CHARS for c in label)
+            ):
+                raise ValueError(f"Invalid domain format: {domain}")
 
     def _parse_output(
         self,
@@ -218,7 +234,7 @@ class SubfinderAgent:
             "version": "2.6.3"
         }
 
-        results_json = json.dumps(results_data, indent=2)
+        results_json = orjson.dumps(results_data, option=orjson.OPT_INDENT_2).decode()
 
         # Try to write, if file exists read and replace entire content
         json_path = "/recon/subfinder/subdomains.json"
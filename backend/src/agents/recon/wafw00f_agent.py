@@ -10,27 +10,43 @@ Reference:
 - wafw00f: https://github.com/EnableSecurity/wafw00f
 """
 
-import json
+from __future__ import annotations
+
 import logging
 import re
+import shlex
+from collections import Counter
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
+
+import orjson
 
-from pydantic import BaseModel
-from e2b import Sandbox
+if TYPE_CHECKING:
+    from e2b import Sandbox
 
-from src.agents.backends.nexus_backend import NexusBackend
+    from src.agents.backends.nexus_backend import NexusBackend
 
 logger = logging.getLogger(__name__)
 
+# Characters allowed in a target hostname
+_HOST_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-.")
+
 
 class Wafw00fError(Exception):
     """Exceptions raised by wafw00f agent."""
     pass
 
 
-class WafFinding(BaseModel):
-    """Represents a WAF detection result from wafw00f."""
+@dataclass(slots=True)
+class WafFinding:
+    """
+    Represents a WAF detection result from wafw00f.
+
+    A slotted dataclass rather than a pydantic model: one is built per
+    target in the parse loop and the values come from our own parser, so
+    validation and a per-instance __dict__ are pure overhead.
+    """
     target: str                         # Target URL
     waf_detected: bool                  # Whether any WAF was detected
     waf_name: Optional[str] = None      # WAF product name (e.g., "Cloudflare")
@@ -91,6 +107,9 @@ class Wafw00fAgent:
         "wordfence": "Wordfence",
     }
 
+    # Exit status reserved for "wafw00f missing and pip install failed"
+    INSTALL_FAILED_EXIT_CODE = 97
+
     def __init__(
         self,
         scan_id: str,
@@ -113,6 +132,9 @@ class Wafw00fAgent:
 
         # Initialize E2B sandbox with security tools template
         if sandbox is None:
+            # Deferred so importing the agent doesn't pull in the e2b SDK
+            from e2b import Sandbox
+
             self.sandbox = Sandbox.create(template="dbe6pq4es6hqj31ybd38", timeout=600)
             self._owns_sandbox = True
         else:
@@ -168,28 +190,27 @@ class Wafw00fAgent:
 
     def _run_wafw00f(self, targets: List[str], timeout: int) -> str:
         """Execute wafw00f in E2B sandbox."""
-        # Write targets to file
-        targets_content = "\n".join(targets)
-        self.sandbox.files.write("/tmp/targets.txt", targets_content)
-
-        # Build wafw00f command
-        command = "wafw00f -i /tmp/targets.txt -o /tmp/wafw00f_output.txt -f text"
+        # Pipe targets via stdin instead of writing a targets file first,
+        # saving a full sandbox files.write round-trip per invocation
+        quoted_targets = " ".join(shlex.quote(url) for url in targets)
+
+        # Install wafw00f on demand in the same command rather than probing
+        # with a separate `which` call first (one sandbox round-trip instead
+        # of two). Install output goes to stderr so it can't leak into the
+        # parsed results.
+        command = (
+            "command -v wafw00f >/dev/null 2>&1 || "
+            f"pip install wafw00f 1>&2 || exit {self.INSTALL_FAILED_EXIT_CODE}; "
+            f"printf '%s\\n' {quoted_targets} | "
+            "wafw00f -i /dev/stdin -o /tmp/wafw00f_output.txt -f text"
+        )
 
         logger.info(f"Running wafw00f on {len(targets)} targets")
 
         try:
-            # First check if wafw00f is installed, if not install it
-            check_result = self.sandbox.commands.run("which wafw00f", timeout=30)
-            if check_result.exit_code != 0:
-                logger.info("Installing wafw00f in sandbox...")
-                install_result = self.sandbox.commands.run(
-                    "pip install wafw00f",
-                    timeout=120
-                )
-                if install_result.exit_code != 0:
-                    raise Wafw00fError(f"Failed to install wafw00f: {install_result.stderr}")
-
             result = self.sandbox.commands.run(command, timeout=timeout)
+            if result.exit_code == self.INSTALL_FAILED_EXIT_CODE:
+                raise Wafw00fError(f"Failed to install wafw00f: {result.stderr}")
 
             # Read output file
             try:
@@ -207,9 +228,18 @@ class Wafw00fAgent:
         if not url.startswith(('http://', 'https://')):
             raise ValueError(f"URL must start with http:// or https://: {url}")
 
-        # Basic URL validation
-        pattern = r'^https?://[a-zA-Z0-9][-a-zA-Z0-9.]*[a-zA-Z0-9](:[0-9]+)?(/.*)?$'
-        if not re.match(pattern, url):
+        # Basic URL validation: host[:port][/path], checked with string ops
+        # rather than a regex since this runs once per target
+        netloc, _, path = url.split("://", 1)[1].partition("/")
+        host, has_port, port = netloc.partition(":")
+        if (
+            len(host) < 2
+            or host[0] in "-."
+            or host[-1] in "-."
+            or not all(c in _HOST_CHARS for c in host)
+            or (has_port and not (port.isascii() and port.isdigit()))
+            or "\n" in path
+        ):
             raise ValueError(f"Invalid URL format: {url}")
 
     def _parse_output(self, raw_output: str, targets: List[str]) -> List[WafFinding]:
@@ -219,6 +249,11 @@ class Wafw00fAgent:
         # Initialize findings for all targets (in case some aren't in output)
         target_findings = {url: None for url in targets}
 
+        # Targets with a conclusive verdict; once all are resolved the rest of
+        # the output (summary footer etc.) can be skipped
+        resolved = set()
+        remaining = len(target_findings)
+
         # Parse wafw00f output
         # Example output formats:
         # "https://example.com is behind Cloudflare (Cloudflare Inc.)"
@@ -235,15 +270,19 @@ class Wafw00fAgent:
             waf_name = None
             waf_vendor = None
             confidence = "unknown"
-            target_url = None
 
-            # Find which target this line is about
-            for url in targets:
-                if url in line:
-                    target_url = url
-                    break
+            # Find which target this line is about. Result lines start with
+            # the target URL, so try a single lookup on the first token before
+            # falling back to a substring scan over all targets.
+            candidate = line.split(None, 1)[0]
+            target_url = candidate if candidate in target_findings else None
+            if target_url is None:
+                for url in targets:
+                    if url in line:
+                        target_url = url
+                        break
 
-            if not target_url:
+            if not target_url or target_url in resolved:
                 continue
 
             # Parse detection results
@@ -292,6 +331,12 @@ class Wafw00fAgent:
                 raw_output=line,
             )
 
+            if confidence != "unknown":
+                resolved.add(target_url)
+                remaining -= 1
+                if remaining == 0:
+                    break
+
         # Create findings list, adding placeholder for any targets not in output
         for url in targets:
             if target_findings[url]:
@@ -318,10 +363,7 @@ class Wafw00fAgent:
         timestamp = datetime.now(timezone.utc).isoformat()
 
         # Summarize findings
-        detected_wafs = {}
-        for f in findings:
-            if f.waf_detected and f.waf_name:
-                detected_wafs[f.waf_name] = detected_wafs.get(f.waf_name, 0) + 1
+        detected_wafs = Counter(f.waf_name for f in findings if f.waf_detected and f.waf_name)
 
         # Store structured JSON results
         results_data = {
@@ -329,14 +371,14 @@ class Wafw00fAgent:
             "targets_count": len(targets),
             "waf_detected_count": sum(1 for f in findings if f.waf_detected),
             "detected_wafs": detected_wafs,
-            "findings": [f.model_dump() for f in findings],
+            "findings": [asdict(f) for f in findings],
             "timestamp": timestamp,
             "scan_id": self.scan_id,
             "team_id": self.team_id,
             "tool": "wafw00f",
         }
 
-        results_json = json.dumps(results_data, indent=2)
+        results_json = orjson.dumps(results_data, option=orjson.OPT_INDENT_2).decode()
 
         # Write results
         json_path = "/recon/wafw00f/findings.json"
@@ -13,71 +13,241 @@ Architecture:
 - Stores all results in Nexus/GCS workspace
 - Aggregates findings into final report
 
+A deterministic alternative, create_recon_pipeline(), wires the same stages
+as an explicit StateGraph and runs the stages that only depend on httpx
+output (wafw00f, ffuf, nmap) concurrently.
+
 Reference:
 - Issue #16: Create Recon Coordinator (LangGraph)
 - DeepAgents: https://github.com/langchain-ai/deepagents
 - Syntar implementation: /Users/tafeng/syntar/backend
 """
 
+from __future__ import annotations
+
+import asyncio
+import heapq
+import importlib.util
+import itertools
 import logging
-from typing import Any, Optional, Dict
+import operator
+import os
+import re
+import weakref
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING, Annotated, Any, Optional, Dict, Iterable, Iterator, List, Protocol,
+    TypedDict,
+)
+from urllib.parse import urlsplit
+
+import httpx
+import orjson
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_core.runnables import RunnableConfig
+from langgraph.config import get_stream_writer
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Send
+
+from config.settings import load_env, settings
+from agents.tools.recon_tools import (
+    _get_backend_from_config,
+    run_subfinder,
+    run_httpx,
+    run_nmap,
+    run_ffuf,
+    run_wafw00f,
+)
+
+# deepagents and langchain_openai are imported where they are used: they are
+# only needed once an agent or model is built, not to import this module
+if TYPE_CHECKING:
+    from deepagents import SubAgent
+    from langchain_openai import ChatOpenAI
+
+    from agents.backends.nexus_backend import NexusBackend
 
-from deepagents import create_deep_agent, SubAgent
-from langchain_openai import ChatOpenAI
+logger = logging.getLogger(__name__)
 
-from agents.backends.nexus_backend import NexusBackend
-from agents.tools.recon_tools import run_subfinder, run_httpx, run_nmap, run_ffuf, run_wafw00f
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
-logger = logging.getLogger(__name__)
+# HTTP settings for OpenRouter calls: a keep-alive pool sized for sub-agent
+# fan-out, and a short connect timeout instead of the SDK's 10 minute default
+# for everything. HTTP/2 is used when the optional `h2` package is installed.
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_HTTP_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
-def _get_tools():
+class _PerLoopTransport(httpx.AsyncBaseTransport):
     """
-    Get recon tools for sub-agents.
+    Async transport that keeps one connection pool per event loop.
 
-    The tools automatically extract thread_id from LangGraph's RunnableConfig
-    and create their own backend. No binding needed.
+    Pooled connections belong to the loop that opened them, so a pool shared
+    across loops (tests, asyncio.run() from a sync tool) fails with "Event
+    loop is closed". Each loop gets its own pool, dropped with the loop.
     """
-    return {
-        'subfinder': run_subfinder,
-        'httpx': run_httpx,
-        'nmap': run_nmap,
-        'ffuf': run_ffuf,
-        'wafw00f': run_wafw00f,
-    }
 
+    def __init__(self) -> None:
+        self._transports: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport
+        ] = weakref.WeakKeyDictionary()
 
-def create_subfinder_subagent(
-    scan_id: str,
-    team_id: str,
-    backend: NexusBackend,
-    model: Optional[Any] = None
-) -> Any:
+    def _get_transport(self) -> httpx.AsyncHTTPTransport:
+        """Get the pool of the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(limits=_HTTP_LIMITS, http2=_HTTP2_AVAILABLE)
+            self._transports[loop] = transport
+        return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._get_transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+
+@lru_cache(maxsize=1)
+def _get_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    Get the (sync, async) HTTP clients shared by all OpenRouter models.
+
+    The async client pools connections per event loop (see _PerLoopTransport),
+    so the models can be shared by code running on different loops.
     """
-    Create Subfinder sub-agent (DeepAgent).
+    return (
+        httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, http2=_HTTP2_AVAILABLE),
+        httpx.AsyncClient(timeout=_HTTP_TIMEOUT, transport=_PerLoopTransport()),
+    )
 
-    This is a specialized sub-agent that uses the run_subfinder tool
-    to discover subdomains for a target domain.
 
-    Args:
-        scan_id: Scan identifier
-        team_id: Team identifier
-        backend: NexusBackend instance
-        model: LLM model (default: GPT-4o-mini via OpenRouter)
+@lru_cache(maxsize=1)
+def _get_rate_limiter() -> InMemoryRateLimiter:
+    """
+    Get the token bucket shared by all OpenRouter models.
 
-    Returns:
-        DeepAgent configured for subdomain discovery
+    Sub-agent fan-out can otherwise burst past the account's request limit
+    and stall on 429 retries with exponential backoff. Throttling client-side
+    keeps every model in the process under OPENROUTER_REQUESTS_PER_MINUTE.
     """
-    if model is None:
-        import os
-        model = ChatOpenAI(
-            model="openai/gpt-4o-mini",
-            openai_api_key=os.getenv("OPENROUTER_API_KEY"),
-            openai_api_base="https://openrouter.ai/api/v1",
-            temperature=0
-        )
+    requests_per_second = settings.openrouter_requests_per_minute / 60
+    return InMemoryRateLimiter(
+        requests_per_second=requests_per_second,
+        check_every_n_seconds=0.05,
+        max_bucket_size=max(1.0, requests_per_second),
+    )
+
+
+def _openrouter_model(model_name: str, api_key: Optional[str]) -> ChatOpenAI:
+    """Build an OpenRouter chat model on the shared HTTP clients."""
+    from langchain_openai import ChatOpenAI
+
+    http_client, http_async_client = _get_http_clients()
+    return ChatOpenAI(
+        model=model_name,
+        api_key=api_key,
+        base_url=OPENROUTER_BASE_URL,
+        temperature=0,
+        http_client=http_client,
+        http_async_client=http_async_client,
+        rate_limiter=_get_rate_limiter(),
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_api_keys() -> tuple[Optional[str], ...]:
+    """
+    Get the OpenRouter API keys to spread requests over.
+
+    OPENROUTER_API_KEYS takes a comma-separated list so that large fan-outs
+    are not capped by a single key's rate limit; otherwise the single
+    OPENROUTER_API_KEY is used.
+    """
+    load_env()
+    keys = tuple(
+        key.strip()
+        for key in os.getenv("OPENROUTER_API_KEYS", "").split(",")
+        if key.strip()
+    )
+    return keys or (os.getenv("OPENROUTER_API_KEY"),)
 
-    system_prompt = """You are a Subdomain Discovery Specialist.
+
+@lru_cache(maxsize=None)
+def _get_model_pool(model_name: str) -> tuple[ChatOpenAI, ...]:
+    """Get one shared client per API key for `model_name`."""
+    return tuple(_openrouter_model(model_name, key) for key in _get_api_keys())
+
+
+@lru_cache(maxsize=None)
+def _get_model_cycle(model_name: str) -> Iterator[ChatOpenAI]:
+    """Get the round-robin iterator over the model pool for `model_name`."""
+    return itertools.cycle(_get_model_pool(model_name))
+
+
+def _get_mini_model() -> ChatOpenAI:
+    """
+    Get a shared GPT-4o-mini client used for routing and tool sub-agents.
+
+    Clients are built once per process so every factory call reuses them
+    (and their HTTP connection pool) instead of constructing new ones. With
+    several API keys configured, successive calls rotate through the keys.
+    """
+    return next(_get_model_cycle("openai/gpt-4o-mini"))
+
+
+def _get_sonnet_model() -> ChatOpenAI:
+    """Get a shared Claude Sonnet 4 client used for the final report."""
+    return next(_get_model_cycle("anthropic/claude-sonnet-4"))
+
+
+class LLMLike(Protocol):
+    """
+    Chat model interface the recon agents rely on.
+
+    Satisfied by ChatOpenAI and any other LangChain chat model: the agent
+    graph binds the tools and awaits completions, nothing more.
+    """
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> Any: ...
+
+    async def ainvoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any: ...
+
+
+# Recon tools by sub-agent name. Built once: the tools carry no per-scan
+# state, so the same table serves every coordinator.
+_RECON_TOOLS = MappingProxyType({
+    'subfinder': run_subfinder,
+    'httpx': run_httpx,
+    'nmap': run_nmap,
+    'ffuf': run_ffuf,
+    'wafw00f': run_wafw00f,
+})
+
+
+def _get_tools():
+    """
+    Get recon tools for sub-agents.
+
+    The tools automatically extract thread_id from LangGraph's RunnableConfig
+    and create their own backend. No binding needed, so the shared read-only
+    table is returned rather than rebuilt per call.
+    """
+    return _RECON_TOOLS
+
+
+# ============================================================================
+# System Prompts
+# ============================================================================
+
+_SUBFINDER_SYSTEM_PROMPT = """You are a Subdomain Discovery Specialist.
 
 Your mission: Discover subdomains for a target domain using Subfinder.
 
@@ -96,45 +266,8 @@ Your mission: Discover subdomains for a target domain using Subfinder.
 
 Be concise and factual. Focus on actionable intelligence."""
 
-    return create_deep_agent(
-        model=model,
-        backend=backend,
-        system_prompt=system_prompt,
-        tools=[run_subfinder]
-    )
 
-
-def create_httpx_subagent(
-    scan_id: str,
-    team_id: str,
-    backend: NexusBackend,
-    model: Optional[Any] = None
-) -> Any:
-    """
-    Create HTTPx sub-agent (DeepAgent).
-
-    This is a specialized sub-agent that uses the run_httpx tool
-    to probe subdomains and identify live HTTP/HTTPS services.
-
-    Args:
-        scan_id: Scan identifier
-        team_id: Team identifier
-        backend: NexusBackend instance
-        model: LLM model (default: GPT-4o-mini via OpenRouter)
-
-    Returns:
-        DeepAgent configured for HTTP probing
-    """
-    if model is None:
-        import os
-        model = ChatOpenAI(
-            model="openai/gpt-4o-mini",
-            openai_api_key=os.getenv("OPENROUTER_API_KEY"),
-            openai_api_base="https://openrouter.ai/api/v1",
-            temperature=0
-        )
-
-    system_prompt = """You are an HTTP/HTTPS Probing Specialist.
+_HTTPX_SYSTEM_PROMPT = """You are an HTTP/HTTPS Probing Specialist.
 
 Your mission: Probe discovered subdomains to identify live hosts.
 
@@ -142,7 +275,7 @@ Your mission: Probe discovered subdomains to identify live hosts.
 - run_httpx: Probes targets for HTTP/HTTPS services
 
 **Workflow:**
-1. Use run_httpx with the list of targets
+1. Use run_httpx ONCE with the full list of targets (do not call it per target)
 2. Read results from /recon/httpx/live_hosts.json
 3. Report findings concisely
 
@@ -154,45 +287,8 @@ Your mission: Probe discovered subdomains to identify live hosts.
 
 Be concise and factual. Focus on actionable intelligence."""
 
-    return create_deep_agent(
-        model=model,
-        backend=backend,
-        system_prompt=system_prompt,
-        tools=[run_httpx]
-    )
-
-
-def create_nmap_subagent(
-    scan_id: str,
-    team_id: str,
-    backend: NexusBackend,
-    model: Optional[Any] = None
-) -> Any:
-    """
-    Create Nmap sub-agent (DeepAgent).
-
-    This is a specialized sub-agent that uses the run_nmap tool
-    to scan hosts for open ports and running services.
-
-    Args:
-        scan_id: Scan identifier
-        team_id: Team identifier
-        backend: NexusBackend instance
-        model: LLM model (default: GPT-4o-mini via OpenRouter)
-
-    Returns:
-        DeepAgent configured for port scanning
-    """
-    if model is None:
-        import os
-        model = ChatOpenAI(
-            model="openai/gpt-4o-mini",
-            openai_api_key=os.getenv("OPENROUTER_API_KEY"),
-            openai_api_base="https://openrouter.ai/api/v1",
-            temperature=0
-        )
 
-    system_prompt = """You are a Network Scanning Specialist.
+_NMAP_SYSTEM_PROMPT = """You are a Network Scanning Specialist.
 
 Your mission: Scan live hosts to discover open ports and services.
 
@@ -200,7 +296,7 @@ Your mission: Scan live hosts to discover open ports and services.
 - run_nmap: Scans targets for open ports and services
 
 **Workflow:**
-1. Use run_nmap with the list of targets
+1. Use run_nmap ONCE with the full list of targets (do not call it per target)
 2. Read results from /recon/nmap/scan_results.json
 3. Report findings concisely
 
@@ -218,60 +314,8 @@ Your mission: Scan live hosts to discover open ports and services.
 
 Be concise and factual. Focus on security-relevant findings."""
 
-    return create_deep_agent(
-        model=model,
-        backend=backend,
-        system_prompt=system_prompt,
-        tools=[run_nmap]
-    )
-
-
-
-
-def create_recon_coordinator(
-    scan_id: str,
-    team_id: str,
-    backend: NexusBackend,
-    model: Optional[Any] = None
-) -> Any:
-    """
-    Create Recon Coordinator (orchestrator DeepAgent).
 
-    This is the main coordinator agent that orchestrates the complete
-    reconnaissance workflow by spawning and coordinating sub-agents.
-
-    Args:
-        scan_id: Scan identifier
-        team_id: Team identifier
-        backend: NexusBackend instance
-        model: LLM model (default: Claude Sonnet 4 via OpenRouter)
-
-    Returns:
-        DeepAgent configured as reconnaissance coordinator
-
-    Example:
-        >>> from config.nexus_config import get_nexus_fs
-        >>> from agents.backends.nexus_backend import NexusBackend
-        >>>
-        >>> backend = NexusBackend("scan-123", "team-abc", get_nexus_fs())
-        >>> coordinator = create_recon_coordinator("scan-123", "team-abc", backend)
-        >>> result = coordinator.invoke({
-        ...     "messages": [{"role": "user", "content": "Scan example.com"}]
-        ... })
-    """
-    if model is None:
-        import os
-        model = ChatOpenAI(
-            model="anthropic/claude-sonnet-4",
-            api_key=os.getenv("OPENROUTER_API_KEY"),
-            base_url="https://openrouter.ai/api/v1",
-            temperature=0
-        )
-
-    # Get recon tools (they auto-extract config from LangGraph runtime)
-    tools = _get_tools()
-
-    system_prompt = """You are a Cybersecurity Reconnaissance Coordinator.
+_COORDINATOR_SYSTEM_PROMPT = """You are a Cybersecurity Reconnaissance Coordinator.
 
 Your mission: Orchestrate a complete reconnaissance workflow for target domains.
 
@@ -282,6 +326,7 @@ You can spawn specialized sub-agents using the task() tool:
 - "nmap" - Scans live hosts for open ports and services
 - "ffuf" - Discovers hidden directories and files via brute-forcing
 - "wafw00f" - Detects Web Application Firewalls (WAFs)
+- "report" - Aggregates all results into the final report
 
 **Workflow Strategy:**
 1. DISCOVERY: Spawn subfinder sub-agent to discover subdomains
@@ -311,16 +356,26 @@ You can spawn specialized sub-agents using the task() tool:
    - task(agent_type="nmap", description="Scan these hosts: {list}")
    - Read results from /recon/nmap/scan_results.json
 
-7. FINAL REPORT: Aggregate all findings
-   - Write comprehensive report to /recon/final_report.json
-   - Include: summary, high-risk findings, recommendations
+7. FINAL REPORT: Spawn report sub-agent to aggregate all findings
+   - task(agent_type="report", description="Write the final report for {domain} (scan {scan_id})")
+   - It reads every /recon/ result file and writes /recon/final_report.json
 
 **Decision Making:**
 - If >100 subdomains: Limit to top 20-30 high-value targets
+- If WAF detected: Adjust the ffuf and nmap strategy accordingly
+
+Be thorough, intelligent, and security-focused. Make smart decisions about what to scan."""
+
+
+_REPORT_SUBAGENT_PROMPT = """You are a Reconnaissance Report Analyst.
+Read the result files under /recon/ (subfinder, httpx, wafw00f, ffuf, nmap) and write
+a comprehensive report to /recon/final_report.json.
+
+**Risk Rules:**
 - If database ports exposed: Flag as HIGH RISK
+- If hidden admin paths found: Flag as HIGH RISK
 - If old SSH/HTTP versions: Flag as MEDIUM RISK
 - If admin/staging exposed: Flag as MEDIUM RISK
-- If hidden admin paths found: Flag as HIGH RISK
 - If WAF detected: Note in report and adjust exploitation strategy accordingly
 
 **Output Format:**
@@ -342,37 +397,26 @@ Write final report as JSON:
   ],
   "medium_risk_findings": [...],
   "recommendations": [...]
-}
+}"""
+
+
+_SUBFINDER_SUBAGENT_PROMPT = """You are a Subdomain Discovery Specialist.
+Use run_subfinder tool to discover subdomains. Read results from /recon/subfinder/subdomains.json and report findings."""
 
-Be thorough, intelligent, and security-focused. Make smart decisions about what to scan."""
 
-    # Register sub-agents that coordinator can spawn
-    sub_agents = [
-        SubAgent(
-            name="subfinder",
-            description="Subdomain discovery specialist using Subfinder tool",
-            system_prompt="""You are a Subdomain Discovery Specialist.
-Use run_subfinder tool to discover subdomains. Read results from /recon/subfinder/subdomains.json and report findings.""",
-            tools=[tools['subfinder']]
-        ),
-        SubAgent(
-            name="httpx",
-            description="HTTP/HTTPS probing specialist using HTTPx tool",
-            system_prompt="""You are an HTTP/HTTPS Probing Specialist.
-Use run_httpx tool to probe targets. Read results from /recon/httpx/live_hosts.json and report findings.""",
-            tools=[tools['httpx']]
-        ),
-        SubAgent(
-            name="nmap",
-            description="Network scanning specialist using Nmap tool",
-            system_prompt="""You are a Network Scanning Specialist.
-Use run_nmap tool to scan ports. Read results from /recon/nmap/scan_results.json and report findings.""",
-            tools=[tools['nmap']]
-        ),
-        SubAgent(
-            name="ffuf",
-            description="Directory and file brute-forcing specialist using ffuf tool",
-            system_prompt="""You are a Directory Discovery Specialist.
+_HTTPX_SUBAGENT_PROMPT = """You are an HTTP/HTTPS Probing Specialist.
+Use run_httpx tool to probe targets. Read results from /recon/httpx/live_hosts.json and report findings.
+
+Pass ALL targets to a single run_httpx call - never probe targets one at a time."""
+
+
+_NMAP_SUBAGENT_PROMPT = """You are a Network Scanning Specialist.
+Use run_nmap tool to scan ports. Read results from /recon/nmap/scan_results.json and report findings.
+
+Pass ALL targets to a single run_nmap call - never scan targets one at a time."""
+
+
+_FFUF_SUBAGENT_PROMPT = """You are a Directory Discovery Specialist.
 Use run_ffuf tool to discover hidden directories and files. Read results from /recon/ffuf/findings.json and report findings.
 
 **Best Practices:**
@@ -381,13 +425,10 @@ Use run_ffuf tool to discover hidden directories and files. Read results from /r
 - Filter out false positives using filter_size if default pages have consistent size
 - Focus on interesting status codes: 200, 301, 302, 401, 403
 
-Report any interesting findings like admin panels, backup files, or sensitive endpoints.""",
-            tools=[tools['ffuf']]
-        ),
-        SubAgent(
-            name="wafw00f",
-            description="WAF detection specialist using wafw00f tool",
-            system_prompt="""You are a WAF Detection Specialist.
+Report any interesting findings like admin panels, backup files, or sensitive endpoints."""
+
+
+_WAFW00F_SUBAGENT_PROMPT = """You are a WAF Detection Specialist.
 Use run_wafw00f tool to detect Web Application Firewalls. Read results from /recon/wafw00f/findings.json and report findings.
 
 **Key Information to Report:**
@@ -395,21 +436,443 @@ Use run_wafw00f tool to detect Web Application Firewalls. Read results from /rec
 - WAF vendor/product names (e.g., Cloudflare, AWS WAF, Akamai)
 - Confidence level of detection (high, medium, low)
 
-Knowing the WAF is critical for adjusting exploitation techniques. Report all detected WAFs clearly.""",
-            tools=[tools['wafw00f']]
-        )
-    ]
+Knowing the WAF is critical for adjusting exploitation techniques. Report all detected WAFs clearly."""
+
+
+# Sub-agents the coordinator can spawn. Built once: the tools resolve their
+# scan from the RunnableConfig at call time, so the specs carry no per-scan
+# state and every coordinator shares them. (SubAgent is a TypedDict, so plain
+# dicts avoid importing deepagents here.)
+_SUB_AGENTS: tuple[SubAgent, ...] = (
+    {
+        "name": "subfinder",
+        "description": "Subdomain discovery specialist using Subfinder tool",
+        "system_prompt": _SUBFINDER_SUBAGENT_PROMPT,
+        "tools": [_RECON_TOOLS['subfinder']],
+    },
+    {
+        "name": "httpx",
+        "description": "HTTP/HTTPS probing specialist using HTTPx tool",
+        "system_prompt": _HTTPX_SUBAGENT_PROMPT,
+        "tools": [_RECON_TOOLS['httpx']],
+    },
+    {
+        "name": "nmap",
+        "description": "Network scanning specialist using Nmap tool",
+        "system_prompt": _NMAP_SUBAGENT_PROMPT,
+        "tools": [_RECON_TOOLS['nmap']],
+    },
+    {
+        "name": "ffuf",
+        "description": "Directory and file brute-forcing specialist using ffuf tool",
+        "system_prompt": _FFUF_SUBAGENT_PROMPT,
+        "tools": [_RECON_TOOLS['ffuf']],
+    },
+    {
+        "name": "wafw00f",
+        "description": "WAF detection specialist using wafw00f tool",
+        "system_prompt": _WAFW00F_SUBAGENT_PROMPT,
+        "tools": [_RECON_TOOLS['wafw00f']],
+    },
+)
+
+# Final report sub-agent; its model is set per coordinator
+_REPORT_SUB_AGENT: SubAgent = {
+    "name": "report",
+    "description": "Report analyst that aggregates all recon results into the final report",
+    "system_prompt": _REPORT_SUBAGENT_PROMPT,
+    "tools": [],
+}
+
+
+# System prompts of the standalone sub-agents; each uses the tool of the same
+# name from _RECON_TOOLS
+_SUBAGENT_SYSTEM_PROMPTS = MappingProxyType({
+    'subfinder': _SUBFINDER_SYSTEM_PROMPT,
+    'httpx': _HTTPX_SYSTEM_PROMPT,
+    'nmap': _NMAP_SYSTEM_PROMPT,
+})
+
+
+def _make_subagent(
+    name: str,
+    backend: NexusBackend,
+    model: Optional[LLMLike] = None
+) -> Any:
+    """
+    Create a single-tool recon sub-agent (DeepAgent).
+
+    Args:
+        name: Sub-agent name (key of _SUBAGENT_SYSTEM_PROMPTS)
+        backend: NexusBackend instance
+        model: LLM model (default: GPT-4o-mini via OpenRouter)
+
+    Returns:
+        DeepAgent configured with the sub-agent's tool and system prompt
+    """
+    if model is None:
+        model = _get_mini_model()
+
+    from deepagents import create_deep_agent
+
+    return create_deep_agent(
+        model=model,
+        backend=backend,
+        system_prompt=_SUBAGENT_SYSTEM_PROMPTS[name],
+        tools=[_get_tools()[name]]
+    )
+
+
+def create_subfinder_subagent(
+    backend: NexusBackend,
+    model: Optional[LLMLike] = None
+) -> Any:
+    """Create Subfinder sub-agent (DeepAgent) for subdomain discovery."""
+    return _make_subagent("subfinder", backend, model)
+
+
+def create_httpx_subagent(
+    backend: NexusBackend,
+    model: Optional[LLMLike] = None
+) -> Any:
+    """Create HTTPx sub-agent (DeepAgent) for probing live HTTP/HTTPS services."""
+    return _make_subagent("httpx", backend, model)
+
+
+def create_nmap_subagent(
+    backend: NexusBackend,
+    model: Optional[LLMLike] = None
+) -> Any:
+    """Create Nmap sub-agent (DeepAgent) for port and service scanning."""
+    return _make_subagent("nmap", backend, model)
+
+
+def create_recon_coordinator(
+    scan_id: str,
+    team_id: str,
+    backend: NexusBackend,
+    model: Optional[LLMLike] = None,
+    report_model: Optional[LLMLike] = None
+) -> Any:
+    """
+    Create Recon Coordinator (orchestrator DeepAgent).
+
+    This is the main coordinator agent that orchestrates the complete
+    reconnaissance workflow by spawning and coordinating sub-agents.
+
+    Routing between sub-agents is simple classification work, so the
+    coordinator and tool sub-agents run on the fast model; only the final
+    report, which needs long-form analysis, runs on Sonnet.
+
+    Args:
+        scan_id: Scan identifier
+        team_id: Team identifier
+        backend: NexusBackend instance
+        model: Router LLM for the coordinator and tool sub-agents
+            (default: GPT-4o-mini via OpenRouter)
+        report_model: LLM for the final report sub-agent
+            (default: Claude Sonnet 4 via OpenRouter)
+
+    Returns:
+        DeepAgent configured as reconnaissance coordinator
+
+    Example:
+        >>> from config.nexus_config import get_nexus_fs
+        >>> from agents.backends.nexus_backend import NexusBackend
+        >>>
+        >>> backend = NexusBackend("scan-123", "team-abc", get_nexus_fs())
+        >>> coordinator = create_recon_coordinator("scan-123", "team-abc", backend)
+        >>> result = await coordinator.ainvoke({
+        ...     "messages": [{"role": "user", "content": "Scan example.com"}]
+        ... })
+    """
+    from deepagents import create_deep_agent
+
+    use_model_pool = model is None
+    if model is None:
+        model = _get_mini_model()
+    if report_model is None:
+        report_model = _get_sonnet_model()
+
+    sub_agents: List[SubAgent] = list(_SUB_AGENTS)
+
+    # Spread sub-agents over the configured API keys so parallel task()
+    # calls are not all capped by one key's rate limit
+    if use_model_pool and len(_get_api_keys()) > 1:
+        sub_agents = [{**spec, "model": _get_mini_model()} for spec in sub_agents]
+
+    sub_agents.append({**_REPORT_SUB_AGENT, "model": report_model})
 
     # Coordinator uses built-in subagents support in create_deep_agent
     # and built-in file tools to read/write results
     return create_deep_agent(
         model=model,
         backend=backend,
-        system_prompt=system_prompt,
+        system_prompt=_COORDINATOR_SYSTEM_PROMPT,
         subagents=sub_agents
     )
 
 
+# ============================================================================
+# Deterministic Recon Pipeline (parallel fan-out)
+# ============================================================================
+#
+# The coordinator above leaves stage ordering to the LLM, which runs the
+# wafw00f, ffuf and nmap stages one after another even though they only
+# depend on the httpx output. The pipeline below wires the stages as an
+# explicit StateGraph and fans those three out with Send, so wall time for
+# that stage is max(wafw00f, ffuf, nmap) instead of their sum.
+#
+#   subfinder -> httpx -> {wafw00f, ffuf (per host), nmap} -> report
+# ============================================================================
+
+# Above this many subdomains, httpx only probes the highest-value ones
+PRIORITIZE_SUBDOMAINS_ABOVE = 100
+MAX_HTTPX_TARGETS = 30
+
+# Subdomain keywords that mark high-value targets for prioritization
+HIGH_VALUE_SUBDOMAIN_PATTERN = re.compile(
+    r"admin|api|vpn|staging|dev|db|mysql|postgres|redis", re.IGNORECASE
+)
+
+# Upper bound on hosts brute-forced by ffuf (one ffuf run per host)
+MAX_FFUF_TARGETS = 5
+
+# Ports that are flagged HIGH RISK when exposed
+DATABASE_PORTS = frozenset({1433, 1521, 3306, 5432, 6379, 9200, 11211, 27017})
+
+# Subdomain keywords that indicate admin/staging surfaces (MEDIUM RISK)
+SENSITIVE_SUBDOMAIN_KEYWORDS = ("admin", "staging", "dev", "internal", "vpn")
+
+
+class ReconState(TypedDict, total=False):
+    """State flowing through the recon pipeline graph."""
+    domain: str
+    subdomains: List[str]
+    live_hosts: List[Dict[str, Any]]
+    # Tool results, appended by each stage (concurrent branches merge here)
+    results: Annotated[List[Dict[str, Any]], operator.add]
+    report: Dict[str, Any]
+
+
+async def _run_tool(
+    name: str, tool: Any, args: Dict[str, Any], config: RunnableConfig
+) -> Dict[str, Any]:
+    """
+    Invoke a recon tool and decode its JSON result, tagged with the tool name.
+
+    The result is also pushed to the "custom" stream as soon as the tool
+    returns, so astream() consumers see each stage without waiting for the
+    rest of the graph.
+    """
+    result = {"tool": name, **orjson.loads(await tool.ainvoke(args, config=config))}
+    get_stream_writer()({"result": result})
+    return result
+
+
+async def _subfinder_node(state: ReconState, config: RunnableConfig) -> Dict[str, Any]:
+    result = await _run_tool("subfinder", run_subfinder, {"domain": state["domain"]}, config)
+    return {"subdomains": result.get("subdomains", []), "results": [result]}
+
+
+def _select_high_value_subdomains(
+    subdomains: Iterable[str], top_n: int = MAX_HTTPX_TARGETS
+) -> List[str]:
+    """
+    Select the `top_n` most interesting subdomains in a single pass.
+
+    Subdomains are ranked by how many high-value keywords (admin, api, vpn,
+    db, ...) they contain; ties keep discovery order, so with few keyword
+    hits the remaining slots go to the first subdomains found. Uses a
+    bounded heap, so memory stays O(top_n) however large the zone is.
+    """
+    return heapq.nsmallest(
+        top_n,
+        subdomains,
+        key=lambda name: -len(HIGH_VALUE_SUBDOMAIN_PATTERN.findall(name)),
+    )
+
+
+async def _httpx_node(state: ReconState, config: RunnableConfig) -> Dict[str, Any]:
+    targets = state.get("subdomains") or [state["domain"]]
+    if len(targets) > PRIORITIZE_SUBDOMAINS_ABOVE:
+        targets = _select_high_value_subdomains(targets)
+    result = await _run_tool("httpx", run_httpx, {"targets": targets}, config)
+    return {"live_hosts": result.get("live_hosts", []), "results": [result]}
+
+
+async def _wafw00f_node(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+    result = await _run_tool("wafw00f", run_wafw00f, {"targets": state["targets"]}, config)
+    return {"results": [result]}
+
+
+async def _ffuf_node(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+    # ffuf takes a single URL, so brute-force all hosts concurrently
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(_run_tool("ffuf", run_ffuf, {"target_url": url}, config))
+            for url in state["targets"]
+        ]
+    return {"results": [task.result() for task in tasks]}
+
+
+async def _nmap_node(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+    result = await _run_tool("nmap", run_nmap, {"targets": state["targets"]}, config)
+    return {"results": [result]}
+
+
+def _fan_out_live_hosts(state: ReconState) -> List[Send] | str:
+    """Dispatch wafw00f, ffuf and nmap concurrently over the live hosts."""
+    urls = [h["url"] for h in state.get("live_hosts", []) if h.get("url")]
+    if not urls:
+        return "report"
+
+    hostnames = sorted({urlsplit(url).hostname for url in urls} - {None})
+    return [
+        Send("wafw00f", {"targets": urls}),
+        Send("ffuf", {"targets": urls[:MAX_FFUF_TARGETS]}),
+        Send("nmap", {"targets": hostnames}),
+    ]
+
+
+def build_recon_report(state: ReconState) -> Dict[str, Any]:
+    """
+    Aggregate pipeline results into the final report.
+
+    Applies the coordinator's risk rules deterministically: exposed database
+    ports and reachable admin paths are HIGH RISK; admin/staging subdomains
+    and detected WAFs are noted as MEDIUM RISK.
+    """
+    high_risk: List[str] = []
+    medium_risk: List[str] = []
+    total_open_ports = 0
+    hidden_paths_found = 0
+
+    for result in state.get("results", []):
+        if not result.get("success"):
+            continue
+
+        if result["tool"] == "nmap":
+            for host in result.get("hosts", []):
+                name = (host.get("hostnames") or [host.get("ip", "unknown")])[0]
+                for port in host.get("ports", []):
+                    total_open_ports += 1
+                    if port.get("port") in DATABASE_PORTS:
+                        high_risk.append(
+                            f"Database port {port['port']} ({port.get('service', 'unknown')}) exposed on {name}"
+                        )
+
+        elif result["tool"] == "ffuf":
+            # findings is only a preview; count and admin_paths cover the whole run
+            hidden_paths_found += result["count"]
+            for url in result.get("admin_paths", []):
+                high_risk.append(f"Hidden admin path reachable at {url}")
+
+        elif result["tool"] == "wafw00f":
+            for finding in result.get("findings", []):
+                if finding.get("waf_detected"):
+                    medium_risk.append(
+                        f"WAF detected on {finding['target']}: {finding.get('waf_name') or 'unknown'}"
+                    )
+
+    for subdomain in state.get("subdomains", []):
+        if any(keyword in subdomain.lower() for keyword in SENSITIVE_SUBDOMAIN_KEYWORDS):
+            medium_risk.append(f"Sensitive subdomain exposed: {subdomain}")
+
+    return {
+        "target": state.get("domain"),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "summary": {
+            "total_subdomains": len(state.get("subdomains", [])),
+            "live_hosts": len(state.get("live_hosts", [])),
+            "total_open_ports": total_open_ports,
+            "hidden_paths_found": hidden_paths_found,
+        },
+        "high_risk_findings": high_risk,
+        "medium_risk_findings": medium_risk,
+        "errors": [
+            {"tool": r["tool"], "error": r.get("error")}
+            for r in state.get("results", [])
+            if not r.get("success")
+        ],
+    }
+
+
+def _write_json(backend: NexusBackend, path: str, data: Dict[str, Any]) -> None:
+    """Write a JSON document to the workspace, replacing any existing file."""
+    # orjson serializes straight to UTF-8; the backend protocol takes str
+    content = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    write_result = backend.write(path, content)
+
+    if write_result.error and "already exists" in write_result.error:
+        old_content = backend.read(path)
+        old_lines = [line.split("→", 1)[1] if "→" in line else line
+                     for line in old_content.split("\n")]
+        write_result = backend.edit(path, "\n".join(old_lines), content)
+
+    if write_result.error:
+        logger.error(f"Failed to write {path}: {write_result.error}")
+
+
+async def _report_node(state: ReconState, config: RunnableConfig) -> Dict[str, Any]:
+    # Backend setup and the write hit Nexus storage; keep them off the event loop
+    scan_id, _, backend = await asyncio.to_thread(_get_backend_from_config, config)
+    report = {"scan_id": scan_id, **build_recon_report(state)}
+    # Stream the report before the storage round-trip so it reaches the caller first
+    get_stream_writer()({"report": report})
+    await asyncio.to_thread(_write_json, backend, "/recon/final_report.json", report)
+    return {"report": report}
+
+
+def create_recon_pipeline() -> Any:
+    """
+    Create the deterministic recon pipeline graph.
+
+    Unlike create_recon_coordinator(), stage ordering is fixed in the graph
+    rather than decided by an LLM, and the stages that only depend on httpx
+    output (wafw00f, ffuf, nmap) run concurrently. Nodes are async: the
+    blocking sandbox tools are awaited via ainvoke, so the pipeline must be
+    run with ainvoke()/astream(). With stream_mode="custom", each tool result
+    and the final report are streamed as soon as they are available.
+
+    Zones with more than PRIORITIZE_SUBDOMAINS_ABOVE subdomains are narrowed
+    to the MAX_HTTPX_TARGETS highest-value names before probing, the same
+    rule the coordinator prompt gives the LLM.
+
+    The graph holds no per-scan state: tools resolve their workspace from the
+    thread_id in the RunnableConfig at call time.
+
+    Returns:
+        Compiled LangGraph StateGraph
+
+    Example:
+        >>> pipeline = create_recon_pipeline()
+        >>> state = await pipeline.ainvoke(
+        ...     {"domain": "example.com"},
+        ...     config={"configurable": {"thread_id": "scan-123"}},
+        ... )
+        >>> state["report"]["summary"]
+    """
+    graph = StateGraph(ReconState)
+
+    graph.add_node("subfinder", _subfinder_node)
+    graph.add_node("httpx", _httpx_node)
+    graph.add_node("wafw00f", _wafw00f_node)
+    graph.add_node("ffuf", _ffuf_node)
+    graph.add_node("nmap", _nmap_node)
+    graph.add_node("report", _report_node)
+
+    graph.add_edge(START, "subfinder")
+    graph.add_edge("subfinder", "httpx")
+    graph.add_conditional_edges("httpx", _fan_out_live_hosts, ["wafw00f", "ffuf", "nmap", "report"])
+    graph.add_edge("wafw00f", "report")
+    graph.add_edge("ffuf", "report")
+    graph.add_edge("nmap", "report")
+    graph.add_edge("report", END)
+
+    return graph.compile()
+
+
 # ============================================================================
 # LangGraph Server Export (for LangGraph Studio / langgraph dev)
 # ============================================================================
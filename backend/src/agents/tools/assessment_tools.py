@@ -12,49 +12,168 @@ Per-Thread Isolation:
 - Results are isolated per-run automatically
 """
 
-import json
+import asyncio
+import atexit
+import hashlib
 import logging
-from typing import List, Optional
-
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from operator import attrgetter
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import orjson
 from langchain_core.tools import tool
 from langchain_core.runnables import RunnableConfig
-
-from src.agents.assessment.nuclei_agent import NucleiAgent, SeverityLevel
-from src.agents.assessment.sqlmap_agent import SQLMapAgent
-from src.agents.assessment.xsstrike_agent import XSStrikeAgent
-from src.agents.assessment.testssl_agent import TestsslAgent
-from src.agents.backends.nexus_backend import NexusBackend
-from src.config.nexus_config import get_nexus_fs
+from pydantic import BaseModel, TypeAdapter
+
+from src.agents.assessment.nuclei_agent import NucleiAgent, NucleiFinding, SeverityLevel
+from src.agents.assessment.sqlmap_agent import SQLMapAgent, SQLMapFinding
+from src.agents.assessment.xsstrike_agent import XSSFinding, XSStrikeAgent
+from src.agents.assessment.testssl_agent import (
+    CertificateInfo,
+    TestsslAgent,
+    TLSVulnerability,
+)
+from src.agents.backends.thread_backend import (
+    DEFAULT_TEAM_ID,
+    get_thread_backend as _get_thread_backend,
+    thread_id_from_config,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def _get_backend_from_config(config: RunnableConfig) -> tuple[str, str, NexusBackend]:
+class NucleiResult(BaseModel):
+    """Result returned by run_nuclei."""
+    success: bool
+    targets_count: int
+    findings_count: int
+    severity_filter: List[str]
+    severity_counts: Dict[str, int]
+    findings: List[NucleiFinding]
+    storage_path: str
+
+
+class SQLMapResult(BaseModel):
+    """Result returned by run_sqlmap."""
+    success: bool
+    target_url: str
+    vulnerable: bool
+    findings_count: int
+    dbms: Optional[str]
+    databases: List[str]
+    findings: List[SQLMapFinding]
+    storage_path: str
+    note: str
+
+
+class XSStrikeResult(BaseModel):
+    """Result returned by run_xsstrike."""
+    success: bool
+    target_url: str
+    vulnerable: bool
+    vulnerable_count: int
+    xss_types: Dict[str, int]
+    findings: List[XSSFinding]
+    storage_path: str
+
+
+class TestsslResult(BaseModel):
+    """Result returned by run_testssl."""
+    success: bool
+    target: str
+    overall_rating: str
+    protocols: Dict[str, bool]
+    vulnerability_count: int
+    vulnerability_summary: Dict[str, int]
+    vulnerabilities: List[TLSVulnerability]
+    certificate: Optional[CertificateInfo]
+    storage_path: str
+
+
+# Serializers built once so results go straight from models to JSON in pydantic-core
+_NUCLEI_RESULT_ADAPTER = TypeAdapter(NucleiResult)
+_SQLMAP_RESULT_ADAPTER = TypeAdapter(SQLMapResult)
+_XSSTRIKE_RESULT_ADAPTER = TypeAdapter(XSStrikeResult)
+_TESTSSL_RESULT_ADAPTER = TypeAdapter(TestsslResult)
+
+_SEVERITY_ORDER = tuple(level.value for level in SeverityLevel)
+_ALLOWED_SEVERITIES = frozenset(_SEVERITY_ORDER)
+_DEFAULT_SEVERITIES = ("critical", "high", "medium")
+
+# Pre-serialized results for scans that find nothing (the common case), filled
+# in with the request's own values; layouts match the result models above
+_EMPTY_NUCLEI_TEMPLATE = (
+    '{"success":true,"targets_count":%d,"findings_count":0,"severity_filter":%s,'
+    '"severity_counts":{},"findings":[],"storage_path":"/assessment/nuclei/findings.json"}'
+)
+_EMPTY_SQLMAP_TEMPLATE = (
+    '{"success":true,"target_url":%s,"vulnerable":false,"findings_count":0,"dbms":null,'
+    '"databases":[],"findings":[],"storage_path":"/assessment/sqlmap/findings.json",'
+    '"note":"For data extraction, use request_approval tool first"}'
+)
+_EMPTY_XSSTRIKE_TEMPLATE = (
+    '{"success":true,"target_url":%s,"vulnerable":false,"vulnerable_count":0,'
+    '"xss_types":{},"findings":[],"storage_path":%s}'
+)
+
+# Error results, filled in with the JSON-encoded error and request values
+_NUCLEI_ERROR_TEMPLATE = '{"success":false,"error":%s,"targets_count":%d}'
+_URL_ERROR_TEMPLATE = '{"success":false,"error":%s,"target_url":%s,"vulnerable":false}'
+_TESTSSL_ERROR_TEMPLATE = '{"success":false,"error":%s,"target":%s}'
+
+
+# Sandbox teardown takes seconds and the findings are already stored by then,
+# so it runs off the tool's return path; pending teardowns finish before exit
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sandbox-cleanup")
+atexit.register(_CLEANUP_POOL.shutdown, wait=True)
+
+
+# Set by run_assessment_suite so scanner tools hand their result files back
+# for a single batched write instead of writing them one by one
+_PENDING_WRITES: ContextVar[Optional[Dict[str, str]]] = ContextVar("pending_writes", default=None)
+
+
+def _per_target_path(path: str, target: str) -> str:
     """
-    Extract thread_id from config and create backend.
-
-    Args:
-        config: RunnableConfig from LangGraph runtime
+    Move a result file into a per-target directory.
 
-    Returns:
-        Tuple of (scan_id, team_id, backend)
+    run_assessment_suite runs XSStrike once per URL and testssl once per
+    host, and the agents all name their files alike, so each run's files go
+    under a directory named after its target:
+    /assessment/xsstrike/<target>/findings.json.
     """
-    # Extract thread_id from LangGraph config
-    configurable = config.get("configurable", {})
-    thread_id = configurable.get("thread_id", "default-thread")
+    # Readable, but hashed too so targets differing only in punctuation don't collide
+    slug = re.sub(r"[^A-Za-z0-9.-]+", "_", target).strip("_")[:64]
+    digest = hashlib.sha1(target.encode()).hexdigest()[:8]
+    directory, name = path.rsplit("/", 1)
+    return f"{directory}/{slug}-{digest}/{name}"
+
 
-    # Use thread_id as scan_id for isolation
-    scan_id = thread_id
-    team_id = "default-team"
+def _cleanup_in_background(agent: Any) -> None:
+    """Schedule an agent's sandbox cleanup without waiting for it."""
+    _CLEANUP_POOL.submit(agent.cleanup)
 
-    # Create backend for this thread
-    nexus_fs = get_nexus_fs()
-    backend = NexusBackend(scan_id, team_id, nexus_fs)
 
-    logger.info(f"🔧 Created backend for thread: {thread_id[:12]}...")
-    logger.info(f"   Storage: gs://bucket/{team_id}/{scan_id}/")
+class _LazyJoin:
+    """Comma-join values only if a log record is actually emitted."""
 
-    return scan_id, team_id, backend
+    __slots__ = ("values", "fmt")
+
+    def __init__(self, values: Any, fmt: str = "%s") -> None:
+        self.values = values
+        self.fmt = fmt
+
+    def __str__(self) -> str:
+        return ", ".join(self.fmt % value for value in self.values)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a plain payload to compact JSON (it goes into an LLM context)."""
+    return orjson.dumps(obj).decode()
 
 
 @tool
@@ -91,65 +210,87 @@ def run_nuclei(
         )
         # Returns: '{"findings_count": 5, "findings": [...], "severity_counts": {...}}'
     """
-    # Extract thread_id and create backend
-    scan_id, team_id, backend = _get_backend_from_config(config)
+    return _run_nuclei(
+        thread_id_from_config(config),
+        targets=targets,
+        severity_filter=severity_filter,
+        rate_limit=rate_limit,
+        timeout=timeout,
+    )
 
-    # Default severity filter
-    if severity_filter is None:
-        severity_filter = ["critical", "high", "medium"]
+
+def _run_nuclei(
+    thread_id: str,
+    targets: List[str],
+    severity_filter: Optional[List[str]] = None,
+    rate_limit: int = 150,
+    timeout: int = 1800,
+) -> str:
+    """Run Nuclei for a thread (thread_id doubles as scan_id for isolation)."""
+    backend = _get_thread_backend(thread_id)
+    pending_writes = _PENDING_WRITES.get()
 
     try:
+        severities = (
+            tuple(s.lower() for s in severity_filter) if severity_filter else _DEFAULT_SEVERITIES
+        )
+        invalid = set(severities) - _ALLOWED_SEVERITIES
+        if invalid:
+            raise ValueError(f"Invalid severity filter: {', '.join(sorted(invalid))}")
+
         # Create and execute Nuclei agent
         agent = NucleiAgent(
-            scan_id=scan_id,
-            team_id=team_id,
+            scan_id=thread_id,
+            team_id=DEFAULT_TEAM_ID,
             nexus_backend=backend
         )
 
         findings = agent.execute(
             targets=targets,
-            severity_filter=severity_filter,
+            severity_filter=severities,
             rate_limit=rate_limit,
             timeout=timeout,
-            update_templates=True
+            update_templates=True,
+            defer_write=pending_writes is not None
         )
 
-        agent.cleanup()
+        _cleanup_in_background(agent)
+        if pending_writes is not None:
+            # Nuclei runs once per suite, so its files keep their usual paths
+            pending_writes.update(agent.pending_writes)
 
-        # Convert findings to dict for JSON serialization
-        findings_dict = [f.model_dump() for f in findings]
+        if not findings:
+            logger.info("Nuclei found no vulnerabilities in %d targets", len(targets))
+            return _EMPTY_NUCLEI_TEMPLATE % (len(targets), _dumps(severities))
 
         # Group by severity
-        severity_counts = {}
-        for severity in ["critical", "high", "medium", "low", "info"]:
-            count = sum(1 for f in findings if f.severity.lower() == severity)
-            if count > 0:
-                severity_counts[severity] = count
+        counts = Counter(map(str.lower, map(attrgetter("severity"), findings)))
+        severity_counts = {
+            severity: counts[severity]
+            for severity in _SEVERITY_ORDER
+            if counts[severity]
+        }
 
         # Return structured result
-        result = {
-            "success": True,
-            "targets_count": len(targets),
-            "findings_count": len(findings),
-            "severity_filter": severity_filter,
-            "severity_counts": severity_counts,
-            "findings": findings_dict,
-            "storage_path": "/assessment/nuclei/findings.json"
-        }
+        result = NucleiResult(
+            success=True,
+            targets_count=len(targets),
+            findings_count=len(findings),
+            severity_filter=severities,
+            severity_counts=severity_counts,
+            findings=findings,
+            storage_path="/assessment/nuclei/findings.json"
+        )
 
         logger.info(
-            f"Nuclei found {len(findings)} vulnerabilities "
-            f"({', '.join(str(count) for count in severity_counts.values())} by severity)"
+            "Nuclei found %d vulnerabilities (%s by severity)",
+            len(findings), _LazyJoin(severity_counts.values()),
         )
-        return json.dumps(result, indent=2)
+        return _NUCLEI_RESULT_ADAPTER.dump_json(result).decode()
 
     except Exception as e:
-        logger.error(f"Nuclei tool failed: {e}")
-        return json.dumps({
-            "success": False,
-            "error": str(e),
-            "targets_count": len(targets)
-        })
+        logger.error("Nuclei tool failed: %s", e)
+        return _NUCLEI_ERROR_TEMPLATE % (_dumps(str(e)), len(targets))
 
 
 @tool
@@ -196,14 +337,37 @@ def run_sqlmap(
         )
         # Returns: '{"vulnerable": true, "findings": [...], "databases": [...]}'
     """
-    # Extract thread_id and create backend
-    scan_id, team_id, backend = _get_backend_from_config(config)
+    return _run_sqlmap(
+        thread_id_from_config(config),
+        target_url=target_url,
+        data=data,
+        cookie=cookie,
+        level=level,
+        risk=risk,
+        timeout=timeout,
+        enumerate_dbs=enumerate_dbs,
+    )
+
+
+def _run_sqlmap(
+    thread_id: str,
+    target_url: str,
+    data: Optional[str] = None,
+    cookie: Optional[str] = None,
+    level: int = 2,
+    risk: int = 1,
+    timeout: int = 3600,
+    enumerate_dbs: bool = True,
+) -> str:
+    """Run SQLMap for a thread (thread_id doubles as scan_id for isolation)."""
+    backend = _get_thread_backend(thread_id)
+    pending_writes = _PENDING_WRITES.get()
 
     try:
         # Create and execute SQLMap agent
         agent = SQLMapAgent(
-            scan_id=scan_id,
-            team_id=team_id,
+            scan_id=thread_id,
+            team_id=DEFAULT_TEAM_ID,
             nexus_backend=backend
         )
 
@@ -216,54 +380,51 @@ def run_sqlmap(
             timeout=timeout,
             enumerate_dbs=enumerate_dbs,
             enumerate_tables=False,  # Requires HITL approval
-            batch=True
+            batch=True,
+            defer_write=pending_writes is not None
         )
 
-        agent.cleanup()
+        _cleanup_in_background(agent)
+        if pending_writes is not None:
+            pending_writes.update(agent.pending_writes)
 
-        # Convert findings to dict for JSON serialization
-        findings_dict = [f.model_dump() for f in findings]
+        if not findings:
+            logger.info("SQLMap found no injection points in %s", target_url)
+            return _EMPTY_SQLMAP_TEMPLATE % _dumps(target_url)
 
         # Extract database info
-        databases = []
+        databases: set[str] = set()
         dbms = None
         for finding in findings:
             if finding.databases:
-                databases.extend(finding.databases)
+                databases.update(finding.databases)
             if finding.dbms:
+                if dbms and finding.dbms != dbms:
+                    logger.warning("SQLMap reported conflicting DBMS: %s vs %s", dbms, finding.dbms)
                 dbms = finding.dbms
 
         # Return structured result
-        result = {
-            "success": True,
-            "target_url": target_url,
-            "vulnerable": len(findings) > 0,
-            "findings_count": len(findings),
-            "dbms": dbms,
-            "databases": list(set(databases)),
-            "findings": findings_dict,
-            "storage_path": "/assessment/sqlmap/findings.json",
-            "note": "For data extraction, use request_approval tool first"
-        }
+        result = SQLMapResult(
+            success=True,
+            target_url=target_url,
+            vulnerable=True,
+            findings_count=len(findings),
+            dbms=dbms,
+            databases=sorted(databases),
+            findings=findings,
+            storage_path="/assessment/sqlmap/findings.json",
+            note="For data extraction, use request_approval tool first"
+        )
 
-        if findings:
-            logger.info(
-                f"SQLMap found {len(findings)} injection points "
-                f"(DBMS: {dbms or 'unknown'})"
-            )
-        else:
-            logger.info(f"SQLMap found no injection points in {target_url}")
+        logger.info(
+            "SQLMap found %d injection points (DBMS: %s)", len(findings), dbms or "unknown"
+        )
 
-        return json.dumps(result, indent=2)
+        return _SQLMAP_RESULT_ADAPTER.dump_json(result).decode()
 
     except Exception as e:
-        logger.error(f"SQLMap tool failed: {e}")
-        return json.dumps({
-            "success": False,
-            "error": str(e),
-            "target_url": target_url,
-            "vulnerable": False
-        })
+        logger.error("SQLMap tool failed: %s", e)
+        return _URL_ERROR_TEMPLATE % (_dumps(str(e)), _dumps(target_url))
 
 
 @tool
@@ -306,14 +467,33 @@ def run_xsstrike(
         )
         # Returns: '{"vulnerable_count": 1, "findings": [{"parameter": "q", "xss_type": "reflected"}]}'
     """
-    # Extract thread_id and create backend
-    scan_id, team_id, backend = _get_backend_from_config(config)
+    return _run_xsstrike(
+        thread_id_from_config(config),
+        target_url=target_url,
+        data=data,
+        crawl=crawl,
+        skip_dom=skip_dom,
+        timeout=timeout,
+    )
+
+
+def _run_xsstrike(
+    thread_id: str,
+    target_url: str,
+    data: Optional[str] = None,
+    crawl: bool = False,
+    skip_dom: bool = False,
+    timeout: int = 600,
+) -> str:
+    """Run XSStrike for a thread (thread_id doubles as scan_id for isolation)."""
+    backend = _get_thread_backend(thread_id)
+    pending_writes = _PENDING_WRITES.get()
 
     try:
         # Create and execute XSStrike agent
         agent = XSStrikeAgent(
-            scan_id=scan_id,
-            team_id=team_id,
+            scan_id=thread_id,
+            team_id=DEFAULT_TEAM_ID,
             nexus_backend=backend
         )
 
@@ -322,47 +502,51 @@ def run_xsstrike(
             data=data,
             crawl=crawl,
             skip_dom=skip_dom,
-            timeout=timeout
+            timeout=timeout,
+            defer_write=pending_writes is not None
         )
 
-        agent.cleanup()
+        _cleanup_in_background(agent)
+        storage_path = "/assessment/xsstrike/findings.json"
+        if pending_writes is not None:
+            pending_writes.update(
+                (_per_target_path(path, target_url), content)
+                for path, content in agent.pending_writes.items()
+            )
+            storage_path = _per_target_path(storage_path, target_url)
+
+        if not findings:
+            logger.info("XSStrike found no XSS vulnerabilities in %s", target_url)
+            return _EMPTY_XSSTRIKE_TEMPLATE % (_dumps(target_url), _dumps(storage_path))
 
         # Summarize findings
         vuln_findings = [f for f in findings if f.vulnerable]
-        xss_types = {}
-        for f in vuln_findings:
-            if f.xss_type:
-                xss_types[f.xss_type] = xss_types.get(f.xss_type, 0) + 1
+        xss_types = Counter(f.xss_type for f in vuln_findings if f.xss_type)
 
         # Return structured result
-        result = {
-            "success": True,
-            "target_url": target_url,
-            "vulnerable": len(vuln_findings) > 0,
-            "vulnerable_count": len(vuln_findings),
-            "xss_types": xss_types,
-            "findings": [f.model_dump() for f in findings],
-            "storage_path": "/assessment/xsstrike/findings.json"
-        }
+        result = XSStrikeResult(
+            success=True,
+            target_url=target_url,
+            vulnerable=len(vuln_findings) > 0,
+            vulnerable_count=len(vuln_findings),
+            xss_types=xss_types,
+            findings=findings,
+            storage_path=storage_path,
+        )
 
         if vuln_findings:
             logger.info(
-                f"XSStrike found {len(vuln_findings)} XSS vulnerabilities "
-                f"({', '.join(f'{k}: {v}' for k, v in xss_types.items())})"
+                "XSStrike found %d XSS vulnerabilities (%s)",
+                len(vuln_findings), _LazyJoin(xss_types.items(), "%s: %s"),
             )
         else:
-            logger.info(f"XSStrike found no XSS vulnerabilities in {target_url}")
+            logger.info("XSStrike found no XSS vulnerabilities in %s", target_url)
 
-        return json.dumps(result, indent=2)
+        return _XSSTRIKE_RESULT_ADAPTER.dump_json(result).decode()
 
     except Exception as e:
-        logger.error(f"XSStrike tool failed: {e}")
-        return json.dumps({
-            "success": False,
-            "error": str(e),
-            "target_url": target_url,
-            "vulnerable": False
-        })
+        logger.error("XSStrike tool failed: %s", e)
+        return _URL_ERROR_TEMPLATE % (_dumps(str(e)), _dumps(target_url))
 
 
 @tool
@@ -402,14 +586,31 @@ def run_testssl(
         result = run_testssl(target="example.com")
         # Returns: '{"overall_rating": "A", "vulnerabilities": [], "protocols": {...}}'
     """
-    # Extract thread_id and create backend
-    scan_id, team_id, backend = _get_backend_from_config(config)
+    return _run_testssl(
+        thread_id_from_config(config),
+        target=target,
+        port=port,
+        check_vulnerabilities=check_vulnerabilities,
+        timeout=timeout,
+    )
+
+
+def _run_testssl(
+    thread_id: str,
+    target: str,
+    port: int = 443,
+    check_vulnerabilities: bool = True,
+    timeout: int = 600,
+) -> str:
+    """Run testssl for a thread (thread_id doubles as scan_id for isolation)."""
+    backend = _get_thread_backend(thread_id)
+    pending_writes = _PENDING_WRITES.get()
 
     try:
         # Create and execute testssl agent
         agent = TestsslAgent(
-            scan_id=scan_id,
-            team_id=team_id,
+            scan_id=thread_id,
+            team_id=DEFAULT_TEAM_ID,
             nexus_backend=backend
         )
 
@@ -417,41 +618,132 @@ def run_testssl(
             target=target,
             port=port,
             check_vulnerabilities=check_vulnerabilities,
-            timeout=timeout
+            timeout=timeout,
+            defer_write=pending_writes is not None
         )
 
-        agent.cleanup()
+        _cleanup_in_background(agent)
+        storage_path = "/assessment/testssl/findings.json"
+        if pending_writes is not None:
+            pending_writes.update(
+                (_per_target_path(path, target), content)
+                for path, content in agent.pending_writes.items()
+            )
+            storage_path = _per_target_path(storage_path, target)
 
         # Summarize vulnerabilities
-        vuln_counts = {}
-        for v in finding.vulnerabilities:
-            vuln_counts[v.severity] = vuln_counts.get(v.severity, 0) + 1
+        vuln_counts = Counter(map(attrgetter("severity"), finding.vulnerabilities))
 
         # Return structured result
-        result = {
-            "success": True,
-            "target": finding.target,
-            "overall_rating": finding.overall_rating,
-            "protocols": finding.protocols,
-            "vulnerability_count": len(finding.vulnerabilities),
-            "vulnerability_summary": vuln_counts,
-            "vulnerabilities": [v.model_dump() for v in finding.vulnerabilities],
-            "certificate": finding.certificate.model_dump() if finding.certificate else None,
-            "storage_path": "/assessment/testssl/findings.json"
-        }
+        result = TestsslResult(
+            success=True,
+            target=finding.target,
+            overall_rating=finding.overall_rating,
+            protocols=finding.protocols,
+            vulnerability_count=len(finding.vulnerabilities),
+            vulnerability_summary=vuln_counts,
+            vulnerabilities=finding.vulnerabilities,
+            certificate=finding.certificate,
+            storage_path=storage_path,
+        )
 
-        high_vulns = sum(1 for v in finding.vulnerabilities if v.severity in ["critical", "high"])
+        high_vulns = vuln_counts["critical"] + vuln_counts["high"]
         logger.info(
-            f"testssl completed for {target}: Rating {finding.overall_rating}, "
-            f"{high_vulns} high+ vulnerabilities"
+            "testssl completed for %s: Rating %s, %d high+ vulnerabilities",
+            target, finding.overall_rating, high_vulns,
         )
 
-        return json.dumps(result, indent=2)
+        return _TESTSSL_RESULT_ADAPTER.dump_json(result).decode()
 
     except Exception as e:
-        logger.error(f"testssl tool failed: {e}")
-        return json.dumps({
-            "success": False,
-            "error": str(e),
-            "target": target
-        })
+        logger.error("testssl tool failed: %s", e)
+        return _TESTSSL_ERROR_TEMPLATE % (_dumps(str(e)), _dumps(target))
+
+
+async def _run_concurrently(
+    calls: List[tuple[str, Any, Dict[str, Any]]], config: RunnableConfig
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Invoke (name, tool, args) calls concurrently and group decoded results by name.
+
+    The scanners block on sandbox RPCs, so each runs in its own worker thread
+    via ainvoke; a failing call is reported in place rather than cancelling
+    the others.
+    """
+    outputs = await asyncio.gather(
+        *(tool.ainvoke(args, config=config) for _, tool, args in calls),
+        return_exceptions=True,
+    )
+
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    for (name, _, _), output in zip(calls, outputs, strict=True):
+        if isinstance(output, BaseException):
+            logger.error("%s failed in assessment suite: %s", name, output)
+            output = _dumps({"success": False, "error": str(output)})
+        results.setdefault(name, []).append(orjson.loads(output))
+    return results
+
+
+@tool
+async def run_assessment_suite(
+    targets: List[str],
+    config: RunnableConfig,  # LangGraph injects this automatically
+) -> str:
+    """
+    Run Nuclei, XSStrike and testssl against targets concurrently.
+
+    A fast first pass for an assessment: Nuclei scans all targets, XSStrike
+    tests each URL and testssl checks each HTTPS host, all at the same time,
+    so the pass takes as long as the slowest scanner instead of their sum.
+    All scanners' result files are stored in the Nexus workspace in one batch,
+    XSStrike's and testssl's under a directory per target.
+
+    SQLMap is deliberately not included: it requires approval first
+    (use request_approval, then the sqlmap sub-agent).
+
+    Args:
+        targets: List of URLs to assess (e.g., ["https://example.com/search?q=test"])
+        config: Runtime configuration (auto-injected by LangGraph)
+
+    Returns:
+        JSON string with per-scanner results
+
+    Example:
+        result = await run_assessment_suite.ainvoke({"targets": ["https://example.com"]})
+        # Returns: '{"success": true, "results": {"nuclei": [...], "xsstrike": [...], "testssl": [...]}}'
+    """
+    https_hosts = sorted({
+        parts.hostname
+        for parts in map(urlsplit, targets)
+        if parts.scheme == "https" and parts.hostname
+    })
+
+    calls = [("nuclei", run_nuclei, {"targets": targets})]
+    calls += [("xsstrike", run_xsstrike, {"target_url": url}) for url in targets]
+    calls += [("testssl", run_testssl, {"target": host}) for host in https_hosts]
+
+    # Collect each scanner's result files and store them in one batch
+    pending_writes: Dict[str, str] = {}
+    token = _PENDING_WRITES.set(pending_writes)
+    try:
+        results = await _run_concurrently(calls, config)
+    finally:
+        _PENDING_WRITES.reset(token)
+
+    if pending_writes:
+        backend = _get_thread_backend(thread_id_from_config(config))
+        write_results = await asyncio.to_thread(backend.write_batch, pending_writes)
+        for write_result in write_results:
+            if write_result.error:
+                logger.error("Failed to store assessment suite results: %s", write_result.error)
+
+    logger.info(
+        "Assessment suite ran %d scans on %d targets (%s)",
+        len(calls), len(targets),
+        _LazyJoin([(name, len(outputs)) for name, outputs in results.items()], "%s: %s"),
+    )
+    return _dumps({
+        "success": True,
+        "targets_count": len(targets),
+        "results": results,
+    })
@@ -5,6 +5,10 @@ These tools wrap our existing recon agents (Subfinder, HTTPx, Nmap, ffuf)
 so they can be used by DeepAgent sub-agents.
 
 Each tool executes a security tool in E2B sandbox and stores results in Nexus.
+The tools are coroutines: sandbox creation, execution and cleanup block on
+E2B RPCs, so they run in worker threads and parallel recon stages don't
+serialize on the event loop. Being coroutine-only, they (and any graph
+that calls them) must be run with ainvoke()/astream(), not invoke().
 
 Per-Thread Isolation:
 - Tools extract thread_id from LangGraph's RunnableConfig
@@ -12,54 +16,61 @@ Per-Thread Isolation:
 - Results are isolated per-run automatically
 """
 
+import asyncio
+import heapq
 import json
 import logging
-from typing import List, Optional
+from collections import Counter
+from types import MappingProxyType
+from typing import Any, List, Literal, Mapping, Optional
 
+import orjson
 from langchain_core.tools import tool
 from langchain_core.runnables import RunnableConfig
+from pydantic import TypeAdapter
 
 from agents.recon.subfinder_agent import SubfinderAgent
 from agents.recon.httpx_agent import HTTPxAgent
 from agents.recon.nmap_agent import NmapAgent, ScanProfile
-from agents.recon.ffuf_agent import FfufAgent, WordlistType
+from agents.recon.ffuf_agent import FfufAgent, FfufFinding, WordlistType
 from agents.recon.wafw00f_agent import Wafw00fAgent
-from agents.backends.nexus_backend import NexusBackend
-from config.nexus_config import get_nexus_fs
+# Imported by its canonical path so recon and assessment tools share one backend cache
+from src.agents.backends.thread_backend import (
+    get_backend_from_config as _get_backend_from_config,
+)
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of ffuf findings returned inline (all are stored in Nexus)
+FFUF_PREVIEW_LIMIT = 50
 
-def _get_backend_from_config(config: RunnableConfig) -> tuple[str, str, NexusBackend]:
-    """
-    Extract thread_id from config and create backend.
-
-    Args:
-        config: RunnableConfig from LangGraph runtime
-
-    Returns:
-        Tuple of (scan_id, team_id, backend)
-    """
-    # Extract thread_id from LangGraph config
-    configurable = config.get("configurable", {})
-    thread_id = configurable.get("thread_id", "default-thread")
+_FFUF_FINDINGS_ADAPTER = TypeAdapter(List[FfufFinding])
 
-    # Use thread_id as scan_id for isolation
-    scan_id = thread_id
-    team_id = "default-team"
+# Tool argument names for scan profiles and wordlists. Typing the arguments
+# as Literals makes tool-call parsing reject unknown names up front.
+ProfileName = Literal["stealth", "default", "aggressive"]
+WordlistName = Literal["common", "dirb", "big", "raft-dirs"]
 
-    # Create backend for this thread
-    nexus_fs = get_nexus_fs()
-    backend = NexusBackend(scan_id, team_id, nexus_fs)
+_PROFILE_MAP: Mapping[ProfileName, ScanProfile] = MappingProxyType({
+    "stealth": ScanProfile.STEALTH,
+    "default": ScanProfile.DEFAULT,
+    "aggressive": ScanProfile.AGGRESSIVE,
+})
+_WORDLIST_MAP: Mapping[WordlistName, WordlistType] = MappingProxyType({
+    "common": WordlistType.COMMON,
+    "dirb": WordlistType.DIRB_COMMON,
+    "big": WordlistType.BIG,
+    "raft-dirs": WordlistType.RAFT_DIRS,
+})
 
-    logger.info(f"🔧 Created backend for thread: {thread_id[:12]}...")
-    logger.info(f"   Storage: gs://bucket/{team_id}/{scan_id}/")
 
-    return scan_id, team_id, backend
+def _dumps(obj: Any) -> str:
+    """Encode a tool result as indented JSON (orjson; results can be megabytes)."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 
 
 @tool
-def run_subfinder(
+async def run_subfinder(
     domain: str,
     config: RunnableConfig,  # LangGraph injects this automatically
     timeout: int = 300,
@@ -84,27 +95,29 @@ def run_subfinder(
         JSON string with discovered subdomains and metadata
 
     Example:
-        result = run_subfinder(domain="example.com")
+        result = await run_subfinder.ainvoke({"domain": "example.com"})
         # Returns: '{"domain": "example.com", "subdomains": [...], "count": 25}'
     """
     # Extract thread_id and create backend
-    scan_id, team_id, backend = _get_backend_from_config(config)
+    scan_id, team_id, backend = await asyncio.to_thread(_get_backend_from_config, config)
 
     try:
         # Create and execute Subfinder agent
-        agent = SubfinderAgent(
+        agent = await asyncio.to_thread(
+            SubfinderAgent,
             scan_id=scan_id,
             team_id=team_id,
-            nexus_backend=backend
+            nexus_backend=backend,
         )
 
-        subdomains = agent.execute(
+        subdomains = await asyncio.to_thread(
+            agent.execute,
             domain=domain,
             timeout=timeout,
             filter_wildcards=filter_wildcards
         )
 
-        agent.cleanup()
+        await asyncio.to_thread(agent.cleanup)
 
         # Return structured result
         result = {
@@ -115,11 +128,11 @@ def run_subfinder(
             "storage_path": "/recon/subfinder/subdomains.json"
         }
 
-        logger.info(f"Subfinder found {len(subdomains)} subdomains for {domain}")
-        return json.dumps(result, indent=2)
+        logger.info("Subfinder found %d subdomains for %s", len(subdomains), domain)
+        return _dumps(result)
 
     except Exception as e:
-        logger.error(f"Subfinder tool failed: {e}")
+        logger.error("Subfinder tool failed: %s", e)
         return json.dumps({
             "success": False,
             "error": str(e),
@@ -128,7 +141,7 @@ def run_subfinder(
 
 
 @tool
-def run_httpx(
+async def run_httpx(
     targets: List[str],
     config: RunnableConfig,  # LangGraph injects this automatically
     timeout: int = 300,
@@ -151,35 +164,47 @@ def run_httpx(
         timeout: Execution timeout in seconds (default: 300)
         threads: Number of concurrent threads (default: 50)
         follow_redirects: Follow HTTP redirects (default: True)
-        tech_detect: Enable technology detection (default: True)
+        tech_detect: Enable technology detection (default: True). When False,
+            targets are probed in-process on a pooled HTTP client instead of
+            the sandbox, which is much faster for large target lists
 
     Returns:
         JSON string with live host information and metadata
 
     Example:
-        result = run_httpx(targets=["www.example.com", "api.example.com"])
+        result = await run_httpx.ainvoke({"targets": ["www.example.com", "api.example.com"]})
         # Returns: '{"live_hosts_count": 2, "live_hosts": [...]}'
     """
     # Extract thread_id and create backend
-    scan_id, team_id, backend = _get_backend_from_config(config)
+    scan_id, team_id, backend = await asyncio.to_thread(_get_backend_from_config, config)
 
     try:
         # Create and execute HTTPx agent
-        agent = HTTPxAgent(
+        agent = await asyncio.to_thread(
+            HTTPxAgent,
             scan_id=scan_id,
             team_id=team_id,
-            nexus_backend=backend
-        )
-
-        live_hosts = agent.execute(
-            targets=targets,
-            timeout=timeout,
-            threads=threads,
-            follow_redirects=follow_redirects,
-            tech_detect=tech_detect
+            nexus_backend=backend,
         )
 
-        agent.cleanup()
+        if tech_detect:
+            live_hosts = await agent.execute_sharded(
+                targets=targets,
+                timeout=timeout,
+                threads=threads,
+                follow_redirects=follow_redirects,
+                tech_detect=tech_detect,
+            )
+        else:
+            # Plain liveness probing doesn't need the sandboxed binary
+            live_hosts = await agent.probe(
+                targets=targets,
+                timeout=timeout,
+                threads=threads,
+                follow_redirects=follow_redirects,
+            )
+
+        await asyncio.to_thread(agent.cleanup)
 
         # Return structured result
         result = {
@@ -190,11 +215,11 @@ def run_httpx(
             "storage_path": "/recon/httpx/live_hosts.json"
         }
 
-        logger.info(f"HTTPx found {len(live_hosts)}/{len(targets)} live hosts")
-        return json.dumps(result, indent=2)
+        logger.info("HTTPx found %d/%d live hosts", len(live_hosts), len(targets))
+        return _dumps(result)
 
     except Exception as e:
-        logger.error(f"HTTPx tool failed: {e}")
+        logger.error("HTTPx tool failed: %s", e)
         return json.dumps({
             "success": False,
             "error": str(e),
@@ -203,10 +228,10 @@ def run_httpx(
 
 
 @tool
-def run_nmap(
+async def run_nmap(
     targets: List[str],
     config: RunnableConfig,  # LangGraph injects this automatically
-    profile: str = "default",
+    profile: ProfileName = "default",
     ports: Optional[str] = None,
     timeout: int = 3600,
 ) -> str:
@@ -230,37 +255,32 @@ def run_nmap(
         JSON string with scan results including open ports and services
 
     Example:
-        result = run_nmap(targets=["192.168.1.1"], profile="default", ports="22,80,443")
+        result = await run_nmap.ainvoke({"targets": ["192.168.1.1"], "profile": "default", "ports": "22,80,443"})
         # Returns: '{"hosts_scanned": 1, "total_open_ports": 3, "hosts": [...]}'
     """
     # Extract thread_id and create backend
-    scan_id, team_id, backend = _get_backend_from_config(config)
+    scan_id, team_id, backend = await asyncio.to_thread(_get_backend_from_config, config)
 
     try:
-        # Map profile string to enum
-        profile_map = {
-            "stealth": ScanProfile.STEALTH,
-            "default": ScanProfile.DEFAULT,
-            "aggressive": ScanProfile.AGGRESSIVE
-        }
-
-        scan_profile = profile_map.get(profile.lower(), ScanProfile.DEFAULT)
+        scan_profile = _PROFILE_MAP[profile]
 
         # Create and execute Nmap agent
-        agent = NmapAgent(
+        agent = await asyncio.to_thread(
+            NmapAgent,
             scan_id=scan_id,
             team_id=team_id,
-            nexus_backend=backend
+            nexus_backend=backend,
         )
 
-        results = agent.execute(
+        results = await asyncio.to_thread(
+            agent.execute,
             targets=targets,
             profile=scan_profile,
             ports=ports,
             timeout=timeout
         )
 
-        agent.cleanup()
+        await asyncio.to_thread(agent.cleanup)
 
         # Return structured result
         result = {
@@ -274,11 +294,14 @@ def run_nmap(
             "storage_path": "/recon/nmap/scan_results.json"
         }
 
-        logger.info(f"Nmap scanned {len(results.get('hosts', []))} hosts, found {result['total_open_ports']} open ports")
-        return json.dumps(result, indent=2)
+        logger.info(
+            "Nmap scanned %d hosts, found %d open ports",
+            result["hosts_scanned"], result["total_open_ports"],
+        )
+        return _dumps(result)
 
     except Exception as e:
-        logger.error(f"Nmap tool failed: {e}")
+        logger.error("Nmap tool failed: %s", e)
         return json.dumps({
             "success": False,
             "error": str(e),
@@ -287,10 +310,10 @@ def run_nmap(
 
 
 @tool
-def run_ffuf(
+async def run_ffuf(
     target_url: str,
     config: RunnableConfig,  # LangGraph injects this automatically
-    wordlist: str = "common",
+    wordlist: WordlistName = "common",
     extensions: Optional[List[str]] = None,
     threads: int = 40,
     rate_limit: int = 0,
@@ -319,37 +342,33 @@ def run_ffuf(
         timeout: Execution timeout in seconds (default: 600)
 
     Returns:
-        JSON string with discovered paths and metadata
+        JSON string with discovered path counts and a preview of up to
+        50 findings (2xx first); the full list is in the storage path
 
     Example:
-        result = run_ffuf(
-            target_url="https://example.com",
-            wordlist="common",
-            extensions=[".php", ".bak"]
-        )
+        result = await run_ffuf.ainvoke({
+            "target_url": "https://example.com",
+            "wordlist": "common",
+            "extensions": [".php", ".bak"],
+        })
         # Returns: '{"count": 15, "findings": [{"path": "/admin", "status_code": 200}, ...]}'
     """
     # Extract thread_id and create backend
-    scan_id, team_id, backend = _get_backend_from_config(config)
+    scan_id, team_id, backend = await asyncio.to_thread(_get_backend_from_config, config)
 
     try:
-        # Map wordlist string to enum
-        wordlist_map = {
-            "common": WordlistType.COMMON,
-            "dirb": WordlistType.DIRB_COMMON,
-            "big": WordlistType.BIG,
-            "raft-dirs": WordlistType.RAFT_DIRS,
-        }
-        wordlist_type = wordlist_map.get(wordlist.lower(), WordlistType.COMMON)
+        wordlist_type = _WORDLIST_MAP[wordlist]
 
         # Create and execute ffuf agent
-        agent = FfufAgent(
+        agent = await asyncio.to_thread(
+            FfufAgent,
             scan_id=scan_id,
             team_id=team_id,
-            nexus_backend=backend
+            nexus_backend=backend,
         )
 
-        findings = agent.execute(
+        findings = await asyncio.to_thread(
+            agent.execute,
             target_url=target_url,
             wordlist=wordlist_type,
             extensions=extensions,
@@ -360,13 +379,22 @@ def run_ffuf(
             timeout=timeout,
         )
 
-        agent.cleanup()
+        await asyncio.to_thread(agent.cleanup)
 
         # Group by status code for summary
-        by_status = {}
-        for f in findings:
-            status = str(f.status_code)
-            by_status[status] = by_status.get(status, 0) + 1
+        by_status = Counter(str(f.status_code) for f in findings)
+
+        # The full list is already stored in Nexus; return only a preview,
+        # accessible (2xx) paths first as they're the most actionable
+        preview = heapq.nsmallest(
+            FFUF_PREVIEW_LIMIT, findings, key=lambda f: not 200 <= f.status_code < 300
+        )
+
+        # Reachable admin paths are high risk, so they're listed in full
+        # rather than only when they make it into the preview
+        admin_paths = [
+            f.url for f in findings if f.status_code == 200 and "admin" in f.path.lower()
+        ]
 
         # Return structured result
         result = {
@@ -374,15 +402,17 @@ def run_ffuf(
             "target_url": target_url,
             "count": len(findings),
             "by_status_code": by_status,
-            "findings": [f.model_dump() for f in findings],
+            "findings": _FFUF_FINDINGS_ADAPTER.dump_python(preview),
+            "findings_truncated": len(findings) > len(preview),
+            "admin_paths": admin_paths,
             "storage_path": "/recon/ffuf/findings.json"
         }
 
-        logger.info(f"ffuf found {len(findings)} paths for {target_url}")
-        return json.dumps(result, indent=2)
+        logger.info("ffuf found %d paths for %s", len(findings), target_url)
+        return _dumps(result)
 
     except Exception as e:
-        logger.error(f"ffuf tool failed: {e}")
+        logger.error("ffuf tool failed: %s", e)
         return json.dumps({
             "success": False,
             "error": str(e),
@@ -391,7 +421,7 @@ def run_ffuf(
 
 
 @tool
-def run_wafw00f(
+async def run_wafw00f(
     targets: List[str],
     config: RunnableConfig,  # LangGraph injects this automatically
     timeout: int = 300,
@@ -415,32 +445,31 @@ def run_wafw00f(
         JSON string with WAF detection results and metadata
 
     Example:
-        result = run_wafw00f(targets=["https://example.com", "https://test.com"])
+        result = await run_wafw00f.ainvoke({"targets": ["https://example.com", "https://test.com"]})
         # Returns: '{"waf_detected_count": 1, "findings": [{"target": "...", "waf_name": "Cloudflare"}]}'
     """
     # Extract thread_id and create backend
-    scan_id, team_id, backend = _get_backend_from_config(config)
+    scan_id, team_id, backend = await asyncio.to_thread(_get_backend_from_config, config)
 
     try:
         # Create and execute wafw00f agent
-        agent = Wafw00fAgent(
+        agent = await asyncio.to_thread(
+            Wafw00fAgent,
             scan_id=scan_id,
             team_id=team_id,
-            nexus_backend=backend
+            nexus_backend=backend,
         )
 
-        findings = agent.execute(
+        findings = await asyncio.to_thread(
+            agent.execute,
             targets=targets,
             timeout=timeout
         )
 
-        agent.cleanup()
+        await asyncio.to_thread(agent.cleanup)
 
         # Summarize detected WAFs
-        detected_wafs = {}
-        for f in findings:
-            if f.waf_detected and f.waf_name:
-                detected_wafs[f.waf_name] = detected_wafs.get(f.waf_name, 0) + 1
+        detected_wafs = Counter(f.waf_name for f in findings if f.waf_detected and f.waf_name)
 
         # Return structured result
         result = {
@@ -448,15 +477,17 @@ def run_wafw00f(
             "targets_count": len(targets),
             "waf_detected_count": sum(1 for f in findings if f.waf_detected),
             "detected_wafs": detected_wafs,
-            "findings": [f.model_dump() for f in findings],
+            "findings": findings,  # orjson encodes the dataclasses natively
             "storage_path": "/recon/wafw00f/findings.json"
         }
 
-        logger.info(f"wafw00f detected WAFs on {result['waf_detected_count']}/{len(targets)} targets")
-        return json.dumps(result, indent=2)
+        logger.info(
+            "wafw00f detected WAFs on %d/%d targets", result["waf_detected_count"], len(targets)
+        )
+        return _dumps(result)
 
     except Exception as e:
-        logger.error(f"wafw00f tool failed: {e}")
+        logger.error("wafw00f tool failed: %s", e)
         return json.dumps({
             "success": False,
             "error": str(e),
@@ -1,11 +1,12 @@
 """Pydantic schemas for approval requests."""
 
-from datetime import datetime
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from src.db.models.approval import ApprovalRequestType, ApprovalStatus
+from src.services.approval import ApprovalService, as_utc
 
 
 # Request schemas
@@ -35,8 +36,10 @@ class ApprovalRequestCreate(BaseModel):
         description="Hours until auto-expiry (default: 1)",
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "scan_id": 123,
                 "request_type": "exploit_attempt",
@@ -54,7 +57,8 @@ class ApprovalRequestCreate(BaseModel):
                 },
                 "expiry_hours": 1,
             }
-        }
+        },
+    )
 
 
 class ApprovalReview(BaseModel):
@@ -65,13 +69,23 @@ class ApprovalReview(BaseModel):
         None, description="Reason for rejection (required if approve=False)"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "approve": True,
                 "rejection_reason": None,
             }
-        }
+        },
+    )
+
+    @model_validator(mode="after")
+    def _require_rejection_reason(self) -> "ApprovalReview":
+        """Reject a rejection without a reason before the endpoint touches the DB."""
+        if not self.approve and not self.rejection_reason:
+            raise ValueError("rejection_reason is required when rejecting an approval")
+        return self
 
 
 # Response schemas
@@ -104,9 +118,12 @@ class ApprovalRequestResponse(BaseModel):
         None, description="Minutes remaining until expiry"
     )
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        extra="forbid",
+        defer_build=True,  # Schema is built on first use, not at import
+        json_schema_extra={
             "example": {
                 "id": 456,
                 "scan_id": 123,
@@ -133,7 +150,8 @@ class ApprovalRequestResponse(BaseModel):
                 "is_expired": False,
                 "time_remaining_minutes": 55,
             }
-        }
+        },
+    )
 
 
 class ApprovalRequestList(BaseModel):
@@ -142,8 +160,9 @@ class ApprovalRequestList(BaseModel):
     approvals: list[ApprovalRequestResponse]
     total: int
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "approvals": [
                     {
@@ -168,24 +187,30 @@ class ApprovalRequestList(BaseModel):
                 ],
                 "total": 1,
             }
-        }
+        },
+    )
 
 
 # Helper functions to enrich responses
 
 
-def enrich_approval_response(approval) -> dict:
+def enrich_approval_response(
+    approval, now: Optional[datetime] = None
+) -> ApprovalRequestResponse:
     """
     Enrich approval response with computed fields.
 
+    The row comes from the database, so the response is built with
+    model_construct rather than validated field by field.
+
     Args:
         approval: ApprovalRequest model instance
+        now: Reference time for the expiry fields (default: current UTC
+            time). Pass one value when enriching a list so all items agree.
 
     Returns:
-        Dict with additional computed fields
+        Response with additional computed fields
     """
-    from src.services.approval import ApprovalService
-
     data = {
         "id": approval.id,
         "scan_id": approval.scan_id,
@@ -205,13 +230,28 @@ def enrich_approval_response(approval) -> dict:
     }
 
     # Add computed fields
-    data["is_expired"] = ApprovalService.is_expired(approval)
+    now = now or datetime.now(timezone.utc)
+    data["is_expired"] = ApprovalService.is_expired(approval, now)
 
     # Calculate time remaining
     if approval.expires_at and approval.status == ApprovalStatus.PENDING.value:
-        time_remaining = approval.expires_at - datetime.utcnow()
+        time_remaining = as_utc(approval.expires_at) - now
         data["time_remaining_minutes"] = max(0, int(time_remaining.total_seconds() / 60))
     else:
         data["time_remaining_minutes"] = None
 
-    return data
+    return ApprovalRequestResponse.model_construct(**data)
+
+
+def enrich_approval_responses(approvals: Iterable) -> List[ApprovalRequestResponse]:
+    """
+    Enrich a list of approvals against a single reference time.
+
+    Args:
+        approvals: ApprovalRequest model instances
+
+    Returns:
+        List of responses with additional computed fields
+    """
+    now = datetime.now(timezone.utc)
+    return [enrich_approval_response(approval, now) for approval in approvals]
@@ -1,4 +1,9 @@
-"""Authentication-related Pydantic schemas."""
+"""
+Authentication-related Pydantic schemas.
+
+Validators are built on first use (defer_build) rather than at import; the
+login/register hot path models are warmed up at application startup.
+"""
 
 from datetime import datetime
 
@@ -13,6 +18,8 @@ class UserCreate(BaseModel):
     password: str = Field(..., min_length=8, description="Password (minimum 8 characters)")
     full_name: str | None = Field(None, max_length=255, description="Full name")
 
+    model_config = {"defer_build": True}
+
 
 class UserLogin(BaseModel):
     """Schema for user login."""
@@ -20,6 +27,8 @@ class UserLogin(BaseModel):
     username: str = Field(..., description="Username or email")
     password: str = Field(..., description="Password")
 
+    model_config = {"defer_build": True}
+
 
 class UserResponse(BaseModel):
     """Schema for user response (without sensitive data)."""
@@ -33,7 +42,26 @@ class UserResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
+
+    @classmethod
+    def from_orm_trusted(cls, user) -> "UserResponse":
+        """
+        Build a response from a User row without validation.
+
+        Column types already match the schema, so model_construct skips the
+        from_attributes validator; FastAPI passes the instance through as-is.
+        """
+        return cls.model_construct(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
 
 
 class Token(BaseModel):
@@ -44,6 +72,23 @@ class Token(BaseModel):
     token_type: str = Field(default="bearer", description="Token type")
     expires_in: int = Field(..., description="Token expiration in seconds")
 
+    model_config = {"defer_build": True}
+
+    @classmethod
+    def bearer(cls, access_token: str, refresh_token: str, expires_in: int) -> "Token":
+        """
+        Build a bearer token response without validation.
+
+        The tokens were just issued by the server, so there is nothing to
+        validate; FastAPI passes the instance through as-is.
+        """
+        return cls.model_construct(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            token_type="bearer",
+            expires_in=expires_in,
+        )
+
 
 class TokenData(BaseModel):
     """Schema for decoded token data."""
@@ -51,8 +96,12 @@ class TokenData(BaseModel):
     user_id: int | None = None
     username: str | None = None
 
+    model_config = {"defer_build": True}
+
 
 class RefreshTokenRequest(BaseModel):
     """Schema for refresh token request."""
 
     refresh_token: str = Field(..., description="Refresh token to exchange for new access token")
+
+    model_config = {"defer_build": True}
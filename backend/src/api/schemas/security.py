@@ -1,8 +1,28 @@
 """Pydantic schemas for security-related structured outputs."""
 
-from typing import Literal, Optional
+from typing import Annotated, Final, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+# Constrained string types, defined once so every field using them shares
+# one compiled validator
+CVEId = Annotated[str, StringConstraints(pattern=r"^CVE-\d{4}-\d{4,7}$")]
+ToolName = Annotated[str, StringConstraints(max_length=100, pattern=r"^[a-z0-9_-]+$")]
+
+
+_VULN_EXAMPLE: Final[dict] = {
+    "severity": "high",
+    "title": "SQL Injection in Login Form",
+    "description": "The login form is vulnerable to SQL injection via the username parameter",
+    "cve_id": "CVE-2024-12345",
+    "cvss_score": 8.5,
+    "affected_resource": "https://example.com/login",
+    "evidence": "Payload: ' OR '1'='1 resulted in authentication bypass",
+    "remediation": "Use parameterized queries instead of string concatenation",
+    "tool_name": "sqlmap",
+    "references": ["https://owasp.org/www-community/attacks/SQL_Injection"],
+    "tags": ["sql-injection", "authentication", "web"],
+}
 
 
 class VulnerabilityFinding(BaseModel):
@@ -29,9 +49,8 @@ class VulnerabilityFinding(BaseModel):
     )
 
     # Optional fields with validation
-    cve_id: Optional[str] = Field(
+    cve_id: Optional[CVEId] = Field(
         None,
-        pattern=r"^CVE-\d{4}-\d{4,7}$",
         description="CVE identifier (e.g., CVE-2024-12345)",
     )
     cvss_score: Optional[float] = Field(
@@ -75,22 +94,20 @@ class VulnerabilityFinding(BaseModel):
         description="Tags for categorization (max 20)",
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "severity": "high",
-                "title": "SQL Injection in Login Form",
-                "description": "The login form is vulnerable to SQL injection via the username parameter",
-                "cve_id": "CVE-2024-12345",
-                "cvss_score": 8.5,
-                "affected_resource": "https://example.com/login",
-                "evidence": "Payload: ' OR '1'='1 resulted in authentication bypass",
-                "remediation": "Use parameterized queries instead of string concatenation",
-                "tool_name": "sqlmap",
-                "references": ["https://owasp.org/www-community/attacks/SQL_Injection"],
-                "tags": ["sql-injection", "authentication", "web"],
-            }
-        }
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={"example": _VULN_EXAMPLE},
+    )
+
+
+_RECON_EXAMPLE: Final[dict] = {
+    "target": "example.com",
+    "tool": "subfinder",
+    "result_type": "subdomain",
+    "value": "admin.example.com",
+    "confidence": "high",
+    "metadata": {"source": "dns"},
+}
 
 
 class ReconResult(BaseModel):
@@ -130,17 +147,27 @@ class ReconResult(BaseModel):
         description="Additional metadata",
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "target": "example.com",
-                "tool": "subfinder",
-                "result_type": "subdomain",
-                "value": "admin.example.com",
-                "confidence": "high",
-                "metadata": {"source": "dns"},
-            }
-        }
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={"example": _RECON_EXAMPLE},
+    )
+
+
+_HANDOFF_EXAMPLE: Final[dict] = {
+    "from_agent": "ReconCoordinator",
+    "to_agent": "NucleiAgent",
+    "summary": "Discovered 150 subdomains with 5 exposed admin panels",
+    "key_findings": [
+        "admin.example.com - HTTP 200",
+        "dashboard.example.com - HTTP 403",
+        "api.example.com - Open API endpoint",
+    ],
+    "priority": "high",
+    "next_actions": [
+        "Scan admin panels for vulnerabilities",
+        "Test API authentication",
+    ],
+}
 
 
 class AgentHandoff(BaseModel):
@@ -179,24 +206,19 @@ class AgentHandoff(BaseModel):
         description="Recommended next actions (max 20)",
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "from_agent": "ReconCoordinator",
-                "to_agent": "NucleiAgent",
-                "summary": "Discovered 150 subdomains with 5 exposed admin panels",
-                "key_findings": [
-                    "admin.example.com - HTTP 200",
-                    "dashboard.example.com - HTTP 403",
-                    "api.example.com - Open API endpoint",
-                ],
-                "priority": "high",
-                "next_actions": [
-                    "Scan admin panels for vulnerabilities",
-                    "Test API authentication",
-                ],
-            }
-        }
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={"example": _HANDOFF_EXAMPLE},
+    )
+
+
+_TOOL_REQUEST_EXAMPLE: Final[dict] = {
+    "tool_name": "nmap",
+    "target": "192.168.1.0/24",
+    "arguments": {"ports": "1-1000", "scan_type": "syn"},
+    "requires_approval": False,
+    "justification": "Port scan for network mapping",
+}
 
 
 class ToolExecutionRequest(BaseModel):
@@ -205,10 +227,8 @@ class ToolExecutionRequest(BaseModel):
     Enforces validation for security tool execution.
     """
 
-    tool_name: str = Field(
+    tool_name: ToolName = Field(
         ...,
-        max_length=100,
-        pattern=r"^[a-z0-9_-]+$",
         description="Tool name (lowercase, alphanumeric, hyphens, underscores)",
     )
     target: str = Field(
@@ -230,13 +250,7 @@ class ToolExecutionRequest(BaseModel):
         description="Justification for tool execution",
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "tool_name": "nmap",
-                "target": "192.168.1.0/24",
-                "arguments": {"ports": "1-1000", "scan_type": "syn"},
-                "requires_approval": False,
-                "justification": "Port scan for network mapping",
-            }
-        }
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={"example": _TOOL_REQUEST_EXAMPLE},
+    )
@@ -10,9 +10,13 @@ class UserUpdate(BaseModel):
     username: str | None = Field(None, min_length=3, max_length=100, description="Username")
     full_name: str | None = Field(None, max_length=255, description="Full name")
 
+    model_config = {"defer_build": True}
+
 
 class PasswordChange(BaseModel):
     """Schema for changing user password."""
 
     current_password: str = Field(..., description="Current password")
     new_password: str = Field(..., min_length=8, description="New password (minimum 8 characters)")
+
+    model_config = {"defer_build": True}
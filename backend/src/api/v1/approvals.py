@@ -11,7 +11,7 @@ Endpoints:
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.schemas.approval import (
@@ -20,14 +20,21 @@ from src.api.schemas.approval import (
     ApprovalRequestResponse,
     ApprovalReview,
     enrich_approval_response,
+    enrich_approval_responses,
 )
 from src.db.models.approval import ApprovalStatus
 from src.db.models.user import User
-from src.db.session import get_async_db
+from src.db.session import get_db
 from src.security.dependencies import get_current_active_user
 from src.services.approval import ApprovalService
 
-router = APIRouter(prefix="/approvals", tags=["approvals"])
+router = APIRouter()
+
+# Upper bound on list page size: a page is built and serialized in memory
+MAX_LIST_LIMIT = 500
+
+# status_filter values accepted by list_approvals
+_STATUS_MAP: dict[str, ApprovalStatus] = {s.value: s for s in ApprovalStatus}
 
 
 @router.post(
@@ -39,7 +46,7 @@ router = APIRouter(prefix="/approvals", tags=["approvals"])
 )
 async def create_approval(
     approval_data: ApprovalRequestCreate,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
@@ -81,8 +88,8 @@ async def create_approval(
 )
 async def list_approvals(
     status_filter: Optional[str] = None,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_async_db),
+    limit: int = Query(100, ge=1, le=MAX_LIST_LIMIT),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
@@ -91,15 +98,12 @@ async def list_approvals(
     Optionally filter by status: pending, approved, rejected, expired.
     """
     # Parse status filter
-    approval_status = None
-    if status_filter:
-        try:
-            approval_status = ApprovalStatus(status_filter)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status: {status_filter}. Must be one of: pending, approved, rejected, expired",
-            )
+    approval_status = _STATUS_MAP.get(status_filter) if status_filter else None
+    if status_filter and approval_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid status: {status_filter}. Must be one of: {', '.join(_STATUS_MAP)}",
+        )
 
     # Get approvals for team
     approvals = await ApprovalService.get_all_approvals(
@@ -107,12 +111,15 @@ async def list_approvals(
         team_id=current_user.team_id,
         status=approval_status,
         limit=limit,
+        # Team scoping is done by the join; responses don't need the scan
+        load_scan=False,
     )
 
     # Enrich responses
-    enriched_approvals = [enrich_approval_response(a) for a in approvals]
+    enriched_approvals = enrich_approval_responses(approvals)
 
-    return ApprovalRequestList(
+    # Items are already responses, so skip re-validating the page
+    return ApprovalRequestList.model_construct(
         approvals=enriched_approvals,
         total=len(enriched_approvals),
     )
@@ -125,8 +132,8 @@ async def list_approvals(
     description="Get all pending approval requests for the current user's team",
 )
 async def list_pending_approvals(
-    limit: int = 50,
-    db: AsyncSession = Depends(get_async_db),
+    limit: int = Query(50, ge=1, le=MAX_LIST_LIMIT),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
@@ -142,12 +149,14 @@ async def list_pending_approvals(
         db=db,
         team_id=current_user.team_id,
         limit=limit,
+        load_scan=False,
     )
 
     # Enrich responses
-    enriched_approvals = [enrich_approval_response(a) for a in approvals]
+    enriched_approvals = enrich_approval_responses(approvals)
 
-    return ApprovalRequestList(
+    # Items are already responses, so skip re-validating the page
+    return ApprovalRequestList.model_construct(
         approvals=enriched_approvals,
         total=len(enriched_approvals),
     )
@@ -161,7 +170,7 @@ async def list_pending_approvals(
 )
 async def get_approval(
     approval_id: int,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
@@ -170,7 +179,9 @@ async def get_approval(
     Returns 404 if the approval doesn't exist or doesn't belong to the user's team.
     """
     # Get approval
-    approval = await ApprovalService.get_approval_request(db=db, approval_id=approval_id)
+    approval = await ApprovalService.get_approval_request(
+        db=db, approval_id=approval_id, scan_team_only=True
+    )
 
     if not approval:
         raise HTTPException(
@@ -197,7 +208,7 @@ async def get_approval(
 async def review_approval_endpoint(
     approval_id: int,
     review_data: ApprovalReview,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
@@ -210,9 +221,13 @@ async def review_approval_endpoint(
     - Approval must be in "pending" status
     - Approval must not be expired
     - User must belong to the same team as the scan
+
+    Rejections without a rejection_reason fail request validation (422).
     """
     # Get approval
-    approval = await ApprovalService.get_approval_request(db=db, approval_id=approval_id)
+    approval = await ApprovalService.get_approval_request(
+        db=db, approval_id=approval_id, scan_team_only=True
+    )
 
     if not approval:
         raise HTTPException(
@@ -227,13 +242,6 @@ async def review_approval_endpoint(
             detail="You don't have permission to review this approval request",
         )
 
-    # Validate rejection reason
-    if not review_data.approve and not review_data.rejection_reason:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="rejection_reason is required when rejecting an approval",
-        )
-
     # Review approval
     try:
         reviewed_approval = await ApprovalService.review_approval(
@@ -1,11 +1,9 @@
 """Authentication API endpoints."""
 
-from typing import Annotated
+from typing import Annotated, Final
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import exists, literal_column, or_, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...config import settings
@@ -15,22 +13,46 @@ from ...security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
 )
+from ...security.rate_limit import RateLimit
 from ..schemas.auth import RefreshTokenRequest, Token, UserCreate, UserLogin, UserResponse
 
 router = APIRouter()
-limiter = Limiter(key_func=get_remote_address)
 
+# Access token lifetime reported to clients (settings are fixed at startup)
+_EXPIRES_IN: Final[int] = settings.access_token_expire_minutes * 60
 
-@router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-@limiter.limit("5/minute")
+
+def _issue_tokens(subject: str, username: str) -> Token:
+    """
+    Issue a new access/refresh token pair for a user.
+
+    Args:
+        subject: User ID as a string (the JWT "sub" claim)
+        username: Username to embed in the access token
+
+    Returns:
+        Token response
+    """
+    return Token.bearer(
+        access_token=create_access_token(data={"sub": subject, "username": username}),
+        refresh_token=create_refresh_token(data={"sub": subject}),
+        expires_in=_EXPIRES_IN,
+    )
+
+
+@router.post(
+    "/register",
+    response_model=UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(RateLimit("register", 5))],
+)
 async def register(
-    request: Request,
     user_in: UserCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
+) -> UserResponse:
     """
     Register a new user.
 
@@ -39,22 +61,21 @@ async def register(
         db: Database session
 
     Returns:
-        Created user object
+        Created user
 
     Raises:
         HTTPException: 400 if email or username already exists
     """
-    # Check if email already exists
-    result = await db.execute(select(User).where(User.email == user_in.email))
-    if result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
-
-    # Check if username already exists
-    result = await db.execute(select(User).where(User.username == user_in.username))
-    if result.scalar_one_or_none():
+    # Check email and username uniqueness in one round-trip
+    taken = or_(User.email == user_in.email, User.username == user_in.username)
+    if await db.scalar(select(exists().where(taken))):
+        # Only on a clash: find out which field it was
+        result = await db.execute(select(User.email).where(taken))
+        if user_in.email in result.scalars():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken",
@@ -64,23 +85,21 @@ async def register(
     user = User(
         email=user_in.email,
         username=user_in.username,
-        hashed_password=hash_password(user_in.password),
+        hashed_password=await hash_password_async(user_in.password),
         full_name=user_in.full_name,
         is_active=True,
         is_superuser=False,
     )
     db.add(user)
-    await db.flush()
-    await db.refresh(user)
+    # The INSERT returns id and the server-default timestamps (RETURNING),
+    # and the session doesn't expire on commit, so no refresh is needed
     await db.commit()
 
-    return user
+    return UserResponse.from_orm_trusted(user)
 
 
-@router.post("/login", response_model=Token)
-@limiter.limit("10/minute")
+@router.post("/login", response_model=Token, dependencies=[Depends(RateLimit("login", 10))])
 async def login(
-    request: Request,
     credentials: UserLogin,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> Token:
@@ -97,15 +116,19 @@ async def login(
     Raises:
         HTTPException: 401 if credentials are invalid
     """
-    # Try to find user by username or email
-    result = await db.execute(
-        select(User).where(
-            (User.username == credentials.username) | (User.email == credentials.username)
-        )
-    )
+    # Try to find user by username, then email: one unique-index probe each
+    # (an OR across both columns can't use a single index). UNION ALL keeps
+    # no branch order, so the priority column makes a username match win
+    lookup = union_all(
+        select(User, literal_column("0").label("priority"))
+        .where(User.username == credentials.username),
+        select(User, literal_column("1").label("priority"))
+        .where(User.email == credentials.username),
+    ).order_by("priority").limit(1)
+    result = await db.execute(select(User).from_statement(lookup))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    if not user or not await verify_password_async(credentials.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -118,22 +141,11 @@ async def login(
             detail="Inactive user account",
         )
 
-    # Create tokens
-    access_token = create_access_token(data={"sub": str(user.id), "username": user.username})
-    refresh_token = create_refresh_token(data={"sub": str(user.id)})
-
-    return Token(
-        access_token=access_token,
-        refresh_token=refresh_token,
-        token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
-    )
+    return _issue_tokens(str(user.id), user.username)
 
 
-@router.post("/refresh", response_model=Token)
-@limiter.limit("10/minute")
+@router.post("/refresh", response_model=Token, dependencies=[Depends(RateLimit("refresh", 10))])
 async def refresh_access_token(
-    request: Request,
     refresh_request: RefreshTokenRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> Token:
@@ -188,22 +200,14 @@ async def refresh_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Create new tokens
-    access_token = create_access_token(data={"sub": str(user.id), "username": user.username})
-    new_refresh_token = create_refresh_token(data={"sub": str(user.id)})
-
-    return Token(
-        access_token=access_token,
-        refresh_token=new_refresh_token,
-        token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
-    )
+    # Create new tokens (the subject is the user ID we just looked up)
+    return _issue_tokens(user_id_str, user.username)
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
     current_user: CurrentUser,
-) -> User:
+) -> UserResponse:
     """
     Get current authenticated user information.
 
@@ -211,12 +215,12 @@ async def get_current_user_info(
         current_user: Current authenticated user (from JWT token)
 
     Returns:
-        Current user object
+        Current user
 
     Raises:
         HTTPException: 401 if not authenticated
     """
-    return current_user
+    return UserResponse.from_orm_trusted(current_user)
 
 
 @router.post("/logout", status_code=status.HTTP_200_OK)
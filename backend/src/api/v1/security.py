@@ -2,15 +2,17 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...config import settings
 from ...db.session import get_db
 from ...security import PromptGuard, SecurityError
 from ...security.dependencies import CurrentActiveUser, get_current_team
+from ...security.response_cache import cache_dashboard, get_cached_dashboard
 
-router = APIRouter(prefix="/security", tags=["Security"])
+router = APIRouter()
 
 
 class ValidateInputRequest(BaseModel):
@@ -55,7 +57,17 @@ async def validate_input(
 
     Returns:
         Validation result with threat level and matched patterns
+
+    Raises:
+        HTTPException: 413 if the input is larger than max_prompt_bytes
     """
+    # Refuse oversized input before any pattern matching
+    if len(request.text.encode("utf-8")) > settings.max_prompt_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Input exceeds {settings.max_prompt_bytes} bytes",
+        )
+
     # Analyze input
     threat_level, matched_patterns = PromptGuard.analyze(request.text)
 
@@ -96,10 +108,11 @@ async def security_dashboard(
     current_user: CurrentActiveUser,
     current_team: Annotated[int, Depends(get_current_team)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> SecurityDashboardResponse:
+) -> SecurityDashboardResponse | Response:
     """Get security dashboard data for the current team.
 
-    Shows recent injection attempts and top teams with attempts.
+    Shows recent injection attempts and top teams with attempts. Responses
+    are cached in Redis per team and superuser flag for a minute.
 
     Args:
         current_user: Authenticated user
@@ -109,6 +122,10 @@ async def security_dashboard(
     Returns:
         Security dashboard data
     """
+    cached = await get_cached_dashboard(current_team, current_user.is_superuser)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     # Get recent injection attempts for this team
     recent_events = await PromptGuard.get_injection_attempts_by_team(
         db=db,
@@ -124,17 +141,13 @@ async def security_dashboard(
             limit=10,
         )
 
-    return SecurityDashboardResponse(
+    response = SecurityDashboardResponse(
         team_injection_attempts=team_attempts,
-        recent_events=[
-            {
-                "id": event.id,
-                "threat_level": event.threat_level,
-                "description": event.description,
-                "matched_patterns": event.matched_patterns,
-                "created_at": event.created_at.isoformat(),
-                "user_id": event.user_id,
-            }
-            for event in recent_events
-        ],
+        # Already plain column mappings; created_at is serialized as ISO 8601
+        recent_events=recent_events,
+    )
+    await cache_dashboard(
+        current_team, current_user.is_superuser, response.model_dump_json().encode()
     )
+
+    return response
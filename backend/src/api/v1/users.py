@@ -3,11 +3,11 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...db import User, get_db
-from ...security import CurrentUser, hash_password, verify_password
+from ...security import CurrentUser, hash_password_async, verify_password_async
 from ..schemas.auth import UserResponse
 from ..schemas.user import PasswordChange, UserUpdate
 
@@ -53,33 +53,45 @@ async def update_current_user_profile(
     Raises:
         HTTPException: 400 if email/username already taken
     """
-    # Check if email is being updated and if it's already taken
-    if user_update.email is not None and user_update.email != current_user.email:
-        result = await db.execute(select(User).where(User.email == user_update.email))
-        if result.scalar_one_or_none():
+    # Check the changed email/username for clashes in one round-trip
+    # (None means "not changing")
+    new_email = user_update.email if user_update.email != current_user.email else None
+    new_username = user_update.username if user_update.username != current_user.username else None
+    conditions = []
+    if new_email is not None:
+        conditions.append(User.email == new_email)
+    if new_username is not None:
+        conditions.append(User.username == new_username)
+
+    if conditions:
+        result = await db.execute(
+            select(User.email, User.username)
+            .where(User.id != current_user.id)
+            .where(or_(*conditions))
+        )
+        existing = result.all()
+        if new_email is not None and any(email == new_email for email, _ in existing):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
             )
-        current_user.email = user_update.email
-
-    # Check if username is being updated and if it's already taken
-    if user_update.username is not None and user_update.username != current_user.username:
-        result = await db.execute(select(User).where(User.username == user_update.username))
-        if result.scalar_one_or_none():
+        if existing:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already taken",
             )
-        current_user.username = user_update.username
+
+    if new_email is not None:
+        current_user.email = new_email
+    if new_username is not None:
+        current_user.username = new_username
 
     # Update full_name if provided
     if user_update.full_name is not None:
         current_user.full_name = user_update.full_name
 
-    # Commit changes
+    # Commit changes (updated_at comes back from the UPDATE itself)
     await db.commit()
-    await db.refresh(current_user)
 
     return current_user
 
@@ -105,14 +117,16 @@ async def change_password(
         HTTPException: 400 if current password is incorrect
     """
     # Verify current password
-    if not verify_password(password_change.current_password, current_user.hashed_password):
+    if not await verify_password_async(
+        password_change.current_password, current_user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
 
     # Update password
-    current_user.hashed_password = hash_password(password_change.new_password)
+    current_user.hashed_password = await hash_password_async(password_change.new_password)
 
     # Commit changes
     await db.commit()
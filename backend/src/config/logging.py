@@ -9,12 +9,17 @@ from structlog.types import EventDict, Processor
 
 from .settings import settings
 
+# Application context added to every log entry (settings are fixed at startup)
+_APP_CONTEXT = {
+    "app": settings.app_name,
+    "version": settings.app_version,
+    "environment": settings.environment,
+}
+
 
 def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """Add application context to log entries."""
-    event_dict["app"] = settings.app_name
-    event_dict["version"] = settings.app_version
-    event_dict["environment"] = settings.environment
+    event_dict.update(_APP_CONTEXT)
     return event_dict
 
 
@@ -64,4 +69,4 @@ def configure_logging() -> None:
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Get a structured logger instance."""
-    return structlog.get_logger(name)
+    return structlog.stdlib.get_logger(name)
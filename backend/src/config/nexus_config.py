@@ -10,20 +10,77 @@ Reference:
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
-from dotenv import load_dotenv
 from nexus.backends.gcs_connector import GCSConnectorBackend
 from nexus.backends.local import LocalBackend
 from nexus.core.nexus_fs import NexusFS
+from sqlalchemy import pool
 
-# Load .env file if it exists
-load_dotenv()
+from src.config.settings import load_env
+from src.storage.disk_cache import DiskCachedGCSConnectorBackend, DiskContentCache
 
+# Per-connection SQLite settings for the metadata DB. NexusFS already switches
+# the file to WAL, where NORMAL sync is still corruption-safe; the page cache
+# (64 MB, negative means KiB) lives on the connection, so it's only worth
+# growing once connections are pooled.
+SQLITE_PRAGMAS = ("PRAGMA synchronous=NORMAL", "PRAGMA cache_size=-65536")
 
+
+# NexusFS's own SQLite connect_args: wait this long on a locked DB before failing
+SQLITE_BUSY_TIMEOUT_SECONDS = 30
+
+
+def _pool_sqlite_metadata(nexus_fs: NexusFS, pool_size: int, max_overflow: int) -> None:
+    """
+    Keep the NexusFS SQLite metadata connections open between operations.
+
+    NexusFS creates its metadata engine itself, with a NullPool for SQLite,
+    so every metadata lookup opens a fresh connection (and a cold page
+    cache); there's no way to pass it a poolclass. The engine is shared by
+    the metadata store, audit log and permission checks, so its pool is
+    replaced in place with a QueuePool built from the dialect's public
+    connect API. NexusFS nests checkouts, so max_overflow needs headroom
+    above pool_size for concurrent writes.
+    """
+    engine = nexus_fs.metadata.engine
+    dialect = engine.dialect
+    if dialect.name != "sqlite":
+        return
+
+    cargs, cparams = dialect.create_connect_args(engine.url)
+    cparams["timeout"] = SQLITE_BUSY_TIMEOUT_SECONDS
+    on_connect = dialect.on_connect()
+
+    def connect():
+        connection = dialect.connect(*cargs, **cparams)
+        if on_connect is not None:
+            on_connect(connection)
+        cursor = connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+        return connection
+
+    engine.pool.dispose()
+    engine.pool = pool.QueuePool(
+        connect,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pre_ping=True,
+        dialect=dialect,
+    )
+
+
+@lru_cache(maxsize=1)
 def get_nexus_fs() -> NexusFS:
     """
-    Create NexusFS instance with appropriate backend based on environment.
+    Get the NexusFS instance with appropriate backend based on environment.
+
+    The instance is created on first call and shared after that, so its
+    metadata DB connection and caches stay warm. Call close_nexus_fs() to
+    release it.
 
     Returns:
         NexusFS instance configured for current environment
@@ -35,6 +92,10 @@ def get_nexus_fs() -> NexusFS:
         - GCS_CREDENTIALS_PATH: Path to service account JSON (optional, uses ADC)
         - NEXUS_LOCAL_PATH: Local storage path (default: "./nexus-data")
         - NEXUS_DB_PATH: SQLite metadata DB path (default: "./nexus-metadata.db")
+        - NEXUS_DB_POOL_SIZE: Idle metadata DB connections kept open (default: 5)
+        - NEXUS_DB_MAX_OVERFLOW: Extra metadata DB connections under load (default: 20)
+        - NEXUS_DISK_CACHE_DIR: Local cache for GCS reads (default: "./nexus-cache")
+        - NEXUS_DISK_CACHE_MB: GCS read cache size, 0 disables it (default: 10240)
 
     Storage Structure:
         Local:  ./nexus-data/{team_id}/{scan_id}/...
@@ -61,6 +122,7 @@ def get_nexus_fs() -> NexusFS:
         >>> nx = get_nexus_fs()
         >>> # Files stored as: gs://threatweaver-scans/{team_id}/{scan_id}/...
     """
+    load_env()
     backend_type = os.getenv("NEXUS_BACKEND", "local").lower()
 
     if backend_type == "gcs":
@@ -72,15 +134,28 @@ def get_nexus_fs() -> NexusFS:
                 "Set NEXUS_BACKEND=local to use local storage instead."
             )
 
+        # Objects are uploaded as-is (plain JSON/text): google-cloud-storage only
+        # sets Content-Encoding when asked, so writes spend no CPU on gzip
         project_id = os.getenv("GCS_PROJECT_ID")
         credentials_path = os.getenv("GCS_CREDENTIALS_PATH")
 
-        backend = GCSConnectorBackend(
-            bucket_name=bucket_name,
-            project_id=project_id,
-            credentials_path=credentials_path,
-            prefix="",  # No prefix, use full paths like /{team_id}/{scan_id}/
-        )
+        gcs_kwargs = {
+            "bucket_name": bucket_name,
+            "project_id": project_id,
+            "credentials_path": credentials_path,
+            "prefix": "",  # No prefix, use full paths like /{team_id}/{scan_id}/
+        }
+
+        # NexusFS's content cache only covers local storage, so cache GCS reads on disk
+        cache_mb = int(os.getenv("NEXUS_DISK_CACHE_MB", "10240"))
+        if cache_mb > 0:
+            cache = DiskContentCache(
+                cache_dir=os.getenv("NEXUS_DISK_CACHE_DIR", "./nexus-cache"),
+                max_bytes=cache_mb * 1024 * 1024,
+            )
+            backend = DiskCachedGCSConnectorBackend(**gcs_kwargs, cache=cache)
+        else:
+            backend = GCSConnectorBackend(**gcs_kwargs)
 
     else:
         # Local Backend (Development)
@@ -101,5 +176,17 @@ def get_nexus_fs() -> NexusFS:
         auto_parse=False,  # Don't auto-parse security tool outputs
         enforce_permissions=False,  # Disable for embedded mode (agents are trusted)
     )
+    _pool_sqlite_metadata(
+        nexus_fs,
+        pool_size=int(os.getenv("NEXUS_DB_POOL_SIZE", "5")),
+        max_overflow=int(os.getenv("NEXUS_DB_MAX_OVERFLOW", "20")),
+    )
 
     return nexus_fs
+
+
+def close_nexus_fs() -> None:
+    """Close the shared NexusFS, if one was created; the next call reopens it."""
+    if get_nexus_fs.cache_info().currsize:
+        get_nexus_fs().close()
+        get_nexus_fs.cache_clear()
@@ -16,6 +16,10 @@ class Base(DeclarativeBase):
 class TimestampMixin:
     """Mixin to add created_at and updated_at timestamp columns."""
 
+    # Fetch the server-generated timestamps with RETURNING on INSERT and
+    # UPDATE, so they're loaded after a flush without a refresh() SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -6,21 +6,17 @@ from typing import AsyncGenerator
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 
+from .api.schemas.auth import Token, UserCreate, UserLogin, UserResponse
 from .api.v1 import api_router
 from .config import settings
 from .config.logging import configure_logging, get_logger
+from .security.rate_limit import close_redis
 
 # Configure logging on module import
 configure_logging()
 logger = get_logger(__name__)
 
-# Configure rate limiter
-limiter = Limiter(key_func=get_remote_address)
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -33,10 +29,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         environment=settings.environment,
     )
 
+    # Auth schemas defer their validator build; build the login/register
+    # ones now so the first requests don't pay for it
+    for schema in (UserCreate, UserLogin, UserResponse, Token):
+        schema.model_rebuild()
+
     yield
 
     # Shutdown
     logger.info("shutting_down_application")
+    await close_redis()
 
 
 def create_app() -> FastAPI:
@@ -61,10 +63,6 @@ def create_app() -> FastAPI:
         allow_headers=settings.cors_allow_headers,
     )
 
-    # Add rate limiter to app state
-    app.state.limiter = limiter
-    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
     # Include API v1 router
     app.include_router(api_router, prefix=settings.api_v1_prefix)
 
@@ -9,6 +9,7 @@ import os
 from dataclasses import dataclass
 from typing import Dict
 
+from src.config.settings import load_env
 from src.sandbox.protocol import ToolConfig
 
 
@@ -39,6 +40,7 @@ class SandboxConfig:
     @classmethod
     def from_env(cls) -> "SandboxConfig":
         """Load configuration from environment variables."""
+        load_env()
         return cls(
             provider=os.getenv("SANDBOX_PROVIDER", "e2b"),
             e2b_api_key=os.getenv("E2B_API_KEY"),
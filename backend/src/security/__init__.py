@@ -10,12 +10,19 @@ from .dependencies import (
     get_current_user,
 )
 from .jwt import create_access_token, create_refresh_token, decode_token
-from .password import hash_password, verify_password
+from .password import (
+    hash_password,
+    hash_password_async,
+    verify_password,
+    verify_password_async,
+)
 from .prompt_guard import PromptGuard, SecurityError
 
 __all__ = [
     "hash_password",
+    "hash_password_async",
     "verify_password",
+    "verify_password_async",
     "create_access_token",
     "create_refresh_token",
     "decode_token",
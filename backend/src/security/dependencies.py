@@ -4,10 +4,10 @@ from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
-from ..api.schemas.auth import TokenData
 from ..db import Team, TeamMember, User, get_db
 from .jwt import decode_token
 
@@ -53,10 +53,10 @@ async def get_current_user(
     except (ValueError, TypeError):
         raise credentials_exception
 
-    token_data = TokenData(user_id=user_id)
-
-    # Fetch user from database
-    result = await db.execute(select(User).where(User.id == token_data.user_id))
+    # Fetch user from database. Relationships are never needed on the
+    # current user, and an implicit lazy load would be blocking IO in async
+    # code, so any such access fails loudly instead
+    result = await db.execute(select(User).options(raiseload("*")).where(User.id == user_id))
     user = result.scalar_one_or_none()
 
     if user is None:
@@ -147,15 +147,16 @@ async def get_current_team(
         )
 
     # Check if user is a member of the team
-    result = await db.execute(
-        select(TeamMember).where(
-            TeamMember.team_id == team.id,
-            TeamMember.user_id == current_user.id,
+    is_member = await db.scalar(
+        select(
+            exists().where(
+                TeamMember.team_id == team.id,
+                TeamMember.user_id == current_user.id,
+            )
         )
     )
-    membership = result.scalar_one_or_none()
 
-    if membership is None and not current_user.is_superuser:
+    if not is_member and not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Not a member of team '{team_slug}'",
@@ -1,12 +1,37 @@
 """JWT token creation and verification utilities."""
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 
 from ..config import settings
 
+ALGORITHM = "HS256"
+
+# Token lifetimes (settings are fixed at startup)
+ACCESS_TOKEN_LIFETIME = timedelta(minutes=settings.access_token_expire_minutes)
+REFRESH_TOKEN_LIFETIME = timedelta(days=7)
+
+
+@lru_cache(maxsize=1)
+def _signing_key(secret: str) -> Key:
+    """
+    Build the HMAC key object for a secret (cached).
+
+    Passing a raw string to jose makes it construct a key on every
+    sign/verify (and try to parse the secret as a JWK on every decode).
+
+    Args:
+        secret: Shared secret from settings
+
+    Returns:
+        jose key usable for both signing and verification
+    """
+    return jwk.construct(secret, ALGORITHM)
+
 
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     """
@@ -20,16 +45,12 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
         Encoded JWT token string
     """
     to_encode = data.copy()
+    now = datetime.now(timezone.utc)
 
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.access_token_expire_minutes
-        )
+    expire = now + (expires_delta or ACCESS_TOKEN_LIFETIME)
 
-    to_encode.update({"exp": expire, "iat": datetime.now(timezone.utc)})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm="HS256")
+    to_encode.update({"exp": expire, "iat": now})
+    encoded_jwt = jwt.encode(to_encode, _signing_key(settings.secret_key), algorithm=ALGORITHM)
     return encoded_jwt
 
 
@@ -44,9 +65,10 @@ def create_refresh_token(data: dict[str, Any]) -> str:
         Encoded JWT refresh token string
     """
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(days=7)  # Refresh tokens last 7 days
-    to_encode.update({"exp": expire, "iat": datetime.now(timezone.utc), "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm="HS256")
+    now = datetime.now(timezone.utc)
+    expire = now + REFRESH_TOKEN_LIFETIME
+    to_encode.update({"exp": expire, "iat": now, "type": "refresh"})
+    encoded_jwt = jwt.encode(to_encode, _signing_key(settings.secret_key), algorithm=ALGORITHM)
     return encoded_jwt
 
 
@@ -61,7 +83,7 @@ def decode_token(token: str) -> dict[str, Any] | None:
         Decoded token payload or None if invalid
     """
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+        payload = jwt.decode(token, _signing_key(settings.secret_key), algorithms=[ALGORITHM])
         return payload
     except JWTError:
         return None
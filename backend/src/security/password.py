@@ -1,14 +1,23 @@
 """Password hashing and verification utilities."""
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
 # Password hashing context using argon2
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
+# Dedicated pool for hashing from async endpoints: argon2 is CPU-bound (and
+# releases the GIL), and a separate pool keeps login bursts from starving the
+# loop's default executor
+_HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="pwhash")
+
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using argon2.
 
     Args:
         password: Plain text password
@@ -31,3 +40,15 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         True if password matches, False otherwise
     """
     return pwd_context.verify(plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password without blocking the event loop (see hash_password)."""
+    return await asyncio.get_running_loop().run_in_executor(_HASH_POOL, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop (see verify_password)."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _HASH_POOL, verify_password, plain_password, hashed_password
+    )
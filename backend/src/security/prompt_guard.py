@@ -1,12 +1,15 @@
 """Prompt injection guardrails for protecting against malicious inputs."""
 
 import re
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db.models import SecurityEvent, SecurityEventType, ThreatLevel
+from .response_cache import invalidate_dashboard
 
 
 class SecurityError(Exception):
@@ -162,6 +165,24 @@ class PromptGuard:
         ),
     ]
 
+    # All patterns as one alternation: benign input (the common case) is
+    # cleared in a single scan, and the individual patterns only run once
+    # something matched
+    _ANY_INJECTION = re.compile(
+        "|".join(f"(?:{pattern})" for pattern, _, _ in INJECTION_PATTERNS),
+        re.IGNORECASE | re.MULTILINE,
+    )
+
+    # Shortest text any pattern can match ("eval(" / "exec("); anything
+    # shorter can't contain an indicator
+    _MIN_INDICATOR_LEN = 5
+
+    # Each pattern compiled once, alongside the source string reported in matches
+    _COMPILED_PATTERNS = tuple(
+        (re.compile(pattern, re.IGNORECASE | re.MULTILINE), pattern, threat_level, description)
+        for pattern, threat_level, description in INJECTION_PATTERNS
+    )
+
     @classmethod
     def analyze(cls, text: str) -> tuple[ThreatLevel, list[dict[str, str]]]:
         """Analyze text for prompt injection patterns.
@@ -173,17 +194,20 @@ class PromptGuard:
             Tuple of (highest_threat_level, matched_patterns)
             matched_patterns: List of dicts with 'pattern' and 'description'
         """
-        if not text:
+        if len(text) < cls._MIN_INDICATOR_LEN:
             return ThreatLevel.INFO, []
 
         # Normalize text for analysis (lowercase, preserve structure)
         normalized = text.lower()
 
+        if not cls._ANY_INJECTION.search(normalized):
+            return ThreatLevel.INFO, []
+
         matched_patterns = []
         highest_threat = ThreatLevel.INFO
 
-        for pattern, threat_level, description in cls.INJECTION_PATTERNS:
-            if re.search(pattern, normalized, re.IGNORECASE | re.MULTILINE):
+        for regex, pattern, threat_level, description in cls._COMPILED_PATTERNS:
+            if regex.search(normalized):
                 matched_patterns.append({
                     "pattern": pattern,
                     "description": description,
@@ -301,6 +325,10 @@ class PromptGuard:
         await db.commit()
         await db.refresh(event)
 
+        # The team's cached dashboard no longer lists its latest attempts
+        if event_type == SecurityEventType.PROMPT_INJECTION_ATTEMPT and team_id is not None:
+            await invalidate_dashboard(team_id)
+
         return event
 
     @classmethod
@@ -309,21 +337,32 @@ class PromptGuard:
         db: AsyncSession,
         team_id: int,
         limit: int = 100,
-    ) -> list[SecurityEvent]:
+    ) -> Sequence[RowMapping]:
         """Get recent injection attempts for a team.
 
+        Only the dashboard columns are selected, as plain row mappings, so no
+        ORM objects are built for what is serialized straight to JSON.
+
         Args:
             db: Database session
             team_id: Team ID
             limit: Maximum number of events to return
 
         Returns:
-            List of SecurityEvent instances
+            Mappings with id, threat_level, description, matched_patterns,
+            created_at and user_id, newest first
         """
         from sqlalchemy import select
 
         stmt = (
-            select(SecurityEvent)
+            select(
+                SecurityEvent.id,
+                SecurityEvent.threat_level,
+                SecurityEvent.description,
+                SecurityEvent.matched_patterns,
+                SecurityEvent.created_at,
+                SecurityEvent.user_id,
+            )
             .where(SecurityEvent.team_id == team_id)
             .where(SecurityEvent.event_type == SecurityEventType.PROMPT_INJECTION_ATTEMPT.value)
             .order_by(SecurityEvent.created_at.desc())
@@ -331,7 +370,7 @@ class PromptGuard:
         )
 
         result = await db.execute(stmt)
-        return list(result.scalars().all())
+        return result.mappings().all()
 
     @classmethod
     async def get_top_teams_with_injection_attempts(
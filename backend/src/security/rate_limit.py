@@ -0,0 +1,100 @@
+"""
+Redis-backed rate limiting for API endpoints.
+
+Requests are counted per client IP in fixed one-minute windows. Counters
+live in Redis, so a limit holds across all API workers rather than per
+process. Each check is a single pipelined round-trip:
+
+    INCR   ratelimit:<bucket>:<client>:<window>
+    EXPIRE ratelimit:<bucket>:<client>:<window> 60
+
+The window number is part of the key, so a new window starts a new counter
+and the EXPIRE only has to clean up old ones.
+"""
+
+import logging
+import time
+from functools import lru_cache
+
+from fastapi import HTTPException, Request, status
+from redis.asyncio import Redis
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+from redis.exceptions import RedisError
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 60
+
+# A rate limit check shouldn't hold up the request it guards: give up quickly
+# (and fail open) rather than retrying with backoff when Redis is unreachable
+REDIS_TIMEOUT_SECONDS = 0.5
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> Redis:
+    """Get the shared async Redis client (one connection pool per process)."""
+    return Redis.from_url(
+        settings.redis_url,
+        socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+        socket_timeout=REDIS_TIMEOUT_SECONDS,
+        retry=Retry(NoBackoff(), retries=1),
+    )
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client, if one was created."""
+    if get_redis.cache_info().currsize:
+        await get_redis().aclose()
+        get_redis.cache_clear()
+
+
+class RateLimit:
+    """
+    FastAPI dependency limiting requests per client IP.
+
+    Example:
+        >>> @router.post("/login", dependencies=[Depends(RateLimit("login", 10))])
+        ... async def login(...): ...
+    """
+
+    def __init__(self, bucket: str, limit: int):
+        """
+        Initialize the limit.
+
+        Args:
+            bucket: Name of the counter (one per endpoint)
+            limit: Maximum requests per client per minute
+        """
+        self.bucket = bucket
+        self.limit = limit
+
+    async def __call__(self, request: Request) -> None:
+        """
+        Count the request and reject it once the client is over the limit.
+
+        Raises:
+            HTTPException: 429 if the limit for this window is exceeded
+        """
+        client = request.client.host if request.client else "unknown"
+        now = int(time.time())
+        key = f"ratelimit:{self.bucket}:{client}:{now // WINDOW_SECONDS}"
+
+        try:
+            async with get_redis().pipeline(transaction=False) as pipe:
+                pipe.incr(key)
+                pipe.expire(key, WINDOW_SECONDS)
+                count, _ = await pipe.execute()
+        except RedisError as e:
+            # Fail open: losing Redis shouldn't lock everyone out of auth
+            logger.warning("Rate limit check for %s skipped: %s", self.bucket, e)
+            return
+
+        if count > self.limit:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Rate limit exceeded: {self.limit} per minute",
+                headers={"Retry-After": str(WINDOW_SECONDS - now % WINDOW_SECONDS)},
+            )
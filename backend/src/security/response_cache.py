@@ -0,0 +1,63 @@
+"""
+Redis cache for the security dashboard response.
+
+The dashboard runs two aggregation queries over security events, so its
+serialized JSON is cached for a short TTL. What a caller sees depends on
+their team and on whether they're a superuser (who also get the top-teams
+table), so both are part of the key; there is never a global entry:
+
+    tw-cache:dashboard:<team_id>:<is_superuser>
+
+Logging an injection attempt for a team drops that team's entries, so new
+events show up straight away. Like rate limiting, the cache fails open:
+if Redis is unavailable the dashboard is just computed every time.
+"""
+
+import logging
+
+from redis.exceptions import RedisError
+
+from .rate_limit import get_redis
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_TTL_SECONDS = 60
+
+
+def dashboard_cache_key(team_id: int, is_superuser: bool) -> str:
+    """Get the cache key for one team's dashboard, as seen by a (super)user."""
+    return f"tw-cache:dashboard:{team_id}:{int(is_superuser)}"
+
+
+async def get_cached_dashboard(team_id: int, is_superuser: bool) -> bytes | None:
+    """Get the cached dashboard JSON, or None on a miss (or if Redis is down)."""
+    try:
+        return await get_redis().get(dashboard_cache_key(team_id, is_superuser))
+    except RedisError as e:
+        logger.warning("Dashboard cache read skipped: %s", e)
+        return None
+
+
+async def cache_dashboard(team_id: int, is_superuser: bool, content: bytes) -> None:
+    """Cache dashboard JSON for DASHBOARD_TTL_SECONDS."""
+    try:
+        await get_redis().set(
+            dashboard_cache_key(team_id, is_superuser), content, ex=DASHBOARD_TTL_SECONDS
+        )
+    except RedisError as e:
+        logger.warning("Dashboard cache write skipped: %s", e)
+
+
+async def invalidate_dashboard(team_id: int) -> None:
+    """
+    Drop a team's cached dashboards after a new injection attempt.
+
+    Superuser dashboards of other teams also include the top-teams counts;
+    those are left to expire with the TTL.
+    """
+    try:
+        await get_redis().delete(
+            dashboard_cache_key(team_id, False), dashboard_cache_key(team_id, True)
+        )
+    except RedisError as e:
+        logger.warning("Dashboard cache invalidation for team %s skipped: %s", team_id, e)
@@ -11,7 +11,7 @@ Architecture:
 - Auto-expiry: Background task marks expired requests
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 from sqlalchemy import and_, select
@@ -26,6 +26,16 @@ from src.db.models.approval import (
 from src.db.models.scan import Scan
 
 
+def as_utc(value: datetime) -> datetime:
+    """
+    Attach UTC to a naive datetime.
+
+    Expiry times are written with utcnow() (naive) but the columns are
+    timezone-aware, so values read back from Postgres carry a tzinfo.
+    """
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
 class ApprovalService:
     """Service for managing approval requests."""
 
@@ -106,6 +116,7 @@ class ApprovalService:
         db: AsyncSession,
         approval_id: int,
         load_scan: bool = True,
+        scan_team_only: bool = False,
     ) -> Optional[ApprovalRequest]:
         """
         Get an approval request by ID.
@@ -114,13 +125,17 @@ class ApprovalService:
             db: Database session
             approval_id: Approval request ID
             load_scan: Whether to eagerly load the scan relationship
+            scan_team_only: Load only the scan's team_id (for access checks),
+                skipping its large JSON result columns
 
         Returns:
             ApprovalRequest or None if not found
         """
         query = select(ApprovalRequest).where(ApprovalRequest.id == approval_id)
 
-        if load_scan:
+        if load_scan and scan_team_only:
+            query = query.options(selectinload(ApprovalRequest.scan).load_only(Scan.team_id))
+        elif load_scan:
             query = query.options(selectinload(ApprovalRequest.scan))
 
         result = await db.execute(query)
@@ -131,6 +146,7 @@ class ApprovalService:
         db: AsyncSession,
         team_id: int,
         limit: int = 50,
+        load_scan: bool = True,
     ) -> List[ApprovalRequest]:
         """
         Get pending approval requests for a team.
@@ -139,6 +155,7 @@ class ApprovalService:
             db: Database session
             team_id: Team ID to filter by
             limit: Maximum number of results
+            load_scan: Whether to eagerly load the scan relationship
 
         Returns:
             List of pending ApprovalRequests
@@ -153,11 +170,13 @@ class ApprovalService:
                     Scan.team_id == team_id,
                 )
             )
-            .options(selectinload(ApprovalRequest.scan))
             .order_by(ApprovalRequest.created_at.desc())
             .limit(limit)
         )
 
+        if load_scan:
+            query = query.options(selectinload(ApprovalRequest.scan))
+
         result = await db.execute(query)
         return list(result.scalars().all())
 
@@ -167,6 +186,7 @@ class ApprovalService:
         team_id: int,
         status: Optional[ApprovalStatus] = None,
         limit: int = 100,
+        load_scan: bool = True,
     ) -> List[ApprovalRequest]:
         """
         Get all approval requests for a team (optionally filtered by status).
@@ -176,6 +196,7 @@ class ApprovalService:
             team_id: Team ID to filter by
             status: Optional status filter
             limit: Maximum number of results
+            load_scan: Whether to eagerly load the scan relationship
 
         Returns:
             List of ApprovalRequests
@@ -189,11 +210,10 @@ class ApprovalService:
         if status:
             query = query.where(ApprovalRequest.status == status.value)
 
-        query = (
-            query.options(selectinload(ApprovalRequest.scan))
-            .order_by(ApprovalRequest.created_at.desc())
-            .limit(limit)
-        )
+        query = query.order_by(ApprovalRequest.created_at.desc()).limit(limit)
+
+        if load_scan:
+            query = query.options(selectinload(ApprovalRequest.scan))
 
         result = await db.execute(query)
         return list(result.scalars().all())
@@ -300,13 +320,13 @@ class ApprovalService:
         return approval.status == ApprovalStatus.PENDING.value
 
     @staticmethod
-    def is_expired(approval: ApprovalRequest) -> bool:
-        """Check if an approval request is expired."""
+    def is_expired(approval: ApprovalRequest, now: Optional[datetime] = None) -> bool:
+        """Check if an approval request is expired (as of `now`, default current time)."""
         if approval.status == ApprovalStatus.EXPIRED.value:
             return True
 
         # Check if expiry time has passed
-        if approval.expires_at and datetime.utcnow() > approval.expires_at:
+        if approval.expires_at and (now or datetime.now(timezone.utc)) > as_utc(approval.expires_at):
             return True
 
         return False
@@ -0,0 +1,149 @@
+"""
+Persistent local disk cache for Nexus GCS reads.
+
+NexusFS only attaches its in-memory content cache to LocalBackend, so with
+NEXUS_BACKEND=gcs every read is a GCS round-trip (an exists() check plus a
+download). This module adds an LRU disk cache under the GCS connector.
+
+Entries are keyed by GCS path and the content hash (or generation) that
+Nexus metadata records for the file. A write through Nexus changes that hash,
+so stale entries are never served and no GCS revalidation is needed.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from nexus.backends.gcs_connector import GCSConnectorBackend
+
+if TYPE_CHECKING:
+    from nexus.core.permissions import OperationContext
+
+logger = logging.getLogger(__name__)
+
+
+class DiskContentCache:
+    """
+    Size-bounded LRU cache of file contents on local disk.
+
+    The index is rebuilt from the cache directory on startup (oldest
+    modification time first), so entries survive process restarts.
+    """
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cached entries (created if missing)
+            max_bytes: Total size above which least recently used entries are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+
+        existing = sorted(
+            (entry for entry in os.scandir(self.cache_dir) if entry.is_file() and not entry.name.startswith(".")),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        for entry in existing:
+            size = entry.stat().st_size
+            self._entries[entry.name] = size
+            self._total_bytes += size
+        self._evict()
+
+    @staticmethod
+    def key(path: str, version: str) -> str:
+        """Build the cache key for a file path at a given content version."""
+        return hashlib.sha256(f"{path}\0{version}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached content, or None on a miss."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+
+        try:
+            return (self.cache_dir / key).read_bytes()
+        except OSError:
+            # Removed behind our back (e.g. tmp cleaner); treat as a miss
+            with self._lock:
+                self._total_bytes -= self._entries.pop(key, 0)
+            return None
+
+    def put(self, key: str, content: bytes) -> None:
+        """Store content, evicting least recently used entries if over budget."""
+        if len(content) > self.max_bytes:
+            return
+
+        # Write to a temp file and rename so readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, self.cache_dir / key)
+        except OSError as e:
+            logger.warning("Failed to write disk cache entry: %s", e)
+            Path(tmp_path).unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self._total_bytes += len(content) - self._entries.pop(key, 0)
+            self._entries[key] = len(content)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until within budget (caller holds the lock)."""
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            (self.cache_dir / key).unlink(missing_ok=True)
+
+
+class DiskCachedGCSConnectorBackend(GCSConnectorBackend):
+    """
+    GCS connector backend that serves repeated reads from a local disk cache.
+
+    Writes go to GCS as usual and are also stored in the cache, so a tool
+    reading back what another tool just wrote doesn't hit GCS either.
+    """
+
+    def __init__(self, *args, cache: DiskContentCache, **kwargs):
+        """
+        Initialize the backend.
+
+        Args:
+            *args: Passed to GCSConnectorBackend
+            cache: Disk cache for file contents
+            **kwargs: Passed to GCSConnectorBackend
+        """
+        super().__init__(*args, **kwargs)
+        self.disk_cache = cache
+
+    def write_content(self, content: bytes, context: "OperationContext | None" = None) -> str:
+        """Write content to GCS and cache it under its new version."""
+        content_hash = super().write_content(content, context)
+        self.disk_cache.put(self.disk_cache.key(context.backend_path, content_hash), content)
+        return content_hash
+
+    def read_content(self, content_hash: str, context: "OperationContext | None" = None) -> bytes:
+        """Read content from the disk cache, falling back to GCS on a miss."""
+        if not context or not context.backend_path:
+            return super().read_content(content_hash, context)
+
+        key = self.disk_cache.key(context.backend_path, content_hash)
+        content = self.disk_cache.get(key)
+        if content is None:
+            content = super().read_content(content_hash, context)
+            self.disk_cache.put(key, content)
+        return content
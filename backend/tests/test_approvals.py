@@ -9,10 +9,18 @@ This module tests:
 """
 
 import pytest
-from datetime import datetime, timedelta
+from pydantic import ValidationError
+from datetime import datetime, timedelta, timezone
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.schemas.approval import (
+    ApprovalRequestList,
+    ApprovalRequestResponse,
+    ApprovalReview,
+    enrich_approval_response,
+    enrich_approval_responses,
+)
 from src.db.models.approval import ApprovalRequest, ApprovalRequestType, ApprovalStatus
 from src.db.models.scan import Scan
 from src.db.models.team import Team
@@ -390,5 +398,84 @@ class TestApprovalService:
         assert not ApprovalService.is_expired(valid)
 
 
+class TestEnrichApprovalResponse:
+    """Test computed fields on approval responses."""
+
+    @staticmethod
+    def _approval(expires_at):
+        now = datetime.now(timezone.utc)
+        return ApprovalRequest(
+            id=1,
+            scan_id=1,
+            request_type=ApprovalRequestType.EXPLOIT_ATTEMPT.value,
+            status=ApprovalStatus.PENDING.value,
+            title="Test",
+            description="Test",
+            risk_level="HIGH",
+            context={},
+            requested_action={},
+            expires_at=expires_at,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def test_time_remaining_uses_reference_time(self):
+        """Test naive and aware expiry times are measured against the same now."""
+        now = datetime.now(timezone.utc)
+        naive = self._approval(now.replace(tzinfo=None) + timedelta(minutes=30))
+        aware = self._approval(now + timedelta(minutes=30))
+
+        for approval in (naive, aware):
+            response = enrich_approval_response(approval, now)
+            assert response.time_remaining_minutes == 30
+            assert response.is_expired is False
+
+    def test_enrich_list(self):
+        """Test bulk enrichment matches per-item enrichment."""
+        now = datetime.now(timezone.utc)
+        approvals = [
+            self._approval(now + timedelta(minutes=90)),
+            self._approval(now - timedelta(minutes=5)),
+            self._approval(None),
+        ]
+
+        enriched = enrich_approval_responses(approvals)
+
+        assert [r.time_remaining_minutes for r in enriched] == [89, 0, None]
+        assert [r.is_expired for r in enriched] == [False, True, False]
+        assert enrich_approval_responses([]) == []
+
+    def test_constructed_response_matches_validation(self):
+        """Test the trusted construction equals validating the same row."""
+        approval = self._approval(datetime.now(timezone.utc) + timedelta(minutes=30))
+        response = enrich_approval_response(approval)
+
+        assert response == ApprovalRequestResponse.model_validate(response.model_dump())
+        # Page responses accept the constructed instances as-is
+        page = ApprovalRequestList(approvals=[response], total=1)
+        assert page.approvals[0] is response
+
+
+class TestApprovalSchemas:
+    """Test approval request/response schema strictness."""
+
+    def test_request_models_are_frozen_and_strict(self):
+        """Test request models reject unknown fields and mutation."""
+        review = ApprovalReview(approve=False, rejection_reason="Out of scope")
+
+        with pytest.raises(ValidationError):
+            review.approve = True
+        with pytest.raises(ValidationError):
+            ApprovalReview(approve=True, approved_by=1)
+
+    def test_rejection_requires_reason(self):
+        """Test rejecting without a reason fails validation."""
+        assert ApprovalReview(approve=True).rejection_reason is None
+
+        for reason in (None, ""):
+            with pytest.raises(ValidationError, match="rejection_reason is required"):
+                ApprovalReview(approve=False, rejection_reason=reason)
+
+
 # Note: API endpoint tests would require FastAPI TestClient setup
 # These are covered by integration tests with the full application
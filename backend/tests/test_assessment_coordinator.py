@@ -234,6 +234,7 @@ class TestAssessmentCoordinatorCreation:
 
         tool_names = [t.name for t in tools]
         assert "request_approval" in tool_names
+        assert "run_assessment_suite" in tool_names
 
     @patch("src.agents.assessment_coordinator.create_deep_agent")
     @patch("src.agents.assessment_coordinator.ChatOpenAI")
@@ -0,0 +1,404 @@
+"""
+Unit tests for the assessment tools.
+
+These tests use mocked scanner tools to avoid E2B sandbox dependencies.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.agents.assessment.nuclei_agent import NucleiFinding
+from src.agents.assessment.sqlmap_agent import SQLMapFinding
+from src.agents.assessment.testssl_agent import CertificateInfo, TLSFinding, TLSVulnerability
+from src.agents.assessment.xsstrike_agent import XSSFinding
+from src.agents.tools import assessment_tools
+from src.agents.tools.assessment_tools import (
+    run_assessment_suite,
+    run_nuclei,
+    run_sqlmap,
+    run_testssl,
+    run_xsstrike,
+)
+
+CONFIG = {"configurable": {"thread_id": "scan-123"}}
+
+
+def _fake_tool(payload, barrier=None):
+    """Create a fake scanner tool returning `payload` as JSON."""
+    async def ainvoke(args, config=None):
+        if barrier is not None:
+            await barrier.wait()
+        return json.dumps({**payload, "args": args})
+
+    tool = Mock()
+    tool.ainvoke = AsyncMock(side_effect=ainvoke)
+    return tool
+
+
+class TestScannerTools:
+    """Test scanner tool result serialization."""
+
+    @pytest.fixture(autouse=True)
+    def fake_backend(self, monkeypatch):
+        """Skip Nexus backend creation."""
+        monkeypatch.setattr(
+            assessment_tools,
+            "_get_thread_backend",
+            lambda thread_id: Mock(),
+        )
+
+    @staticmethod
+    def _patch_agent(monkeypatch, name, result):
+        """Patch a scanner agent class so execute() returns `result`."""
+        agent = Mock()
+        agent.execute.return_value = result
+        monkeypatch.setattr(assessment_tools, name, Mock(return_value=agent))
+
+    def test_nuclei_serializes_findings(self, monkeypatch):
+        """Test nuclei findings serialize like model_dump."""
+        findings = [
+            NucleiFinding(
+                template_id=f"cve-{i}",
+                template_name="Test",
+                severity=severity,
+                host="https://example.com",
+                matched_at="https://example.com/",
+                tags=["cve"],
+            )
+            for i, severity in enumerate(["High", "high", "critical"])
+        ]
+        self._patch_agent(monkeypatch, "NucleiAgent", findings)
+
+        result = run_nuclei.invoke({"targets": ["https://example.com"]}, config=CONFIG)
+        data = json.loads(result)
+
+        # Compact output keeps the agent's context small
+        assert "\n" not in result and '": ' not in result
+
+        assert data["findings"] == [f.model_dump() for f in findings]
+        # Counted case-insensitively, in severity order
+        assert list(data["severity_counts"].items()) == [("critical", 1), ("high", 2)]
+
+    def test_cleanup_does_not_block_result(self, monkeypatch):
+        """Test the tool returns while sandbox cleanup is still running."""
+        release, finished = threading.Event(), threading.Event()
+        self._patch_agent(monkeypatch, "NucleiAgent", [])
+        assessment_tools.NucleiAgent.return_value.cleanup.side_effect = (
+            lambda: release.wait(5) and finished.set()
+        )
+
+        try:
+            data = json.loads(run_nuclei.invoke({"targets": ["https://example.com"]}, config=CONFIG))
+            assert data["success"] is True
+            assert not finished.is_set()
+        finally:
+            release.set()
+
+        assert finished.wait(5)
+
+    def test_nuclei_normalizes_severity_filter(self, monkeypatch):
+        """Test the severity filter is lowercased once and passed as a tuple."""
+        self._patch_agent(monkeypatch, "NucleiAgent", [])
+
+        data = json.loads(run_nuclei.invoke(
+            {"targets": ["https://example.com"], "severity_filter": ["HIGH", "Low"]}, config=CONFIG
+        ))
+
+        agent = assessment_tools.NucleiAgent.return_value
+        assert agent.execute.call_args.kwargs["severity_filter"] == ("high", "low")
+        assert data["severity_filter"] == ["high", "low"]
+
+    def test_impl_takes_thread_id(self, monkeypatch):
+        """Test the tool body runs for a thread_id without a RunnableConfig."""
+        self._patch_agent(monkeypatch, "NucleiAgent", [])
+
+        data = json.loads(assessment_tools._run_nuclei("scan-456", ["https://example.com"]))
+
+        assert data["success"] is True
+        assert assessment_tools.NucleiAgent.call_args.kwargs["scan_id"] == "scan-456"
+
+    def test_nuclei_rejects_unknown_severity(self, monkeypatch):
+        """Test an unknown severity is reported without running the scan."""
+        self._patch_agent(monkeypatch, "NucleiAgent", [])
+
+        data = json.loads(run_nuclei.invoke(
+            {"targets": ["https://example.com"], "severity_filter": ["high", "urgent"]}, config=CONFIG
+        ))
+
+        assert data["success"] is False
+        assert "urgent" in data["error"]
+        assessment_tools.NucleiAgent.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("tool", "agent_name", "args", "expected"),
+        [
+            (run_nuclei, "NucleiAgent", {"targets": ["https://a.com"]}, {"targets_count": 1}),
+            (run_sqlmap, "SQLMapAgent", {"target_url": 'https://a.com/?q="x"'},
+             {"target_url": 'https://a.com/?q="x"', "vulnerable": False}),
+            (run_xsstrike, "XSStrikeAgent", {"target_url": "https://a.com/"},
+             {"target_url": "https://a.com/", "vulnerable": False}),
+            (run_testssl, "TestsslAgent", {"target": "a.com"}, {"target": "a.com"}),
+        ],
+    )
+    def test_error_results(self, monkeypatch, tool, agent_name, args, expected):
+        """Test a failing scanner returns the error with its request values."""
+        monkeypatch.setattr(
+            assessment_tools, agent_name, Mock(side_effect=RuntimeError('sandbox "died"'))
+        )
+
+        data = json.loads(tool.invoke(args, config=CONFIG))
+
+        assert data == {"success": False, "error": 'sandbox "died"', **expected}
+
+    def test_sqlmap_result_keeps_field_order(self, monkeypatch):
+        """Test the sqlmap result JSON keeps its documented layout."""
+        finding = SQLMapFinding(
+            target_url="https://example.com/?id=1",
+            parameter="id",
+            injection_type="boolean-based blind",
+            dbms="MySQL",
+            databases=["app"],
+        )
+        self._patch_agent(monkeypatch, "SQLMapAgent", [finding])
+
+        result = run_sqlmap.invoke({"target_url": "https://example.com/?id=1"}, config=CONFIG)
+        data = json.loads(result)
+
+        assert result == assessment_tools.SQLMapResult(
+            success=True,
+            target_url="https://example.com/?id=1",
+            vulnerable=True,
+            findings_count=1,
+            dbms="MySQL",
+            databases=["app"],
+            findings=[finding],
+            storage_path="/assessment/sqlmap/findings.json",
+            note="For data extraction, use request_approval tool first",
+        ).model_dump_json()
+        assert list(data) == [
+            "success", "target_url", "vulnerable", "findings_count", "dbms",
+            "databases", "findings", "storage_path", "note",
+        ]
+        assert data["vulnerable"] is True
+        assert data["databases"] == ["app"]
+        assert data["findings"] == [finding.model_dump()]
+
+    def test_sqlmap_deduplicates_databases(self, monkeypatch, caplog):
+        """Test databases are deduplicated and sorted, and a DBMS conflict is logged."""
+        findings = [
+            SQLMapFinding(
+                target_url="https://example.com/?id=1",
+                parameter=parameter,
+                injection_type="boolean-based blind",
+                dbms=dbms,
+                databases=databases,
+            )
+            for parameter, dbms, databases in [
+                ("id", "MySQL", ["users", "app"]),
+                ("q", "PostgreSQL", ["app", "logs"]),
+            ]
+        ]
+        self._patch_agent(monkeypatch, "SQLMapAgent", findings)
+
+        data = json.loads(
+            run_sqlmap.invoke({"target_url": "https://example.com/?id=1"}, config=CONFIG)
+        )
+
+        assert data["databases"] == ["app", "logs", "users"]
+        assert data["dbms"] == "PostgreSQL"
+        assert "conflicting DBMS" in caplog.text
+
+    def test_xsstrike_logs_type_summary(self, monkeypatch, caplog):
+        """Test the XSS type summary is formatted into the log record."""
+        findings = [
+            XSSFinding(target_url="https://example.com/?q=1", vulnerable=True, xss_type=xss_type)
+            for xss_type in ["reflected", "reflected", "dom"]
+        ]
+        self._patch_agent(monkeypatch, "XSStrikeAgent", findings)
+
+        with caplog.at_level(logging.INFO, logger=assessment_tools.__name__):
+            data = json.loads(
+                run_xsstrike.invoke({"target_url": "https://example.com/?q=1"}, config=CONFIG)
+            )
+
+        assert data["xss_types"] == {"reflected": 2, "dom": 1}
+        assert "XSStrike found 3 XSS vulnerabilities (reflected: 2, dom: 1)" in caplog.text
+
+    @pytest.mark.parametrize(
+        ("tool", "agent_name", "args", "model", "fields"),
+        [
+            (
+                run_nuclei, "NucleiAgent", {"targets": ["https://a.com", "https://b.com"]},
+                assessment_tools.NucleiResult,
+                {"targets_count": 2, "findings_count": 0, "severity_filter": ["critical", "high", "medium"],
+                 "severity_counts": {}, "storage_path": "/assessment/nuclei/findings.json"},
+            ),
+            (
+                run_sqlmap, "SQLMapAgent", {"target_url": 'https://a.com/?q="x"'},
+                assessment_tools.SQLMapResult,
+                {"target_url": 'https://a.com/?q="x"', "vulnerable": False,
+                 "findings_count": 0, "dbms": None,
+                 "databases": [], "storage_path": "/assessment/sqlmap/findings.json",
+                 "note": "For data extraction, use request_approval tool first"},
+            ),
+            (
+                run_xsstrike, "XSStrikeAgent", {"target_url": 'https://a.com/?q="x"'},
+                assessment_tools.XSStrikeResult,
+                {"target_url": 'https://a.com/?q="x"', "vulnerable": False,
+                 "vulnerable_count": 0, "xss_types": {},
+                 "storage_path": "/assessment/xsstrike/findings.json"},
+            ),
+        ],
+    )
+    def test_empty_findings_match_result_model(self, monkeypatch, tool, agent_name, args, model, fields):
+        """Test the pre-serialized empty results match a serialized result model."""
+        self._patch_agent(monkeypatch, agent_name, [])
+
+        result = tool.invoke(args, config=CONFIG)
+
+        assert result == model(success=True, findings=[], **fields).model_dump_json()
+
+    @pytest.mark.parametrize("certificate", [CertificateInfo(subject="CN=example.com"), None])
+    def test_testssl_serializes_vulnerabilities_and_certificate(self, monkeypatch, certificate):
+        """Test testssl vulnerabilities and optional certificate serialize like model_dump."""
+        finding = TLSFinding(
+            target="example.com:443",
+            certificate=certificate,
+            vulnerabilities=[
+                TLSVulnerability(id="heartbleed", name="Heartbleed", severity="critical", finding="vulnerable")
+            ],
+            overall_rating="F",
+        )
+        self._patch_agent(monkeypatch, "TestsslAgent", finding)
+
+        data = json.loads(run_testssl.invoke({"target": "example.com"}, config=CONFIG))
+
+        assert data["vulnerabilities"] == [v.model_dump() for v in finding.vulnerabilities]
+        assert data["certificate"] == (certificate.model_dump() if certificate else None)
+        assert data["vulnerability_summary"] == {"critical": 1}
+
+
+class TestRunAssessmentSuite:
+    """Test the concurrent assessment suite tool."""
+
+    @staticmethod
+    def _patch_tools(monkeypatch, barrier=None):
+        """Patch the scanner tools with fakes."""
+        tools = {
+            "run_nuclei": _fake_tool({"success": True, "findings_count": 1}, barrier),
+            "run_xsstrike": _fake_tool({"success": True, "vulnerable": False}, barrier),
+            "run_testssl": _fake_tool({"success": True, "overall_rating": "A"}, barrier),
+            "run_sqlmap": _fake_tool({"success": True}),
+        }
+        for name, tool in tools.items():
+            monkeypatch.setattr(assessment_tools, name, tool)
+        return tools
+
+    async def test_suite_runs_scanners_concurrently(self, monkeypatch):
+        """Test nuclei, xsstrike per URL and testssl per HTTPS host run in parallel."""
+        # All four scans must be in flight at once to pass the barrier
+        fake_tools = self._patch_tools(monkeypatch, asyncio.Barrier(4))
+
+        result = await asyncio.wait_for(
+            run_assessment_suite.ainvoke(
+                {"targets": ["https://example.com/a?q=1", "http://example.org/"]},
+                config={"configurable": {"thread_id": "scan-123"}},
+            ),
+            timeout=10,
+        )
+
+        data = json.loads(result)
+        assert data["success"] is True
+        assert len(data["results"]["nuclei"]) == 1
+        assert len(data["results"]["xsstrike"]) == 2
+        assert [r["args"] for r in data["results"]["testssl"]] == [{"target": "example.com"}]
+        fake_tools["run_sqlmap"].ainvoke.assert_not_called()
+
+    async def test_suite_reports_failed_scanner(self, monkeypatch):
+        """Test one scanner failing does not cancel the others."""
+        fake_tools = self._patch_tools(monkeypatch)
+        fake_tools["run_nuclei"].ainvoke.side_effect = RuntimeError("sandbox died")
+
+        result = await run_assessment_suite.ainvoke(
+            {"targets": ["http://example.com/"]},
+            config={"configurable": {"thread_id": "scan-123"}},
+        )
+
+        data = json.loads(result)
+        assert data["results"]["nuclei"] == [{"success": False, "error": "sandbox died"}]
+        assert data["results"]["xsstrike"][0]["success"] is True
+
+    @staticmethod
+    def _patch_agents(monkeypatch):
+        """Patch the scanner agents with fakes that stage one file per run."""
+        backend = Mock()
+        backend.write_batch.return_value = []
+        monkeypatch.setattr(assessment_tools, "_get_thread_backend", lambda thread_id: backend)
+
+        def fake_agent(class_name, name, result):
+            def create(**kwargs):
+                # A fresh agent per run, as the tools create one per call
+                def execute(*args, defer_write=False, **kwargs):
+                    assert defer_write is True
+                    target = kwargs.get("target_url") or kwargs.get("target") or "all"
+                    agent.pending_writes = {f"/assessment/{name}/findings.json": target}
+                    return result
+
+                agent = Mock()
+                agent.execute.side_effect = execute
+                return agent
+
+            monkeypatch.setattr(assessment_tools, class_name, Mock(side_effect=create))
+
+        fake_agent("NucleiAgent", "nuclei", [])
+        fake_agent("XSStrikeAgent", "xsstrike", [])
+        fake_agent("TestsslAgent", "testssl", TLSFinding(target="example.com:443"))
+        return backend
+
+    async def test_suite_batches_result_writes(self, monkeypatch):
+        """Test the scanners' result files are stored in a single batch."""
+        backend = self._patch_agents(monkeypatch)
+
+        result = await run_assessment_suite.ainvoke({"targets": ["https://example.com/"]}, config=CONFIG)
+
+        xsstrike_path = assessment_tools._per_target_path(
+            "/assessment/xsstrike/findings.json", "https://example.com/"
+        )
+        testssl_path = assessment_tools._per_target_path(
+            "/assessment/testssl/findings.json", "example.com"
+        )
+        backend.write_batch.assert_called_once()
+        assert backend.write_batch.call_args.args[0] == {
+            "/assessment/nuclei/findings.json": "all",
+            xsstrike_path: "https://example.com/",
+            testssl_path: "example.com",
+        }
+        # Results point at where their files were actually stored
+        data = json.loads(result)["results"]
+        assert data["xsstrike"][0]["storage_path"] == xsstrike_path
+        assert data["testssl"][0]["storage_path"] == testssl_path
+
+    async def test_suite_keeps_every_run_results(self, monkeypatch):
+        """Test per-URL and per-host runs don't overwrite each other's files."""
+        backend = self._patch_agents(monkeypatch)
+        targets = [
+            "https://example.com/a?q=1",
+            "https://example.com/a?q=2",
+            "https://example.org/",
+            "http://example.net/",
+        ]
+
+        await run_assessment_suite.ainvoke({"targets": targets}, config=CONFIG)
+
+        writes = backend.write_batch.call_args.args[0]
+        assert sorted(
+            content for path, content in writes.items() if path.startswith("/assessment/xsstrike/")
+        ) == sorted(targets)
+        assert sorted(
+            content for path, content in writes.items() if path.startswith("/assessment/testssl/")
+        ) == ["example.com", "example.org"]
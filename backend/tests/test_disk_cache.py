@@ -0,0 +1,79 @@
+"""
+Unit tests for the Nexus GCS disk cache.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.storage.disk_cache import DiskCachedGCSConnectorBackend, DiskContentCache
+
+
+class TestDiskContentCache:
+    """Test the LRU disk cache."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test stored content is returned and misses return None."""
+        cache = DiskContentCache(tmp_path, max_bytes=1024)
+        key = cache.key("/team/scan/findings.json", "abc")
+
+        cache.put(key, b"content")
+
+        assert cache.get(key) == b"content"
+        assert cache.get(cache.key("/team/scan/findings.json", "def")) is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test entries are evicted least recently used first when over budget."""
+        cache = DiskContentCache(tmp_path, max_bytes=10)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        cache.get("a")
+
+        cache.put("c", b"cccc")
+
+        assert cache.get("a") == b"aaaa"
+        assert cache.get("b") is None
+        assert not (tmp_path / "b").exists()
+
+    def test_survives_restart(self, tmp_path):
+        """Test a new cache instance picks up existing entries."""
+        DiskContentCache(tmp_path, max_bytes=1024).put("a", b"aaaa")
+
+        assert DiskContentCache(tmp_path, max_bytes=1024).get("a") == b"aaaa"
+
+
+class TestDiskCachedGCSConnectorBackend:
+    """Test GCS reads are served from the disk cache."""
+
+    def _backend(self, tmp_path):
+        """Create a backend without connecting to GCS."""
+        backend = DiskCachedGCSConnectorBackend.__new__(DiskCachedGCSConnectorBackend)
+        backend.disk_cache = DiskContentCache(tmp_path, max_bytes=1024)
+        return backend
+
+    def test_repeated_read_hits_cache(self, tmp_path):
+        """Test only the first read of a file version goes to GCS."""
+        backend = self._backend(tmp_path)
+        context = SimpleNamespace(backend_path="/team/scan/findings.json")
+
+        with patch(
+            "nexus.backends.gcs_connector.GCSConnectorBackend.read_content", return_value=b"v1"
+        ) as gcs_read:
+            assert backend.read_content("hash-1", context) == b"v1"
+            assert backend.read_content("hash-1", context) == b"v1"
+
+        gcs_read.assert_called_once()
+
+    def test_write_populates_cache(self, tmp_path):
+        """Test content written through the backend is read back without GCS."""
+        backend = self._backend(tmp_path)
+        context = SimpleNamespace(backend_path="/team/scan/findings.json")
+
+        with patch(
+            "nexus.backends.gcs_connector.GCSConnectorBackend.write_content", return_value="hash-2"
+        ), patch(
+            "nexus.backends.gcs_connector.GCSConnectorBackend.read_content"
+        ) as gcs_read:
+            backend.write_content(b"v2", context)
+            assert backend.read_content("hash-2", context) == b"v2"
+
+        gcs_read.assert_not_called()
@@ -10,6 +10,7 @@ Run:
 
 import pytest
 import json
+import time
 from unittest.mock import Mock, AsyncMock, MagicMock
 
 from src.agents.recon.httpx_agent import HTTPxAgent, HTTPxError
@@ -409,6 +410,188 @@ class TestResourceManagement:
         assert agent.sandbox is not None
 
 
+class TestShardedExecution:
+    """Test concurrent HTTPx runs over target chunks."""
+
+    async def test_execute_sharded_merges_chunks(self, agent, mock_sandbox, mock_backend):
+        """Test each chunk gets its own target file and results merge in order."""
+        def run(command, timeout):
+            path = command.split("-l ")[1].split()[0]
+            index = int(path.rsplit("_", 1)[1].split(".")[0])
+            # Only some runs end their output with a newline
+            newline = "\n" if index % 2 else ""
+            return Mock(stdout=json.dumps({"url": f"https://host{index}.example.com"}) + newline, stderr="")
+
+        mock_sandbox.commands.run.side_effect = run
+        targets = [f"host{i}.example.com" for i in range(5)]
+
+        live_hosts = await agent.execute_sharded(targets, chunk_size=2, max_concurrent_chunks=2)
+
+        assert [h["url"] for h in live_hosts] == [f"https://host{i}.example.com" for i in range(3)]
+        written = {c[0][0]: c[0][1] for c in mock_sandbox.files.write.call_args_list}
+        assert written == {
+            "/tmp/httpx_targets_0.txt": "host0.example.com\nhost1.example.com",
+            "/tmp/httpx_targets_1.txt": "host2.example.com\nhost3.example.com",
+            "/tmp/httpx_targets_2.txt": "host4.example.com",
+        }
+        # Results are stored once, for all targets
+        stored = json.loads(mock_backend.write.call_args_list[0][0][1])
+        assert stored["targets_count"] == 5
+        assert stored["live_hosts_count"] == 3
+        raw_output = mock_backend.write.call_args_list[1][0][1]
+        assert [json.loads(line)["url"] for line in raw_output.splitlines()] == [
+            f"https://host{i}.example.com" for i in range(3)
+        ]
+
+    async def test_execute_sharded_chunk_failure(self, agent, mock_sandbox):
+        """Test a failing chunk surfaces as HTTPxError with its message."""
+        mock_sandbox.commands.run.side_effect = TimeoutError()
+
+        with pytest.raises(HTTPxError, match="timed out after 300s"):
+            await agent.execute_sharded(["www.example.com"])
+
+    async def test_execute_sharded_timeout_covers_all_chunks(self, agent, mock_sandbox):
+        """Test timeout bounds the whole run, not each chunk."""
+        def run(command, timeout):
+            time.sleep(0.4)
+            return Mock(stdout="", stderr="")
+
+        mock_sandbox.commands.run.side_effect = run
+        targets = [f"host{i}.example.com" for i in range(4)]
+
+        # Four serial chunks of 0.4s each would fit a 1s per-chunk timeout
+        with pytest.raises(HTTPxError, match="timed out after 1s"):
+            await agent.execute_sharded(targets, timeout=1, chunk_size=1, max_concurrent_chunks=1)
+
+
+class TestInProcessProbe:
+    """Test the in-process probe path (no sandbox, no tech detection)."""
+
+    @pytest.fixture
+    def http_server(self):
+        """Serve a fixed HTML page on localhost."""
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = b"<html><head><title> Example </title></head></html>"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def version_string(self):
+                return "test-server"
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_port}"
+        server.shutdown()
+
+    async def test_probe_targets(self, http_server):
+        """Test live hosts are reported in the HTTPx binary's record shape."""
+        from src.agents.recon.http_probe import probe_targets
+
+        # Port 1 is closed, so that target is dropped
+        live_hosts = await probe_targets(
+            [http_server, "http://127.0.0.1:1"], threads=2, allow_private=True
+        )
+
+        assert len(live_hosts) == 1
+        host = live_hosts[0]
+        assert host["url"] == http_server
+        assert host["host"] == "127.0.0.1"
+        assert host["status_code"] == 200
+        assert host["title"] == "Example"
+        assert host["web_server"] == "test-server"
+        assert host["technologies"] == []
+        assert host["scheme"] == "http"
+
+    async def test_probe_targets_refuses_internal_addresses(self, http_server):
+        """Test loopback, private and link-local targets are never requested."""
+        from src.agents.recon.http_probe import probe_targets
+
+        port = http_server.rsplit(":", 1)[1]
+        targets = [
+            http_server,
+            f"http://localhost:{port}",
+            "http://10.0.0.1",
+            "http://169.254.169.254/latest/meta-data/",
+        ]
+
+        assert await probe_targets(targets, threads=4) == []
+
+    async def test_transport_refuses_internal_addresses(self, http_server):
+        """Test the transport every request goes through (redirects included) blocks loopback."""
+        import httpx
+
+        from src.agents.recon.http_probe import _PublicAddressTransport
+
+        async with httpx.AsyncClient(transport=_PublicAddressTransport()) as client:
+            with pytest.raises(httpx.RequestError, match="non-public"):
+                await client.get(http_server)
+
+    async def test_transport_connects_to_the_vetted_address(self, monkeypatch):
+        """Test a name that re-resolves to loopback (DNS rebinding) is never re-resolved."""
+        import socket
+
+        import httpx
+
+        from src.agents.recon import http_probe
+
+        answers = iter(["93.184.216.34", "127.0.0.1"])
+
+        def getaddrinfo(host, port, *args, **kwargs):
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (next(answers), port))]
+
+        sent = []
+
+        async def handle_async_request(self, request):
+            sent.append(request)
+            return httpx.Response(200, request=request)
+
+        monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+        monkeypatch.setattr(httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request)
+
+        async with httpx.AsyncClient(transport=http_probe._PublicAddressTransport()) as client:
+            await client.get("https://rebind.example.com/path")
+
+        assert len(sent) == 1
+        assert sent[0].url == "https://93.184.216.34/path"
+        assert sent[0].headers["host"] == "rebind.example.com"
+        assert sent[0].extensions["sni_hostname"] == "rebind.example.com"
+        # The second (internal) answer was never asked for
+        assert next(answers) == "127.0.0.1"
+
+    async def test_probe_stores_results_without_sandbox(self, mock_backend, monkeypatch):
+        """Test probe() never creates a sandbox and stores like execute()."""
+        import src.agents.recon.httpx_agent as httpx_agent
+
+        create = Mock()
+        monkeypatch.setattr(httpx_agent.Sandbox, "create", create)
+        live_hosts = [{"url": "https://www.example.com", "status_code": 200}]
+        monkeypatch.setattr(httpx_agent, "probe_targets", AsyncMock(return_value=live_hosts))
+
+        agent = HTTPxAgent(scan_id="test-scan", team_id="test-team", nexus_backend=mock_backend)
+        result = await agent.probe(["www.example.com"])
+        agent.cleanup()
+
+        assert result == live_hosts
+        create.assert_not_called()
+        stored = json.loads(mock_backend.write.call_args_list[0][0][1])
+        assert stored["live_hosts"] == live_hosts
+
+    async def test_probe_invalid_target(self, agent):
+        """Test probe() validates targets like execute()."""
+        with pytest.raises(HTTPxError, match="Invalid target"):
+            await agent.probe(["not a domain"])
+
+
 class TestOutputFormat:
     """Test output data format and structure."""
 
@@ -0,0 +1,65 @@
+"""
+Unit tests for the NexusFS factory.
+
+Uses the local backend with a throwaway metadata DB.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import pool, text
+
+from src.config import nexus_config
+
+
+@pytest.fixture
+def local_nexus(monkeypatch, tmp_path):
+    """Point the factory at a temporary local store."""
+    monkeypatch.setenv("NEXUS_BACKEND", "local")
+    monkeypatch.setenv("NEXUS_LOCAL_PATH", str(tmp_path / "data"))
+    monkeypatch.setenv("NEXUS_DB_PATH", str(tmp_path / "metadata.db"))
+    monkeypatch.setenv("NEXUS_DB_POOL_SIZE", "2")
+    monkeypatch.setenv("NEXUS_DB_MAX_OVERFLOW", "4")
+    nexus_config.close_nexus_fs()
+    yield
+    nexus_config.close_nexus_fs()
+
+
+def test_nexus_fs_is_shared(local_nexus):
+    """Test callers get one instance until it's closed."""
+    nx = nexus_config.get_nexus_fs()
+    assert nexus_config.get_nexus_fs() is nx
+
+    nexus_config.close_nexus_fs()
+    assert nexus_config.get_nexus_fs() is not nx
+
+
+def test_sqlite_metadata_connections_pooled(local_nexus):
+    """Test metadata connections are reused and get the pragmas."""
+    nx = nexus_config.get_nexus_fs()
+    engine = nx.metadata.engine
+
+    nx.write("/team/scan/result.json", b"{}")
+    assert nx.read("/team/scan/result.json") == b"{}"
+
+    assert isinstance(engine.pool, pool.QueuePool)
+    assert engine.pool.size() == 2
+    assert engine.pool.checkedin() >= 1
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -65536
+
+
+def test_bounded_pool_handles_concurrent_writes(local_nexus):
+    """Test nested checkouts under concurrent writes fit in the overflow."""
+    nx = nexus_config.get_nexus_fs()
+
+    def write_and_read(i):
+        for j in range(5):
+            nx.write(f"/team/scan-{i}/{j}.json", b"{}")
+            assert nx.read(f"/team/scan-{i}/{j}.json") == b"{}"
+
+    with ThreadPoolExecutor(4) as pool_executor:
+        list(pool_executor.map(write_and_read, range(4)))
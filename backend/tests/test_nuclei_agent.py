@@ -163,6 +163,24 @@ class TestNucleiAgentExecution:
                      if 'findings.json' in str(call)]
         assert len(json_calls) >= 1
 
+    def test_execute_defer_write(self, agent, mock_sandbox, mock_backend, sample_nuclei_jsonl):
+        """Test deferred results are kept on the agent instead of written."""
+        # Arrange
+        mock_update = Mock(exit_code=0, stdout="", stderr="")
+        mock_scan = Mock(exit_code=0, stdout=sample_nuclei_jsonl, stderr="")
+        mock_sandbox.commands.run.side_effect = [mock_update, mock_scan]
+
+        # Act
+        agent.execute(targets=["https://example.com"], defer_write=True)
+
+        # Assert
+        mock_backend.write.assert_not_called()
+        assert set(agent.pending_writes) == {
+            "/assessment/nuclei/findings.json",
+            "/assessment/nuclei/raw_output.jsonl",
+        }
+        assert agent.pending_writes["/assessment/nuclei/raw_output.jsonl"] == sample_nuclei_jsonl
+
 
 class TestNucleiAgentValidation:
     """Test input validation."""
@@ -0,0 +1,110 @@
+"""
+Unit tests for the Redis-backed rate limit dependency.
+
+Redis is replaced with a small in-memory stand-in for the pipeline calls the
+limiter makes; the fail-open test uses a real client with nothing listening.
+"""
+
+import time
+from collections import Counter
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from src.security import rate_limit
+from src.security.rate_limit import RateLimit
+
+
+class FakePipeline:
+    """Records INCR/EXPIRE calls against a shared counter."""
+
+    def __init__(self, counts: Counter, expiries: dict):
+        self.counts = counts
+        self.expiries = expiries
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def incr(self, key):
+        self.commands.append(("incr", key))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+
+    async def execute(self):
+        results = []
+        for command, key, *args in self.commands:
+            if command == "incr":
+                self.counts[key] += 1
+                results.append(self.counts[key])
+            else:
+                self.expiries[key] = args[0]
+                results.append(True)
+        return results
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for RateLimit."""
+
+    def __init__(self):
+        self.counts = Counter()
+        self.expiries = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self.counts, self.expiries)
+
+
+def make_request(host: str = "203.0.113.7") -> Request:
+    """Build a bare request from a given client address."""
+    return Request({"type": "http", "method": "POST", "path": "/", "headers": [], "client": (host, 1234)})
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Route the limiter to an in-memory Redis."""
+    redis = FakeRedis()
+    monkeypatch.setattr(rate_limit, "get_redis", lambda: redis)
+    return redis
+
+
+async def test_rejects_requests_over_the_limit(fake_redis):
+    """Test the limit is enforced per client and bucket."""
+    limit = RateLimit("login", 2)
+
+    await limit(make_request())
+    await limit(make_request())
+    with pytest.raises(HTTPException) as exc_info:
+        await limit(make_request())
+
+    assert exc_info.value.status_code == 429
+    assert 0 < int(exc_info.value.headers["Retry-After"]) <= rate_limit.WINDOW_SECONDS
+
+    # Other clients and other buckets have their own counters
+    await limit(make_request("198.51.100.1"))
+    await RateLimit("register", 2)(make_request())
+
+
+async def test_counters_expire_with_the_window(fake_redis):
+    """Test every counter key gets a TTL."""
+    await RateLimit("login", 10)(make_request())
+
+    (key,) = fake_redis.counts
+    assert key.startswith("ratelimit:login:203.0.113.7:")
+    assert fake_redis.expiries == {key: rate_limit.WINDOW_SECONDS}
+
+
+async def test_fails_open_when_redis_is_unavailable(monkeypatch):
+    """Test requests are let through (quickly) if Redis can't be reached."""
+    monkeypatch.setattr(rate_limit.settings, "redis_url", "redis://127.0.0.1:1/0")
+    rate_limit.get_redis.cache_clear()
+
+    start = time.monotonic()
+    await RateLimit("login", 0)(make_request())
+    assert time.monotonic() - start < 5 * rate_limit.REDIS_TIMEOUT_SECONDS
+
+    await rate_limit.close_redis()
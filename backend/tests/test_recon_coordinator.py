@@ -0,0 +1,425 @@
+"""
+Unit tests for the Recon Coordinator pipeline.
+
+These tests use mocked recon tools to avoid E2B sandbox and LLM dependencies.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, Mock
+
+import deepagents
+import pytest
+
+# recon_coordinator uses src-relative imports (same as langgraph_graph.py)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import agents.recon_coordinator as recon_coordinator  # noqa: E402
+from agents.recon_coordinator import (  # noqa: E402
+    build_recon_report,
+    create_recon_pipeline,
+)
+
+
+def _fake_tool(payload, barrier=None):
+    """Create a fake recon tool returning `payload` as JSON."""
+    async def ainvoke(args, config=None):
+        if barrier is not None:
+            await barrier.wait()
+        return json.dumps(payload)
+
+    tool = Mock()
+    tool.ainvoke = AsyncMock(side_effect=ainvoke)
+    return tool
+
+
+@pytest.fixture
+def mock_backend():
+    """Create a mock NexusBackend."""
+    backend = Mock()
+    backend.write = Mock(return_value=Mock(error=None))
+    backend.read = Mock(return_value="")
+    backend.edit = Mock(return_value=Mock(error=None))
+    return backend
+
+
+@pytest.fixture
+def fake_tools(monkeypatch, mock_backend):
+    """Patch the recon tools used by the pipeline with fakes."""
+    # wafw00f, ffuf and nmap must all be in flight at once to pass the barrier
+    barrier = asyncio.Barrier(3)
+    tools = {
+        "run_subfinder": _fake_tool({
+            "success": True,
+            "subdomains": ["www.example.com", "admin.example.com"],
+        }),
+        "run_httpx": _fake_tool({
+            "success": True,
+            "live_hosts": [{"url": "https://www.example.com"}],
+        }),
+        "run_wafw00f": _fake_tool({
+            "success": True,
+            "findings": [{"target": "https://www.example.com", "waf_detected": True, "waf_name": "Cloudflare"}],
+        }, barrier),
+        "run_ffuf": _fake_tool({
+            "success": True,
+            "count": 1,
+            "findings": [{"url": "https://www.example.com/admin", "path": "/admin", "status_code": 200}],
+            "findings_truncated": False,
+            "admin_paths": ["https://www.example.com/admin"],
+        }, barrier),
+        "run_nmap": _fake_tool({
+            "success": True,
+            "hosts": [{"hostnames": ["www.example.com"], "ports": [
+                {"port": 443, "service": "https"},
+                {"port": 3306, "service": "mysql"},
+            ]}],
+        }, barrier),
+    }
+    for name, tool in tools.items():
+        monkeypatch.setattr(recon_coordinator, name, tool)
+    monkeypatch.setattr(
+        recon_coordinator,
+        "_get_backend_from_config",
+        lambda config: ("scan-123", "team-abc", mock_backend),
+    )
+    return tools
+
+
+class TestReconPipeline:
+    """Test the deterministic recon pipeline graph."""
+
+    async def test_pipeline_fans_out_concurrently(self, fake_tools, mock_backend):
+        """Test wafw00f, ffuf and nmap run in parallel after httpx."""
+        pipeline = create_recon_pipeline()
+
+        state = await asyncio.wait_for(
+            pipeline.ainvoke(
+                {"domain": "example.com"},
+                config={"configurable": {"thread_id": "scan-123"}},
+            ),
+            timeout=10,
+        )
+
+        assert {r["tool"] for r in state["results"]} == {
+            "subfinder", "httpx", "wafw00f", "ffuf", "nmap",
+        }
+        fake_tools["run_nmap"].ainvoke.assert_awaited_once()
+        assert fake_tools["run_nmap"].ainvoke.call_args[0][0] == {"targets": ["www.example.com"]}
+
+        report = state["report"]
+        assert report["scan_id"] == "scan-123"
+        assert report["summary"]["live_hosts"] == 1
+        assert report["summary"]["total_open_ports"] == 2
+
+        mock_backend.write.assert_called_once()
+        assert mock_backend.write.call_args[0][0] == "/recon/final_report.json"
+        assert json.loads(mock_backend.write.call_args[0][1]) == report
+
+    async def test_pipeline_skips_fan_out_without_live_hosts(self, fake_tools):
+        """Test the pipeline goes straight to the report when nothing is live."""
+        fake_tools["run_httpx"].ainvoke.side_effect = None
+        fake_tools["run_httpx"].ainvoke.return_value = json.dumps(
+            {"success": True, "live_hosts": []}
+        )
+        pipeline = create_recon_pipeline()
+
+        state = await pipeline.ainvoke(
+            {"domain": "example.com"},
+            config={"configurable": {"thread_id": "scan-123"}},
+        )
+
+        fake_tools["run_wafw00f"].ainvoke.assert_not_called()
+        fake_tools["run_ffuf"].ainvoke.assert_not_called()
+        fake_tools["run_nmap"].ainvoke.assert_not_called()
+        assert state["report"]["summary"]["live_hosts"] == 0
+
+    async def test_pipeline_prioritizes_large_zones(self, fake_tools):
+        """Test httpx only probes the high-value subset of a large zone."""
+        subdomains = [f"host{i}.example.com" for i in range(200)] + ["admin.example.com"]
+        fake_tools["run_subfinder"].ainvoke.side_effect = None
+        fake_tools["run_subfinder"].ainvoke.return_value = json.dumps(
+            {"success": True, "subdomains": subdomains}
+        )
+        pipeline = create_recon_pipeline()
+
+        await pipeline.ainvoke(
+            {"domain": "example.com"},
+            config={"configurable": {"thread_id": "scan-123"}},
+        )
+
+        targets = fake_tools["run_httpx"].ainvoke.call_args[0][0]["targets"]
+        assert len(targets) == recon_coordinator.MAX_HTTPX_TARGETS
+        assert targets[0] == "admin.example.com"
+
+    async def test_pipeline_streams_results_before_report_write(self, fake_tools, mock_backend):
+        """Test tool results and the report are streamed, the report ahead of its write."""
+        events = []
+
+        def slow_write(path, content):
+            time.sleep(0.2)  # storage round-trip
+            events.append("write")
+            return Mock(error=None)
+
+        mock_backend.write.side_effect = slow_write
+        pipeline = create_recon_pipeline()
+
+        async for chunk in pipeline.astream(
+            {"domain": "example.com"},
+            config={"configurable": {"thread_id": "scan-123"}},
+            stream_mode="custom",
+        ):
+            events.append(chunk)
+
+        streamed_tools = {e["result"]["tool"] for e in events if "result" in e}
+        assert streamed_tools == {"subfinder", "httpx", "wafw00f", "ffuf", "nmap"}
+        report_index = next(i for i, e in enumerate(events) if "report" in e)
+        assert report_index < events.index("write")
+
+
+class TestBuildReconReport:
+    """Test report aggregation and risk rules."""
+
+    def test_risk_rules(self):
+        """Test database ports, admin paths, WAFs and admin subdomains are flagged."""
+        state = {
+            "domain": "example.com",
+            "subdomains": ["admin.example.com", "www.example.com"],
+            "live_hosts": [{"url": "https://www.example.com"}],
+            "results": [
+                {"tool": "nmap", "success": True, "hosts": [
+                    {"hostnames": ["db.example.com"], "ports": [{"port": 5432, "service": "postgresql"}]},
+                ]},
+                # A truncated run: the admin path didn't make the preview
+                {"tool": "ffuf", "success": True, "count": 120, "findings_truncated": True,
+                 "findings": [
+                    {"url": "https://www.example.com/img", "path": "/img", "status_code": 301},
+                 ],
+                 "admin_paths": ["https://www.example.com/admin"]},
+                {"tool": "wafw00f", "success": True, "findings": [
+                    {"target": "https://www.example.com", "waf_detected": True, "waf_name": "Cloudflare"},
+                ]},
+            ],
+        }
+
+        report = build_recon_report(state)
+
+        assert report["summary"]["hidden_paths_found"] == 120
+        assert any("5432" in f for f in report["high_risk_findings"])
+        assert any("/admin" in f for f in report["high_risk_findings"])
+        assert any("Cloudflare" in f for f in report["medium_risk_findings"])
+        assert any("admin.example.com" in f for f in report["medium_risk_findings"])
+
+    def test_failed_tools_reported_as_errors(self):
+        """Test failed tool results are surfaced instead of aggregated."""
+        state = {
+            "domain": "example.com",
+            "results": [{"tool": "nmap", "success": False, "error": "timed out"}],
+        }
+
+        report = build_recon_report(state)
+
+        assert report["summary"]["total_open_ports"] == 0
+        assert report["errors"] == [{"tool": "nmap", "error": "timed out"}]
+
+
+def _clear_model_caches():
+    """Reset the cached API keys and model pools."""
+    recon_coordinator._get_api_keys.cache_clear()
+    recon_coordinator._get_model_pool.cache_clear()
+    recon_coordinator._get_model_cycle.cache_clear()
+
+
+class TestSelectHighValueSubdomains:
+    """Test deterministic subdomain prioritization."""
+
+    def test_ranks_by_keyword_hits(self):
+        """Test keyword-rich names come first and ties keep discovery order."""
+        subdomains = [
+            "www.example.com",
+            "api.example.com",
+            "cdn.example.com",
+            "admin-db.example.com",
+            "vpn.example.com",
+        ]
+
+        selected = recon_coordinator._select_high_value_subdomains(subdomains, top_n=4)
+
+        assert selected == [
+            "admin-db.example.com",
+            "api.example.com",
+            "vpn.example.com",
+            "www.example.com",
+        ]
+
+    def test_accepts_iterators(self):
+        """Test selection works on a one-shot stream of names."""
+        names = (f"h{i}.example.com" for i in range(1000))
+
+        assert recon_coordinator._select_high_value_subdomains(names, top_n=2) == [
+            "h0.example.com",
+            "h1.example.com",
+        ]
+
+
+class TestModelClients:
+    """Test shared LLM client accessors."""
+
+    def test_models_are_cached(self, monkeypatch):
+        """Test each accessor builds its client only once."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+        _clear_model_caches()
+
+        assert recon_coordinator._get_mini_model() is recon_coordinator._get_mini_model()
+        assert recon_coordinator._get_sonnet_model() is recon_coordinator._get_sonnet_model()
+        assert recon_coordinator._get_mini_model() is not recon_coordinator._get_sonnet_model()
+
+    def test_models_share_http_clients(self, monkeypatch):
+        """Test both models use the shared, tuned HTTP clients."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+        _clear_model_caches()
+
+        http_client, http_async_client = recon_coordinator._get_http_clients()
+        for model in (recon_coordinator._get_mini_model(), recon_coordinator._get_sonnet_model()):
+            assert model.http_client is http_client
+            assert model.http_async_client is http_async_client
+
+    def test_async_client_pools_per_event_loop(self):
+        """Test each event loop gets its own connection pool on the shared client."""
+        _, http_async_client = recon_coordinator._get_http_clients()
+        transport = http_async_client._transport
+
+        async def pools():
+            return transport._get_transport(), transport._get_transport()
+
+        first, same = asyncio.run(pools())
+        second, _ = asyncio.run(pools())
+
+        assert first is same
+        assert second is not first
+
+    def test_models_share_rate_limiter(self, monkeypatch):
+        """Test both models draw from one process-wide rate limiter."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+        _clear_model_caches()
+
+        limiter = recon_coordinator._get_rate_limiter()
+        assert recon_coordinator._get_mini_model().rate_limiter is limiter
+        assert recon_coordinator._get_sonnet_model().rate_limiter is limiter
+
+    def test_models_rotate_over_api_keys(self, monkeypatch):
+        """Test OPENROUTER_API_KEYS spreads successive models over the keys."""
+        monkeypatch.setenv("OPENROUTER_API_KEYS", "key-a, key-b,")
+        _clear_model_caches()
+
+        try:
+            models = [recon_coordinator._get_mini_model() for _ in range(4)]
+        finally:
+            monkeypatch.delenv("OPENROUTER_API_KEYS")
+            _clear_model_caches()
+
+        keys = [m.openai_api_key.get_secret_value() for m in models]
+        assert keys == ["key-a", "key-b", "key-a", "key-b"]
+        assert models[0] is models[2]
+
+
+class TestGetTools:
+    """Test recon tool table."""
+
+    def test_tools_table_is_shared(self):
+        """Test _get_tools returns the same read-only table every call."""
+        tools = recon_coordinator._get_tools()
+
+        assert tools is recon_coordinator._get_tools()
+        assert set(tools) == {"subfinder", "httpx", "nmap", "ffuf", "wafw00f"}
+        with pytest.raises(TypeError):
+            tools["extra"] = None
+
+
+class TestCreateReconCoordinator:
+    """Test coordinator construction."""
+
+    def test_module_defers_heavy_imports(self):
+        """Test deepagents and langchain_openai are not bound at import time."""
+        assert not hasattr(recon_coordinator, "create_deep_agent")
+        assert not hasattr(recon_coordinator, "ChatOpenAI")
+
+    def test_coordinator_passes_shared_tools_unwrapped(self, monkeypatch):
+        """Test subagents receive the shared run_* tools rather than per-call wrappers."""
+        captured = {}
+        monkeypatch.setattr(
+            deepagents,
+            "create_deep_agent",
+            lambda **kwargs: captured.update(kwargs),
+        )
+
+        recon_coordinator.create_recon_coordinator(
+            "scan-123", "team-abc", None, model=Mock(), report_model=Mock()
+        )
+
+        shared = list(recon_coordinator._get_tools().values())
+        for sub_agent in captured["subagents"][:-1]:
+            assert all(any(t is s for s in shared) for t in sub_agent["tools"])
+
+    def test_coordinators_share_sub_agent_specs(self, monkeypatch):
+        """Test the tool sub-agent specs are built once and reused per coordinator."""
+        calls = []
+        monkeypatch.setattr(
+            deepagents,
+            "create_deep_agent",
+            lambda **kwargs: calls.append(kwargs),
+        )
+
+        for _ in range(2):
+            recon_coordinator.create_recon_coordinator(
+                "scan-123", "team-abc", None, model=Mock(), report_model=Mock()
+            )
+
+        first, second = (c["subagents"] for c in calls)
+        assert first is not second
+        assert all(a is b for a, b in zip(first[:-1], second[:-1], strict=True))
+        assert "model" not in recon_coordinator._REPORT_SUB_AGENT
+
+    def test_report_runs_on_report_model(self, monkeypatch):
+        """Test routing uses the router model and only the report uses report_model."""
+        captured = {}
+        monkeypatch.setattr(
+            deepagents,
+            "create_deep_agent",
+            lambda **kwargs: captured.update(kwargs),
+        )
+        router_model, report_model = Mock(), Mock()
+
+        recon_coordinator.create_recon_coordinator(
+            "scan-123", "team-abc", None, model=router_model, report_model=report_model
+        )
+
+        assert captured["model"] is router_model
+        report = captured["subagents"][-1]
+        assert report["name"] == "report"
+        assert report["model"] is report_model
+        assert all("model" not in s for s in captured["subagents"][:-1])
+
+    @pytest.mark.parametrize("factory, tool_name, prompt", [
+        ("create_subfinder_subagent", "subfinder", "_SUBFINDER_SYSTEM_PROMPT"),
+        ("create_httpx_subagent", "httpx", "_HTTPX_SYSTEM_PROMPT"),
+        ("create_nmap_subagent", "nmap", "_NMAP_SYSTEM_PROMPT"),
+    ])
+    def test_subagent_factories(self, monkeypatch, factory, tool_name, prompt):
+        """Test each standalone factory wires its own tool and prompt."""
+        captured = {}
+        monkeypatch.setattr(
+            deepagents,
+            "create_deep_agent",
+            lambda **kwargs: captured.update(kwargs),
+        )
+        model = Mock()
+
+        getattr(recon_coordinator, factory)(None, model=model)
+
+        assert captured["model"] is model
+        assert captured["system_prompt"] is getattr(recon_coordinator, prompt)
+        assert captured["tools"] == [recon_coordinator._get_tools()[tool_name]]
@@ -0,0 +1,170 @@
+"""
+Unit tests for the recon tools.
+
+These tests use mocked recon agents to avoid E2B sandbox dependencies.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import typing
+from dataclasses import asdict
+from unittest.mock import Mock
+
+import pytest
+from pydantic import ValidationError
+
+# recon_tools uses src-relative imports (same as recon_coordinator.py)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from agents.recon.ffuf_agent import FfufFinding  # noqa: E402
+from agents.recon.wafw00f_agent import WafFinding  # noqa: E402
+from agents.tools import recon_tools  # noqa: E402
+from agents.tools.recon_tools import (  # noqa: E402
+    run_ffuf,
+    run_nmap,
+    run_subfinder,
+    run_wafw00f,
+)
+
+CONFIG = {"configurable": {"thread_id": "scan-123"}}
+
+
+@pytest.fixture(autouse=True)
+def fake_backend(monkeypatch):
+    """Skip Nexus backend creation."""
+    monkeypatch.setattr(
+        recon_tools,
+        "_get_backend_from_config",
+        lambda config: ("scan-123", "default-team", Mock()),
+    )
+
+
+async def test_tools_run_agents_off_the_event_loop(monkeypatch):
+    """Test sandbox creation, execute and cleanup run in worker threads."""
+    loop_thread = threading.get_ident()
+    calls = []
+
+    def record(name, result=None):
+        def call(*args, **kwargs):
+            calls.append((name, threading.get_ident()))
+            return result
+        return call
+
+    agent = Mock()
+    agent.execute.side_effect = record("execute", ["www.example.com"])
+    agent.cleanup.side_effect = record("cleanup")
+
+    def create_agent(**kwargs):
+        record("create")()
+        return agent
+
+    monkeypatch.setattr(recon_tools, "SubfinderAgent", create_agent)
+
+    data = json.loads(await run_subfinder.ainvoke({"domain": "example.com"}, config=CONFIG))
+
+    assert data["success"] is True
+    assert data["subdomains"] == ["www.example.com"]
+    assert [name for name, _ in calls] == ["create", "execute", "cleanup"]
+    assert all(thread != loop_thread for _, thread in calls)
+
+
+async def test_tools_run_concurrently(monkeypatch):
+    """Test blocking scans don't serialize on the event loop."""
+    # Each execute() blocks until both are running; sequential calls would time out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def blocking(result):
+        def execute(**kwargs):
+            barrier.wait()
+            return result
+        return Mock(execute=Mock(side_effect=execute))
+
+    monkeypatch.setattr(recon_tools, "SubfinderAgent", Mock(return_value=blocking(["www.example.com"])))
+    monkeypatch.setattr(recon_tools, "NmapAgent", Mock(return_value=blocking({"hosts": []})))
+
+    results = await asyncio.gather(
+        run_subfinder.ainvoke({"domain": "example.com"}, config=CONFIG),
+        run_nmap.ainvoke({"targets": ["example.com"]}, config=CONFIG),
+    )
+
+    assert all(json.loads(result)["success"] for result in results)
+
+
+async def test_findings_serialize_like_asdict(monkeypatch):
+    """Test orjson output decodes to the same findings as dataclasses.asdict()."""
+    findings = [
+        WafFinding(target="https://example.com", waf_detected=True, waf_name="Cloudflare"),
+        WafFinding(target="https://test.com", waf_detected=False),
+    ]
+    agent = Mock()
+    agent.execute.return_value = findings
+    monkeypatch.setattr(recon_tools, "Wafw00fAgent", Mock(return_value=agent))
+
+    result = await run_wafw00f.ainvoke(
+        {"targets": ["https://example.com", "https://test.com"]}, config=CONFIG
+    )
+    data = json.loads(result)
+
+    assert data["findings"] == [asdict(f) for f in findings]
+    assert data["detected_wafs"] == {"Cloudflare": 1}
+    # Output stays indented for readability
+    assert result.startswith('{\n  "success": true')
+
+
+async def test_ffuf_returns_preview(monkeypatch):
+    """Test large ffuf runs return counts plus a 2xx-first preview."""
+    findings = [
+        FfufFinding(
+            url=f"https://example.com/p{i}",
+            path=f"/p{i}",
+            status_code=403 if i < 60 else 200,
+            content_length=0,
+        )
+        for i in range(70)
+    ]
+    agent = Mock()
+    agent.execute.return_value = findings
+    monkeypatch.setattr(recon_tools, "FfufAgent", Mock(return_value=agent))
+
+    data = json.loads(await run_ffuf.ainvoke({"target_url": "https://example.com"}, config=CONFIG))
+
+    assert data["count"] == 70
+    assert data["by_status_code"] == {"403": 60, "200": 10}
+    assert data["findings_truncated"] is True
+    assert len(data["findings"]) == recon_tools.FFUF_PREVIEW_LIMIT
+    # Accessible paths lead, then the rest in discovery order
+    assert [f["path"] for f in data["findings"][:11]] == [f"/p{i}" for i in range(60, 70)] + ["/p0"]
+
+
+async def test_ffuf_lists_admin_paths_outside_preview(monkeypatch):
+    """Test reachable admin paths are listed even when the preview drops them."""
+    findings = [
+        FfufFinding(url=f"https://example.com/p{i}", path=f"/p{i}", status_code=200, content_length=0)
+        for i in range(recon_tools.FFUF_PREVIEW_LIMIT)
+    ]
+    findings += [
+        FfufFinding(url="https://example.com/Admin", path="/Admin", status_code=200, content_length=0),
+        FfufFinding(url="https://example.com/admin-old", path="/admin-old", status_code=403, content_length=0),
+    ]
+    agent = Mock()
+    agent.execute.return_value = findings
+    monkeypatch.setattr(recon_tools, "FfufAgent", Mock(return_value=agent))
+
+    data = json.loads(await run_ffuf.ainvoke({"target_url": "https://example.com"}, config=CONFIG))
+
+    assert "/Admin" not in [f["path"] for f in data["findings"]]
+    assert data["admin_paths"] == ["https://example.com/Admin"]
+
+
+async def test_profile_and_wordlist_names_validated():
+    """Test unknown profile/wordlist names are rejected at argument parsing."""
+    assert set(typing.get_args(recon_tools.ProfileName)) == set(recon_tools._PROFILE_MAP)
+    assert set(typing.get_args(recon_tools.WordlistName)) == set(recon_tools._WORDLIST_MAP)
+
+    with pytest.raises(ValidationError):
+        await run_nmap.ainvoke({"targets": ["example.com"], "profile": "loud"}, config=CONFIG)
+    with pytest.raises(ValidationError):
+        await run_ffuf.ainvoke({"target_url": "https://example.com", "wordlist": "huge"}, config=CONFIG)
@@ -0,0 +1,78 @@
+"""
+Unit tests for the security dashboard response cache.
+
+Redis is replaced with an in-memory dict; the fail-open test uses a real
+client with nothing listening.
+"""
+
+import pytest
+
+from src.security import rate_limit, response_cache
+from src.security.response_cache import (
+    cache_dashboard,
+    dashboard_cache_key,
+    get_cached_dashboard,
+    invalidate_dashboard,
+)
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for the dashboard cache."""
+
+    def __init__(self):
+        self.values = {}
+        self.expiries = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+        self.expiries[key] = ex
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Route the cache to an in-memory Redis."""
+    redis = FakeRedis()
+    monkeypatch.setattr(response_cache, "get_redis", lambda: redis)
+    return redis
+
+
+async def test_entries_scoped_by_team_and_superuser(fake_redis):
+    """Test one team's (or role's) dashboard is never served to another."""
+    await cache_dashboard(1, False, b'{"team": 1}')
+
+    assert await get_cached_dashboard(1, False) == b'{"team": 1}'
+    assert await get_cached_dashboard(1, True) is None
+    assert await get_cached_dashboard(2, False) is None
+    assert fake_redis.expiries == {
+        dashboard_cache_key(1, False): response_cache.DASHBOARD_TTL_SECONDS
+    }
+
+
+async def test_invalidate_drops_only_that_team(fake_redis):
+    """Test a new attempt clears both of the team's entries and no others."""
+    for team_id in (1, 2):
+        for is_superuser in (False, True):
+            await cache_dashboard(team_id, is_superuser, b"{}")
+
+    await invalidate_dashboard(1)
+
+    assert set(fake_redis.values) == {dashboard_cache_key(2, False), dashboard_cache_key(2, True)}
+
+
+async def test_fails_open_when_redis_is_unavailable(monkeypatch):
+    """Test a missing Redis means cache misses, not errors."""
+    monkeypatch.setattr(rate_limit.settings, "redis_url", "redis://127.0.0.1:1/0")
+    rate_limit.get_redis.cache_clear()
+
+    await cache_dashboard(1, False, b"{}")
+    assert await get_cached_dashboard(1, False) is None
+    await invalidate_dashboard(1)
+
+    await rate_limit.close_redis()
@@ -0,0 +1,67 @@
+"""
+Unit tests for the specialized finding dumpers.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from src.agents.assessment.nuclei_agent import NucleiFinding
+from src.agents.assessment.serialization import build_dumper, dump_models, get_dumper
+from src.agents.assessment.sqlmap_agent import SQLMapFinding
+from src.agents.assessment.testssl_agent import CertificateInfo, TLSFinding, TLSVulnerability
+from src.agents.assessment.xsstrike_agent import XSSFinding
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        NucleiFinding(
+            template_id="cve-2021-1234",
+            template_name="Test",
+            severity="high",
+            host="https://example.com",
+            matched_at="https://example.com/",
+            tags=["cve"],
+            cvss_score=7.5,
+        ),
+        SQLMapFinding(
+            target_url="https://example.com/?id=1",
+            parameter="id",
+            injection_type="boolean-based blind",
+            tables={"app": ["users"]},
+            is_dba=False,
+        ),
+        XSSFinding(target_url="https://example.com/?q=1", vulnerable=True, xss_type="reflected"),
+        TLSVulnerability(id="heartbleed", name="Heartbleed", severity="critical", finding="vulnerable"),
+        CertificateInfo(subject="CN=example.com", san=["example.com"], is_expired=True),
+    ],
+)
+def test_dumper_matches_model_dump(model):
+    """Test generated dumpers produce the same dict as model_dump()."""
+    assert build_dumper(type(model))(model) == model.model_dump()
+
+
+def test_nested_model_falls_back_to_model_dump():
+    """Test models with nested BaseModel fields are not specialized."""
+    assert get_dumper(TLSFinding) is TLSFinding.model_dump
+
+
+def test_dump_models():
+    """Test a list of findings dumps with one cached dumper."""
+    findings = [
+        XSSFinding(target_url=f"https://example.com/?q={i}", vulnerable=False) for i in range(3)
+    ]
+
+    assert dump_models(findings) == [f.model_dump() for f in findings]
+    assert dump_models([]) == []
+    assert get_dumper(XSSFinding) is get_dumper(XSSFinding)
+
+
+@pytest.mark.parametrize("model_cls", [NucleiFinding, SQLMapFinding, TLSVulnerability])
+def test_finding_models_are_frozen(model_cls):
+    """Test flat findings are immutable, since dumpers share their containers."""
+    finding = model_cls.model_construct()
+    field = next(iter(model_cls.model_fields))
+
+    with pytest.raises(ValidationError):
+        setattr(finding, field, "changed")
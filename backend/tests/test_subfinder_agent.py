@@ -248,6 +248,12 @@ class TestDomainValidation:
         with pytest.raises(ValueError, match="Invalid domain format"):
             agent._validate_domain("example@domain.com")
 
+    def test_validate_invalid_domain_labels(self, agent):
+        """Test empty, hyphen-edged and newline-terminated labels are rejected."""
+        for domain in ["", "example..com", "-example.com", "example-.com", "example.com\n"]:
+            with pytest.raises(ValueError, match="Invalid domain format"):
+                agent._validate_domain(domain)
+
     def test_validate_domain_too_long(self, agent):
         """Test domain exceeding 253 character limit."""
         long_domain = "a" * 250 + ".com"
@@ -0,0 +1,81 @@
+"""
+Unit tests for the per-thread Nexus backend cache.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from unittest.mock import Mock
+
+import pytest
+
+# recon_tools imports via the src/ root
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from agents.tools import recon_tools
+from src.agents.backends import thread_backend
+from src.agents.tools import assessment_tools
+from src.config import nexus_config
+
+
+class TestBackendCache:
+    """Test per-thread backend reuse."""
+
+    @pytest.fixture(autouse=True)
+    def fake_nexus(self, monkeypatch):
+        """Patch NexusFS creation and backend construction."""
+        thread_backend.clear_backend_cache()
+        get_nexus_fs = Mock(side_effect=lambda: Mock())
+        # Cached like the real factory, so close_nexus_fs() runs unpatched
+        cached = lru_cache(maxsize=1)(get_nexus_fs)
+        monkeypatch.setattr(nexus_config, "get_nexus_fs", cached)
+        monkeypatch.setattr(thread_backend, "get_nexus_fs", cached)
+        monkeypatch.setattr(
+            thread_backend, "NexusBackend", lambda scan_id, team_id, fs: Mock(nx=fs)
+        )
+        yield get_nexus_fs
+        thread_backend.clear_backend_cache()
+
+    def test_backend_reused_per_thread(self, fake_nexus):
+        """Test repeated tool calls on a thread share one backend and NexusFS."""
+        config = {"configurable": {"thread_id": "scan-123"}}
+
+        scan_id, team_id, first = thread_backend.get_backend_from_config(config)
+        _, _, second = thread_backend.get_backend_from_config(config)
+        _, _, other = thread_backend.get_backend_from_config(
+            {"configurable": {"thread_id": "scan-456"}}
+        )
+
+        assert (scan_id, team_id) == ("scan-123", "default-team")
+        assert first is second
+        assert other is not first
+        assert other.nx is first.nx
+        fake_nexus.assert_called_once()
+
+    def test_clear_closes_shared_nexus_fs(self, fake_nexus):
+        """Test clearing the cache closes the NexusFS and the next call rebuilds it."""
+        config = {"configurable": {"thread_id": "scan-123"}}
+        _, _, first = thread_backend.get_backend_from_config(config)
+
+        thread_backend.clear_backend_cache()
+        _, _, second = thread_backend.get_backend_from_config(config)
+
+        first.nx.close.assert_called_once()
+        assert second is not first
+        assert fake_nexus.call_count == 2
+
+        # Nothing to close when no backend was ever created
+        thread_backend.clear_backend_cache()
+        thread_backend.clear_backend_cache()
+        second.nx.close.assert_called_once()
+
+    def test_tool_modules_share_cache(self):
+        """Test recon and assessment tools resolve backends through the same cache."""
+        assert recon_tools._get_backend_from_config is thread_backend.get_backend_from_config
+        assert assessment_tools._get_thread_backend is thread_backend.get_thread_backend
+
+    def test_thread_id_from_config(self):
+        """Test thread_id extraction tolerates a missing or empty configurable."""
+        assert thread_backend.thread_id_from_config({"configurable": {"thread_id": "t-1"}}) == "t-1"
+        assert thread_backend.thread_id_from_config({"configurable": None}) == "default-thread"
+        assert thread_backend.thread_id_from_config({}) == "default-thread"
@@ -7,6 +7,7 @@ For E2E integration tests, see tests/integration/test_wafw00f_e2e.py
 
 import pytest
 import json
+from dataclasses import asdict
 from unittest.mock import Mock, MagicMock, patch
 
 from src.agents.recon.wafw00f_agent import (
@@ -69,7 +70,7 @@ class TestWafFinding:
         assert finding.waf_name is None
         assert finding.confidence == "high"
 
-    def test_finding_model_dump(self):
+    def test_finding_asdict(self):
         """Test WafFinding serialization."""
         finding = WafFinding(
             target="https://example.com",
@@ -78,17 +79,23 @@ class TestWafFinding:
             confidence="medium",
         )
 
-        data = finding.model_dump()
+        data = asdict(finding)
         assert "target" in data
         assert "waf_detected" in data
         assert "waf_name" in data
         assert data["waf_name"] == "AWS WAF"
 
+    def test_finding_uses_slots(self):
+        """Test WafFinding has no per-instance __dict__."""
+        finding = WafFinding(target="https://example.com", waf_detected=False)
+
+        assert not hasattr(finding, "__dict__")
+
 
 class TestWafw00fAgentInit:
     """Test Wafw00fAgent initialization."""
 
-    @patch("src.agents.recon.wafw00f_agent.Sandbox")
+    @patch("e2b.Sandbox")
     def test_creates_sandbox_if_not_provided(self, mock_sandbox_class, mock_backend):
         """Test that agent creates its own sandbox if not provided."""
         mock_sandbox_instance = Mock()
@@ -149,6 +156,12 @@ class TestWafw00fAgentValidation:
         with pytest.raises(ValueError):
             agent._validate_url("ftp://example.com")  # Wrong scheme
 
+        with pytest.raises(ValueError):
+            agent._validate_url("https://-example.com")  # Bad host edge
+
+        with pytest.raises(ValueError):
+            agent._validate_url("https://example.com:80a")  # Non-numeric port
+
 
 class TestWafw00fAgentParsing:
     """Test wafw00f output parsing."""
@@ -228,6 +241,44 @@ https://test.com No WAF detected by the generic detection"""
         assert findings[0].waf_name == "Cloudflare"
         assert findings[1].waf_detected is False
 
+    def test_parse_matches_exact_leading_url(self, mock_backend, mock_sandbox):
+        """Test a target that prefixes another doesn't steal its result line."""
+        agent = Wafw00fAgent(
+            scan_id="test-scan",
+            team_id="test-team",
+            nexus_backend=mock_backend,
+            sandbox=mock_sandbox,
+        )
+
+        raw_output = "https://example.com.au is behind Cloudflare (Cloudflare Inc.)"
+        targets = ["https://example.com", "https://example.com.au"]
+
+        findings = agent._parse_output(raw_output, targets)
+
+        assert findings[0].waf_detected is False
+        assert findings[0].confidence == "unknown"
+        assert findings[1].waf_name == "Cloudflare"
+
+    def test_parse_keeps_first_conclusive_result(self, mock_backend, mock_sandbox):
+        """Test that lines after a target's verdict don't override it."""
+        agent = Wafw00fAgent(
+            scan_id="test-scan",
+            team_id="test-team",
+            nexus_backend=mock_backend,
+            sandbox=mock_sandbox,
+        )
+
+        raw_output = """Checking https://example.com
+https://example.com is behind Cloudflare (Cloudflare Inc.)
+https://example.com No WAF detected by the generic detection"""
+        targets = ["https://example.com"]
+
+        findings = agent._parse_output(raw_output, targets)
+
+        assert len(findings) == 1
+        assert findings[0].waf_detected is True
+        assert findings[0].waf_name == "Cloudflare"
+
     def test_parse_known_waf_normalization(self, mock_backend, mock_sandbox):
         """Test that known WAF names are normalized."""
         agent = Wafw00fAgent(
@@ -253,10 +304,7 @@ class TestWafw00fAgentExecution:
     def test_execute_success(self, mock_backend, mock_sandbox):
         """Test successful wafw00f execution."""
         # Setup mock sandbox responses
-        mock_sandbox.commands.run.side_effect = [
-            Mock(exit_code=0, stdout="/usr/bin/wafw00f"),  # which wafw00f
-            Mock(exit_code=0, stdout=""),  # wafw00f execution
-        ]
+        mock_sandbox.commands.run.return_value = Mock(exit_code=0, stdout="")
 
         mock_sandbox.files.write = Mock()
         mock_sandbox.files.read.return_value = "https://example.com is behind Cloudflare (Cloudflare Inc.)"
@@ -275,13 +323,32 @@ class TestWafw00fAgentExecution:
         assert findings[0].waf_name == "Cloudflare"
         mock_backend.write.assert_called()
 
+    def test_execute_uses_single_sandbox_command(self, mock_backend, mock_sandbox):
+        """Test that targets are piped to wafw00f in one sandbox round-trip."""
+        mock_sandbox.commands.run.return_value = Mock(exit_code=0, stdout="")
+
+        mock_sandbox.files.write = Mock()
+        mock_sandbox.files.read.return_value = "https://example.com No WAF detected"
+
+        agent = Wafw00fAgent(
+            scan_id="test-scan",
+            team_id="test-team",
+            nexus_backend=mock_backend,
+            sandbox=mock_sandbox,
+        )
+
+        agent.execute(["https://example.com", "https://test.com/a b"])
+
+        mock_sandbox.files.write.assert_not_called()
+        mock_sandbox.commands.run.assert_called_once()
+        command = mock_sandbox.commands.run.call_args[0][0]
+        assert "wafw00f -i /dev/stdin" in command
+        assert "https://example.com" in command
+        assert "'https://test.com/a b'" in command
+
     def test_execute_installs_wafw00f_if_missing(self, mock_backend, mock_sandbox):
-        """Test that wafw00f is installed if not present."""
-        mock_sandbox.commands.run.side_effect = [
-            Mock(exit_code=1, stdout=""),  # which wafw00f (not found)
-            Mock(exit_code=0, stdout=""),  # pip install
-            Mock(exit_code=0, stdout=""),  # wafw00f execution
-        ]
+        """Test that the command installs wafw00f if not present."""
+        mock_sandbox.commands.run.return_value = Mock(exit_code=0, stdout="")
 
         mock_sandbox.files.write = Mock()
         mock_sandbox.files.read.return_value = "https://example.com No WAF detected"
@@ -293,11 +360,29 @@ class TestWafw00fAgentExecution:
             sandbox=mock_sandbox,
         )
 
-        findings = agent.execute(["https://example.com"])
+        agent.execute(["https://example.com"])
+
+        command = mock_sandbox.commands.run.call_args[0][0]
+        assert "command -v wafw00f" in command
+        assert "pip install wafw00f" in command
+
+    def test_execute_install_failure(self, mock_backend, mock_sandbox):
+        """Test that a failed install surfaces as Wafw00fError."""
+        mock_sandbox.commands.run.return_value = Mock(
+            exit_code=Wafw00fAgent.INSTALL_FAILED_EXIT_CODE,
+            stdout="",
+            stderr="pip: command not found",
+        )
+
+        agent = Wafw00fAgent(
+            scan_id="test-scan",
+            team_id="test-team",
+            nexus_backend=mock_backend,
+            sandbox=mock_sandbox,
+        )
 
-        # Check that pip install was called
-        calls = mock_sandbox.commands.run.call_args_list
-        assert any("pip install wafw00f" in str(call) for call in calls)
+        with pytest.raises(Wafw00fError, match="Failed to install wafw00f"):
+            agent.execute(["https://example.com"])
 
 
 class TestWafw00fAgentCleanup:
@@ -305,7 +390,7 @@ class TestWafw00fAgentCleanup:
 
     def test_cleanup_kills_owned_sandbox(self, mock_backend):
         """Test cleanup kills sandbox when agent owns it."""
-        with patch("src.agents.recon.wafw00f_agent.Sandbox") as mock_sandbox_class:
+        with patch("e2b.Sandbox") as mock_sandbox_class:
             mock_sandbox_instance = Mock()
             mock_sandbox_class.create.return_value = mock_sandbox_instance
 